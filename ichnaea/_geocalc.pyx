@@ -4,16 +4,35 @@ Contains helper functions for various geo related calculations.
 These are implemented in Cython / C using NumPy.
 """
 
-from libc.math cimport asin, cos, fmin, M_PI, pow, sin, sqrt
-from numpy cimport double_t, ndarray
+cimport cython
+from libc.math cimport asin, cos, fmin, M_PI, NAN, pow, sin, sqrt
+from numpy cimport double_t, import_array, intp_t, ndarray
+import numpy
+
+import_array()
 
 cdef double EARTH_RADIUS = 6371.0  #: Earth radius in km.
 
 
-cdef inline double deg2rad(double degrees):
+cdef inline double deg2rad(double degrees) nogil:
     return degrees * M_PI / 180.0
 
 
+cdef inline double _distance(double lat1, double lon1,
+                             double lat2, double lon2) nogil:
+    cdef double a, c, dLat, dLon
+
+    dLat = deg2rad(lat2 - lat1) / 2.0
+    dLon = deg2rad(lon2 - lon1) / 2.0
+
+    lat1 = deg2rad(lat1)
+    lat2 = deg2rad(lat2)
+
+    a = pow(sin(dLat), 2) + cos(lat1) * cos(lat2) * pow(sin(dLon), 2)
+    c = asin(fmin(1, sqrt(a)))
+    return 1000 * 2 * EARTH_RADIUS * c
+
+
 cpdef ndarray[double_t, ndim=1] centroid(ndarray[double_t, ndim=2] points):
     """
     Compute the centroid (average lat and lon) from a set of points
@@ -45,17 +64,111 @@ cpdef double distance(double lat1, double lon1, double lat2, double lon2):
     could use the Vincenty formula for calculating geodesic distances
     on ellipsoids, which gives results accurate to within 1mm.
     """
-    cdef double a, c, dLat, dLon
+    return _distance(lat1, lon1, lat2, lon2)
 
-    dLat = deg2rad(lat2 - lat1) / 2.0
-    dLon = deg2rad(lon2 - lon1) / 2.0
 
-    lat1 = deg2rad(lat1)
-    lat2 = deg2rad(lat2)
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef ndarray[double_t, ndim=1] point_distances(
+        double lat, double lon, ndarray[double_t, ndim=2] points):
+    """
+    Compute the distances in meters from the given lat/lon point to
+    each of the provided points in the points array.
+    """
+    cdef Py_ssize_t i
+    cdef Py_ssize_t length = points.shape[0]
+    cdef ndarray[double_t, ndim=1] result = numpy.empty(
+        length, dtype=numpy.double)
 
-    a = pow(sin(dLat), 2) + cos(lat1) * cos(lat2) * pow(sin(dLon), 2)
-    c = asin(fmin(1, sqrt(a)))
-    return 1000 * 2 * EARTH_RADIUS * c
+    for i in range(length):
+        result[i] = _distance(lat, lon, points[i, 0], points[i, 1])
+    return result
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef ndarray[double_t, ndim=2] distance_matrix(
+        ndarray[double_t, ndim=2] points1,
+        ndarray[double_t, ndim=2] points2):
+    """
+    Compute the pairwise distances in meters between all points in
+    the first and all points in the second points array.
+    """
+    cdef Py_ssize_t i, j
+    cdef Py_ssize_t rows = points1.shape[0]
+    cdef Py_ssize_t cols = points2.shape[0]
+    cdef ndarray[double_t, ndim=2] result = numpy.empty(
+        (rows, cols), dtype=numpy.double)
+
+    for i in range(rows):
+        for j in range(cols):
+            result[i, j] = _distance(points1[i, 0], points1[i, 1],
+                                     points2[j, 0], points2[j, 1])
+    return result
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef ndarray[double_t, ndim=1] bbox_diagonals(
+        ndarray[double_t, ndim=2] boxes):
+    """
+    Compute the length of the diagonal in meters for each of the
+    bounding boxes in the boxes array. Each row contains the
+    min_lat, min_lon, max_lat, max_lon values of one bounding box.
+    """
+    cdef Py_ssize_t i
+    cdef Py_ssize_t length = boxes.shape[0]
+    cdef ndarray[double_t, ndim=1] result = numpy.empty(
+        length, dtype=numpy.double)
+
+    for i in range(length):
+        result[i] = _distance(boxes[i, 0], boxes[i, 1],
+                              boxes[i, 2], boxes[i, 3])
+    return result
+
+
+@cython.boundscheck(False)
+@cython.wraparound(False)
+cpdef ndarray[double_t, ndim=2] group_centroids(
+        ndarray[double_t, ndim=2] points,
+        ndarray[intp_t, ndim=1] offsets):
+    """
+    Compute the centroid (average lat and lon) for each group of
+    points inside the points array.
+
+    The offsets array contains one more entry than there are groups,
+    the points for group i are found in the rows from offsets[i]
+    up to but excluding offsets[i + 1]. The offsets need to be
+    ascending and within the points array. Empty groups result in
+    a NaN centroid.
+    """
+    cdef Py_ssize_t i, j, start, stop
+    cdef double lat, lon
+    cdef Py_ssize_t groups = max(offsets.shape[0] - 1, 0)
+    cdef ndarray[double_t, ndim=2] result = numpy.empty(
+        (groups, 2), dtype=numpy.double)
+
+    if groups and (offsets[0] < 0 or offsets[groups] > points.shape[0]):
+        raise ValueError('Offsets out of bounds.')
+    for i in range(groups):
+        if offsets[i] > offsets[i + 1]:
+            raise ValueError('Offsets not in ascending order.')
+
+    for i in range(groups):
+        start = offsets[i]
+        stop = offsets[i + 1]
+        if stop == start:
+            result[i, 0] = NAN
+            result[i, 1] = NAN
+            continue
+        lat = 0.0
+        lon = 0.0
+        for j in range(start, stop):
+            lat += points[j, 0]
+            lon += points[j, 1]
+        result[i, 0] = lat / (stop - start)
+        result[i, 1] = lon / (stop - start)
+    return result
 
 
 cpdef double latitude_add(double lat, double lon, double meters):
@@ -77,10 +190,24 @@ cpdef double longitude_add(double lat, double lon, double meters):
     return lon + (meters / (cos(lat) * 111111.0))
 
 
+@cython.boundscheck(False)
+@cython.wraparound(False)
 cpdef double max_distance(double lat, double lon,
-                          ndarray[double_t, ndim=2] points):
+                          ndarray[double_t, ndim=2] points) except? -1:
     """
     Returns the maximum distance from the given lat/lon point to any of
     the provided points in the points array.
     """
-    return max([distance(lat, lon, p[0], p[1]) for p in points])
+    cdef Py_ssize_t i
+    cdef Py_ssize_t length = points.shape[0]
+    cdef double dist, result
+
+    if length == 0:
+        raise ValueError('max_distance() arg is an empty array')
+
+    result = _distance(lat, lon, points[0, 0], points[0, 1])
+    for i in range(1, length):
+        dist = _distance(lat, lon, points[i, 0], points[i, 1])
+        if dist > result:
+            result = dist
+    return result
@@ -5,6 +5,7 @@ API related view configuration.
 
 def configure_api(config):
     """Configure API related views and set up routes."""
+    from ichnaea.api.locate.batch.views import LocateBatchView
     from ichnaea.api.locate.country.views import CountryView
     from ichnaea.api.locate.locate_v1.views import LocateV1View
     from ichnaea.api.locate.locate_v2.views import LocateV2View
@@ -13,6 +14,7 @@ def configure_api(config):
     from ichnaea.api.submit.submit_v3.views import SubmitV3View
 
     CountryView.configure(config)
+    LocateBatchView.configure(config)
     LocateV1View.configure(config)
     LocateV2View.configure(config)
     SubmitV1View.configure(config)
@@ -0,0 +1,117 @@
+"""
+Implementation of API key lookups, backed by an optional in-process cache.
+"""
+
+from collections import namedtuple
+
+from repoze.lru import ExpiringLRUCache
+
+from ichnaea.models.api import ApiKey
+
+_INVALID = object()
+
+
+class ApiKeySnapshot(namedtuple('ApiKeySnapshot',
+                                'valid_key maxreq log allow_fallback '
+                                'shortname')):
+    """
+    An immutable copy of the :class:`~ichnaea.models.api.ApiKey`
+    fields, which doesn't depend on any database session.
+    """
+
+    __slots__ = ()
+
+    @property
+    def name(self):
+        """A readable short name used in metrics."""
+        return self.shortname or self.valid_key
+
+    @classmethod
+    def from_model(cls, api_key):
+        """Create a snapshot of the passed in API key model."""
+        return cls(valid_key=api_key.valid_key,
+                   maxreq=api_key.maxreq,
+                   log=api_key.log,
+                   allow_fallback=api_key.allow_fallback,
+                   shortname=api_key.shortname)
+
+    @classmethod
+    def empty(cls, **kw):
+        """Create a snapshot standing in for a missing API key."""
+        values = dict([(field, None) for field in cls._fields])
+        values.update(kw)
+        return cls(**values)
+
+
+def configure_api_key_cache(settings, stats_client):
+    """
+    Configure and return a :class:`~ichnaea.api.key.ApiKeyCache`,
+    based on the `key_cache_size` and `key_cache_expire` settings.
+
+    If either setting is missing or zero, the returned cache is
+    disabled and looks up each API key in the database.
+    """
+    if not settings:
+        settings = {}
+    return ApiKeyCache(
+        stats_client,
+        size=int(settings.get('key_cache_size', 0)),
+        expire=int(settings.get('key_cache_expire', 0)))
+
+
+class ApiKeyCache(object):
+    """
+    An ApiKeyCache looks up API keys in the database and keeps a bounded
+    in-process mapping of API key strings to immutable
+    :class:`~ichnaea.api.key.ApiKeySnapshot` entries.
+
+    Unknown API keys are cached as well. Entries expire after a fixed
+    time, so changes to the API keys in the database are picked up by
+    all processes within this time.
+    """
+
+    def __init__(self, stats_client, size=1000, expire=60):
+        self.stats_client = stats_client
+        self._cache = None
+        if size and expire:
+            self._cache = ExpiringLRUCache(size, default_timeout=expire)
+
+    def _stat_count(self, status):
+        self.stats_client.incr('api.key.cache', tags=['status:' + status])
+
+    def _query(self, session, api_key_text):
+        api_key = session.query(ApiKey).get(api_key_text)
+        if api_key is None:
+            return None
+        return ApiKeySnapshot.from_model(api_key)
+
+    def get(self, session, api_key_text):
+        """
+        Look up the API key for the given string.
+
+        :param session: A database session, only used for cache misses.
+        :param api_key_text: The API key string passed in the request.
+
+        :returns: An :class:`~ichnaea.api.key.ApiKeySnapshot` or None
+                  for unknown API keys.
+        """
+        if self._cache is None:
+            return self._query(session, api_key_text)
+
+        result = self._cache.get(api_key_text)
+        if result is not None:
+            self._stat_count('hit')
+            if result is _INVALID:
+                return None
+            return result
+
+        self._stat_count('miss')
+        result = self._query(session, api_key_text)
+        self._cache.put(
+            api_key_text, _INVALID if result is None else result)
+        return result
+
+    def clear(self):
+        """Remove all cached entries."""
+        if self._cache is not None:
+            self._cache.clear()
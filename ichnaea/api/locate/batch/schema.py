@@ -0,0 +1,21 @@
+import colander
+
+from ichnaea.api.schema import (
+    InternalMappingSchema,
+    InternalSequenceSchema,
+)
+from ichnaea.api.locate.locate_v2.schema import LocateV2Schema
+
+#: Maximum number of queries in a single batch request.
+MAX_BATCH_QUERIES = 100
+
+
+class LocateBatchSchema(InternalMappingSchema):
+
+    @colander.instantiate(
+        missing=(), validator=colander.Length(max=MAX_BATCH_QUERIES))
+    class items(InternalSequenceSchema):  # NOQA
+        query = LocateV2Schema()
+
+
+LOCATE_BATCH_SCHEMA = LocateBatchSchema()
@@ -0,0 +1,96 @@
+import colander
+
+from ichnaea.api.exceptions import LocationNotFound
+from ichnaea.api.locate.batch.schema import (
+    LOCATE_BATCH_SCHEMA,
+    MAX_BATCH_QUERIES,
+)
+from ichnaea.api.locate.locate_v2.tests import LocateV2Base
+from ichnaea.models import ApiKey
+from ichnaea.tests.base import (
+    AppTestCase,
+    TestCase,
+)
+from ichnaea.tests.factories import (
+    CellFactory,
+    WifiShardFactory,
+)
+from ichnaea import util
+
+
+class TestSchema(TestCase):
+
+    schema = LOCATE_BATCH_SCHEMA
+
+    def test_empty(self):
+        data = self.schema.deserialize({})
+        self.assertEqual(data, {'items': ()})
+
+    def test_items(self):
+        data = self.schema.deserialize({'items': [{}, {
+            'radioType': 'gsm',
+            'cellTowers': [{'mobileCountryCode': 208}],
+        }]})
+        self.assertEqual(len(data['items']), 2)
+        self.assertEqual(data['items'][1]['cell'][0]['radio'], 'gsm')
+
+    def test_too_many_items(self):
+        with self.assertRaises(colander.Invalid):
+            self.schema.deserialize(
+                {'items': [{}] * (MAX_BATCH_QUERIES + 1)})
+
+
+class TestView(LocateV2Base, AppTestCase):
+
+    url = '/v1/geolocate/batch'
+    metric_path = 'path:v1.geolocate.batch'
+
+    def test_batch(self):
+        cell = CellFactory()
+        wifi = WifiShardFactory()
+        wifi2 = WifiShardFactory(lat=wifi.lat, lon=wifi.lon + 0.00001)
+        self.session.flush()
+
+        res = self._call(body={'items': [
+            self.model_query(wifis=[wifi, wifi2]),
+            self.model_query(cells=[CellFactory.build()]),
+            self.model_query(cells=[cell]),
+        ]})
+        self.assertEqual(res.content_type, 'application/json')
+        items = res.json['items']
+        self.assertEqual(len(items), 3)
+        self.assertAlmostEqual(items[0]['location']['lat'], wifi.lat)
+        self.assertAlmostEqual(
+            items[0]['location']['lng'], wifi.lon + 0.000005)
+        self.assertEqual(items[1], LocationNotFound.json_body())
+        self.assertAlmostEqual(items[2]['location']['lat'], cell.lat)
+        self.assertAlmostEqual(items[2]['location']['lng'], cell.lon)
+        self.assertAlmostEqual(items[2]['accuracy'], cell.range)
+        self.check_stats(counter=[
+            ('request', [self.metric_path, 'method:post', 'status:200']),
+            ('locate.request', [self.metric_path, 'key:test']),
+            ('locate.query', 3),
+        ])
+
+    def test_empty(self):
+        res = self._call(body={})
+        self.assertEqual(res.json, {'items': []})
+
+    def test_parse_error(self):
+        res = self._call(
+            body={'items': [{}] * (MAX_BATCH_QUERIES + 1)}, status=400)
+        self.check_response(res, 'parse_error')
+
+    def test_api_key_limit(self):
+        api_key = 'batch_limit_key'
+        self.session.add(ApiKey(valid_key=api_key, maxreq=5, shortname='dis'))
+        self.session.flush()
+
+        # each query in the batch counts towards the daily limit
+        res = self._call(body={'items': [{}] * 6}, api_key=api_key,
+                         ip=self.test_ip, status=403)
+        self.check_response(res, 'limit_exceeded')
+
+        dstamp = util.utcnow().strftime('%Y%m%d')
+        key = 'apilimit:%s:%s' % (api_key, dstamp)
+        self.assertEqual(int(self.redis_client.get(key)), 6)
@@ -0,0 +1,48 @@
+from ichnaea.api.exceptions import DailyLimitExceeded
+from ichnaea.api.locate.batch.schema import LOCATE_BATCH_SCHEMA
+from ichnaea.api.locate.locate_v2.views import LocateV2View
+
+
+class LocateBatchView(LocateV2View):
+    """
+    A batch variant of the geolocate API, answering a list of
+    geolocate queries in a single request.
+    """
+
+    metric_path = 'v1.geolocate.batch'  #:
+    route = '/v1/geolocate/batch'  #:
+    schema = LOCATE_BATCH_SCHEMA  #:
+
+    def check_batch_limit(self, api_key, count):
+        # The API key check already counted the request itself.
+        if count > 1 and self.rate_limiter.exceeded(
+                self.rate_limit_key(api_key.valid_key),
+                maxreq=api_key.maxreq,
+                count=count - 1,
+                batch=self.redis_batch):
+            raise DailyLimitExceeded()
+
+    def locate_batch(self, api_key):
+        request_data, errors = self.preprocess_request()
+        items = request_data.get('items', ())
+        self.check_batch_limit(api_key, len(items))
+
+        queries = [self.prepare_query(api_key, item) for item in items]
+        searcher = getattr(self.request.registry, self.searcher)
+        searcher.prefetch(queries)
+        return [searcher.search(query) for query in queries]
+
+    def view(self, api_key):
+        """
+        Execute the view code and return a response.
+
+        Each query in the batch gets its own entry in the list of
+        response items, either a position or a not found error.
+        """
+        items = []
+        for result in self.locate_batch(api_key):
+            if result:
+                items.append(self.prepare_response(result))
+            else:
+                items.append(self.not_found.json_body())
+        return {'items': items}
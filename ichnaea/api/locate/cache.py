@@ -0,0 +1,219 @@
+"""
+Caches for station positions used by the internal position sources.
+"""
+
+import struct
+
+from redis.exceptions import RedisError
+from repoze.lru import ExpiringLRUCache
+
+from ichnaea.cache import (
+    cache_station_positions,
+    redis_pipeline,
+    station_cache_key,
+    STATION_CACHE_INVALID,
+)
+from ichnaea.models.station import decode_station_position
+
+
+def configure_station_cache(settings, raven_client, redis_client,
+                            stats_client, station_type):
+    """
+    Configure and return a station cache for the given station type.
+
+    The in-process cache is configured via the `<station_type>_cache_size`
+    and `<station_type>_cache_expire` settings. The shared Redis cache
+    is enabled via the `<station_type>_shared_cache` setting. If both
+    are enabled, a :class:`~ichnaea.api.locate.cache.TieredCache`
+    combining the two is returned. If neither is enabled, a
+    :class:`~ichnaea.api.locate.cache.DisabledCache` is returned.
+    """
+    if not settings:
+        settings = {}
+    size = int(settings.get('%s_cache_size' % station_type, 0))
+    expire = int(settings.get('%s_cache_expire' % station_type, 0))
+    shared = int(settings.get('%s_shared_cache' % station_type, 0))
+
+    local_cache = None
+    if size and expire:
+        local_cache = StationCache(
+            stats_client, station_type, size=size, expire=expire)
+
+    shared_cache = None
+    if shared and redis_client is not None:
+        shared_cache = RedisStationCache(
+            raven_client, redis_client, stats_client, station_type)
+
+    if local_cache and shared_cache:
+        return TieredCache(local_cache, shared_cache)
+    return local_cache or shared_cache or DisabledCache()
+
+
+class StationCache(object):
+    """
+    A StationCache keeps a bounded in-process mapping of station keys
+    to :class:`~ichnaea.models.station.StationPosition` entries.
+
+    Entries expire after a fixed time and the least recently used
+    entries are evicted once the cache is full.
+    """
+
+    def __init__(self, stats_client, station_type, size=10000, expire=300):
+        self.stats_client = stats_client
+        self.station_type = station_type
+        self.expire = expire
+        self._cache = ExpiringLRUCache(size, default_timeout=expire)
+
+    def _stat_count(self, status, count):
+        if count > 0:
+            self.stats_client.incr(
+                'locate.%s.cache' % self.station_type, count,
+                tags=['status:' + status])
+
+    def get(self, keys):
+        """
+        Look up the cached entries for the given station keys.
+
+        :returns: A dictionary of station keys to cached entries,
+                  only containing the keys found in the cache.
+        """
+        found = {}
+        for key in keys:
+            value = self._cache.get(key)
+            if value is not None:
+                found[key] = value
+        self._stat_count('hit', len(found))
+        self._stat_count('miss', len(keys) - len(found))
+        return found
+
+    def set(self, values):
+        """
+        Cache the passed in dictionary of station keys to entries.
+        """
+        evictions = self._cache.evictions
+        for key, value in values.items():
+            self._cache.put(key, value)
+        self._stat_count('eviction', self._cache.evictions - evictions)
+
+
+class RedisStationCache(object):
+    """
+    A RedisStationCache keeps station positions as compact binary
+    records in Redis, shared between all web worker processes.
+
+    The data pipeline invalidates the cached entries whenever it
+    changes a station, so entries can be kept for a long time.
+    """
+
+    def __init__(self, raven_client, redis_client, stats_client,
+                 station_type):
+        self.raven_client = raven_client
+        self.redis_client = redis_client
+        self.stats_client = stats_client
+        self.station_type = station_type
+
+    def _stat_count(self, status, count=1):
+        if count > 0:
+            self.stats_client.incr(
+                'locate.%s.shared_cache' % self.station_type, count,
+                tags=['status:' + status])
+
+    def get(self, keys):
+        """
+        Look up the cached entries for the given station keys
+        using a single Redis round-trip.
+
+        :returns: A dictionary of station keys to cached entries,
+                  only containing the keys found in the cache.
+        """
+        keys = list(keys)
+        if not keys:
+            return {}
+
+        found = {}
+        try:
+            values = self.redis_client.mget(
+                [station_cache_key(self.station_type, key) for key in keys])
+            for key, value in zip(keys, values):
+                if value is not None and value != STATION_CACHE_INVALID:
+                    found[key] = decode_station_position(value)
+        except (struct.error, RedisError):
+            self.raven_client.captureException()
+            self._stat_count('failure')
+            return {}
+
+        self._stat_count('hit', len(found))
+        self._stat_count('miss', len(keys) - len(found))
+        return found
+
+    def set(self, values):
+        """
+        Cache the passed in dictionary of station keys to entries.
+
+        Entries already present in the cache are left alone, as are
+        entries recently invalidated by the data pipeline.
+        """
+        if not values:
+            return
+        try:
+            with redis_pipeline(self.redis_client) as pipe:
+                cache_station_positions(
+                    pipe, self.station_type, values, nx=True)
+        except RedisError:
+            self.raven_client.captureException()
+            self._stat_count('failure')
+
+
+class TieredCache(object):
+    """
+    A TieredCache combines a fast in-process cache with a slower
+    shared cache. Lookups missing the in-process cache are tried in
+    the shared cache and entries found there are kept in-process.
+    """
+
+    def __init__(self, local_cache, shared_cache):
+        self.local_cache = local_cache
+        self.shared_cache = shared_cache
+
+    def get(self, keys):
+        found = self.local_cache.get(keys)
+        missing = [key for key in keys if key not in found]
+        if missing:
+            shared = self.shared_cache.get(missing)
+            self.local_cache.set(shared)
+            found.update(shared)
+        return found
+
+    def set(self, values):
+        self.local_cache.set(values)
+        self.shared_cache.set(values)
+
+
+class BatchCache(object):
+    """
+    A BatchCache holds the station positions looked up in bulk for
+    all the queries of a single batch request.
+    """
+
+    def __init__(self):
+        self._positions = {}
+
+    def get(self, keys):
+        return dict([(key, self._positions[key])
+                     for key in keys if key in self._positions])
+
+    def set(self, values):
+        self._positions.update(values)
+
+
+class DisabledCache(object):
+    """
+    A DisabledCache implements a no-cache version of the
+    :class:`~ichnaea.api.locate.cache.StationCache`.
+    """
+
+    def get(self, keys):
+        return {}
+
+    def set(self, values):
+        pass
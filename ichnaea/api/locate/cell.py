@@ -1,11 +1,16 @@
 """Search implementation using a cell database."""
 
-from collections import defaultdict
+from collections import defaultdict, namedtuple
 import operator
 
 import numpy
 from sqlalchemy.orm import load_only
 
+from ichnaea.api.locate.cache import (
+    BatchCache,
+    configure_station_cache,
+    TieredCache,
+)
 from ichnaea.api.locate.constants import DataSource
 from ichnaea.api.locate.result import Position
 from ichnaea.api.locate.source import PositionSource
@@ -18,6 +23,13 @@ from ichnaea.models import (
     Cell,
     CellArea,
 )
+from ichnaea.models.station import (
+    StationPosition,
+    UNKNOWN_STATION,
+)
+
+CellStation = namedtuple('CellStation',
+                         'radio mcc mnc lac cid lat lon range')
 
 
 def pick_best_cells(cells, area_model):
@@ -65,30 +77,75 @@ def aggregate_area_position(area, result_type):
         lat=area.lat, lon=area.lon, accuracy=accuracy, fallback='lacf')
 
 
-def query_database(query, lookups, model, raven_client):
+def query_database(query, lookups, model, raven_client, cache=None):
     """
     Given a location query and a list of lookup instances, query the
     database and return a list of model objects.
+
+    If a station cache is passed in, the positions of the cells found
+    in it aren't queried from the database and the returned list
+    contains :class:`~ichnaea.api.locate.cell.CellStation` entries.
     """
-    hashkeys = [lookup.hashkey() for lookup in lookups]
+    hashkeys = []
+    for lookup in lookups:
+        hashkey = lookup.hashkey()
+        if hashkey not in hashkeys:
+            hashkeys.append(hashkey)
     if not hashkeys:  # pragma: no cover
         return []
 
+    if cache is not None:
+        return _query_cached(query, hashkeys, model, raven_client, cache)
+
     try:
-        load_fields = ('lat', 'lon', 'range')
-        model_iter = model.iterkeys(
-            query.session,
-            hashkeys,
-            extra=lambda query: query.options(load_only(*load_fields))
-                                     .filter(model.lat.isnot(None))
-                                     .filter(model.lon.isnot(None)))
-
-        return list(model_iter)
+        return list(_query_models(query, hashkeys, model))
     except Exception:
         raven_client.captureException()
     return []
 
 
+def _query_models(query, hashkeys, model):
+    load_fields = ('lat', 'lon', 'range')
+    return model.iterkeys(
+        query.session,
+        hashkeys,
+        extra=lambda query: query.options(load_only(*load_fields))
+                                 .filter(model.lat.isnot(None))
+                                 .filter(model.lon.isnot(None)))
+
+
+def _query_cached(query, hashkeys, model, raven_client, cache):
+    positions = {}
+    try:
+        positions.update(cache.get(hashkeys))
+
+        missing = [key for key in hashkeys if key not in positions]
+        new_positions = {}
+        if missing:
+            for row in _query_models(query, missing, model):
+                new_positions[row.hashkey()] = StationPosition(
+                    lat=row.lat, lon=row.lon,
+                    radius=row.range, blocked_until=None)
+            for key in missing:
+                if key not in new_positions:
+                    new_positions[key] = UNKNOWN_STATION
+
+        positions.update(new_positions)
+        cache.set(new_positions)
+    except Exception:
+        raven_client.captureException()
+
+    result = []
+    for key in hashkeys:
+        position = positions.get(key)
+        if position is not None and position.usable():
+            result.append(CellStation(
+                radio=key.radio, mcc=key.mcc, mnc=key.mnc,
+                lac=key.lac, cid=key.cid,
+                lat=position.lat, lon=position.lon, range=position.radius))
+    return result
+
+
 class CellPositionMixin(object):
     """
     A CellPositionMixin implements a position search using the cell models.
@@ -97,18 +154,54 @@ class CellPositionMixin(object):
     cell_model = Cell
     area_model = CellArea
     result_type = Position
+    station_cache_type = 'cell'
+    uses_database = True
+
+    def __init__(self, settings, *args, **kw):
+        super(CellPositionMixin, self).__init__(settings, *args, **kw)
+        self.cell_cache = None
+        if self.station_cache_type:
+            self.cell_cache = configure_station_cache(
+                settings, self.raven_client, self.redis_client,
+                self.stats_client, self.station_cache_type)
 
     def should_search_cell(self, query, results):
         if not (query.cell or query.cell_area):
             return False
         return True
 
+    def prefetch_cell(self, queries):
+        queries = [query for query in queries if query.cell]
+        if self.cell_cache is None or not queries:
+            return
+
+        hashkeys = []
+        seen = set()
+        for query in queries:
+            for lookup in query.cell:
+                hashkey = lookup.hashkey()
+                if hashkey not in seen:
+                    seen.add(hashkey)
+                    hashkeys.append(hashkey)
+
+        cache = TieredCache(BatchCache(), self.cell_cache)
+        # All queries of a batch share the same database session.
+        _query_cached(queries[0], hashkeys, self.cell_model,
+                      self.raven_client, cache)
+        for query in queries:
+            query.station_caches[self.station_cache_type] = cache
+
     def search_cell(self, query):
         result = self.result_type()
 
         if query.cell:
+            cache = self.cell_cache
+            if cache is not None:
+                cache = query.station_caches.get(
+                    self.station_cache_type, cache)
             cells = query_database(
-                query, query.cell, self.cell_model, self.raven_client)
+                query, query.cell, self.cell_model, self.raven_client,
+                cache=cache)
             if cells:
                 best_cells = pick_best_cells(cells, self.area_model)
                 result = aggregate_cell_position(best_cells, self.result_type)
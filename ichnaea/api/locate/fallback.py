@@ -3,12 +3,18 @@ Implementation of a fallback source using an external web service.
 """
 
 from collections import defaultdict, namedtuple
+import hashlib
+import struct
 import time
+from uuid import uuid4
 
 import colander
+import gevent
+from gevent.event import AsyncResult
 import numpy
 from requests.exceptions import RequestException
 from redis import RedisError
+from redis.exceptions import NoScriptError
 import simplejson
 
 from ichnaea.api.schema import (
@@ -21,8 +27,7 @@ from ichnaea.api.schema import (
 )
 from ichnaea.api.locate.constants import DataSource
 from ichnaea.api.locate.source import PositionSource
-from ichnaea.api.rate_limit import rate_limit_exceeded
-from ichnaea import floatjson
+from ichnaea.api.rate_limit import RateLimiter
 from ichnaea.geocalc import aggregate_position
 from ichnaea.models.cell import (
     encode_cellid,
@@ -32,7 +37,24 @@ from ichnaea.models.wifi import (
     encode_mac,
 )
 
-LOCATION_NOT_FOUND = '404'  #: Magic constant to cache not found.
+LOCATION_NOT_FOUND = '404'  #: Magic constant for JSON cached not found.
+LOCATION_NOT_FOUND_VALUE = b'\x00'  #: Binary cache value for not found.
+
+#: Binary cache value layout: lat, lon, accuracy, fallback flag.
+RESULT_STRUCT = struct.Struct('!ddiB')
+FALLBACK_FLAGS = {None: 0, 'lacf': 1}
+FALLBACK_NAMES = dict([(flag, name) for name, flag in FALLBACK_FLAGS.items()])
+COALESCE_POLL_INTERVAL = 0.05  #: Seconds between checks of a shared lock.
+
+# Delete the lock KEYS[1], but only if it's still held with the
+# ARGV[1] token and hasn't expired and been acquired by someone else.
+UNLOCK_SCRIPT = '''\
+if redis.call('GET', KEYS[1]) == ARGV[1] then
+    return redis.call('DEL', KEYS[1])
+end
+return 0
+'''
+UNLOCK_SCRIPT_SHA = hashlib.sha1(UNLOCK_SCRIPT.encode('ascii')).hexdigest()
 
 
 class ExternalResult(namedtuple('ExternalResult',
@@ -46,6 +68,41 @@ class ExternalResult(namedtuple('ExternalResult',
         return False
 
 
+def encode_external_result(result):
+    """
+    Encode a :class:`~ichnaea.api.locate.fallback.ExternalResult`
+    into a compact binary cache value.
+    """
+    if result.not_found():
+        return LOCATION_NOT_FOUND_VALUE
+    return RESULT_STRUCT.pack(
+        result.lat, result.lon, int(round(result.accuracy)),
+        FALLBACK_FLAGS.get(result.fallback, 0))
+
+
+def decode_external_result(value):
+    """
+    Decode a cache value into a
+    :class:`~ichnaea.api.locate.fallback.ExternalResult`.
+
+    Values written in the older JSON format are still understood,
+    until they expire from the cache.
+
+    :raises: :exc:`struct.error` or
+             :exc:`simplejson.JSONDecodeError` for invalid values.
+    """
+    if value[:1] in (b'{', b'"'):
+        value = simplejson.loads(value)
+        if value == LOCATION_NOT_FOUND:
+            return ExternalResult(None, None, None, None)
+        return ExternalResult(**value)
+
+    if value == LOCATION_NOT_FOUND_VALUE:
+        return ExternalResult(None, None, None, None)
+    lat, lon, accuracy, fallback = RESULT_STRUCT.unpack(value)
+    return ExternalResult(lat, lon, accuracy, FALLBACK_NAMES.get(fallback))
+
+
 class ResultSchema(InternalMappingSchema):
 
     @colander.instantiate()
@@ -133,6 +190,7 @@ class FallbackCache(object):
         self.stats_client = stats_client
         self.cache_expire = cache_expire
         self.cache_key_cell = redis_client.cache_keys['fallback_cell']
+        self.cache_key_lock = redis_client.cache_keys['fallback_lock']
         self.cache_key_wifi = redis_client.cache_keys['fallback_wifi']
 
     def _stat_count(self, stat, tags):
@@ -173,6 +231,74 @@ class FallbackCache(object):
             keys.append(self.cache_key_wifi + encode_mac(wifi.mac))
         return keys
 
+    def flight_key(self, query):
+        """
+        Return a key identifying all identical cacheable queries,
+        or None if the query can't be cached.
+        """
+        if not self._should_cache(query):
+            return None
+        return tuple(sorted(self._cache_keys(query)))
+
+    def lock_key(self, query):
+        """
+        Return the Redis key used to lock the upstream lookup for
+        all identical queries across processes.
+        """
+        digest = hashlib.sha1(b''.join(self.flight_key(query))).hexdigest()
+        return self.cache_key_lock + digest.encode('ascii')
+
+    def lock(self, query, expire):
+        """
+        Try to acquire a shared lock for the upstream lookup of
+        the query, automatically released after `expire` seconds.
+
+        :returns: A random token identifying the lock owner if the lock
+                  was acquired or couldn't be checked, otherwise None.
+        """
+        token = uuid4().hex.encode('ascii')
+        try:
+            if not self.redis_client.set(
+                    self.lock_key(query), token,
+                    px=int(expire * 1000), nx=True):
+                return None
+        except RedisError:
+            self.raven_client.captureException()
+        return token
+
+    def unlock(self, query, token):
+        """
+        Release the shared lock for the query, if it is still held
+        with the token returned by :meth:`lock`.
+        """
+        lock_key = self.lock_key(query)
+        try:
+            try:
+                self.redis_client.evalsha(
+                    UNLOCK_SCRIPT_SHA, 1, lock_key, token)
+            except NoScriptError:
+                # The script isn't yet loaded into this Redis server.
+                self.redis_client.script_load(UNLOCK_SCRIPT)
+                self.redis_client.evalsha(
+                    UNLOCK_SCRIPT_SHA, 1, lock_key, token)
+        except RedisError:
+            self.raven_client.captureException()
+
+    def wait_unlocked(self, query, timeout):
+        """
+        Wait for up to `timeout` seconds for the shared lock for
+        the query to be released.
+        """
+        lock_key = self.lock_key(query)
+        deadline = time.time() + timeout
+        try:
+            while self.redis_client.exists(lock_key):
+                if time.time() >= deadline:
+                    return
+                gevent.sleep(COALESCE_POLL_INTERVAL)
+        except RedisError:
+            self.raven_client.captureException()
+
     def get(self, query):
         """
         Get a cached result for the query.
@@ -197,17 +323,15 @@ class FallbackCache(object):
                 if not value:
                     continue
 
-                value = simplejson.loads(value)
-                if value == LOCATION_NOT_FOUND:
-                    value = ExternalResult(None, None, None, None)
+                value = decode_external_result(value)
+                if value.not_found():
                     clustered_results[not_found_cluster] = [value]
                 else:
-                    value = ExternalResult(**value)
                     # ~100x100m clusters
                     clustered_results[(round(value.lat, 3),
                                        round(value.lat, 3),
                                        value.fallback)].append(value)
-        except (simplejson.JSONDecodeError, RedisError):
+        except (simplejson.JSONDecodeError, struct.error, RedisError):
             self.raven_client.captureException()
             self._stat_count('cache', tags=['status:failure'])
             return None
@@ -255,13 +379,8 @@ class FallbackCache(object):
             return
 
         cache_keys = self._cache_keys(query)
-        if result.not_found():
-            cache_value = LOCATION_NOT_FOUND
-        else:
-            cache_value = result._asdict()
-
         try:
-            cache_value = floatjson.float_dumps(cache_value)
+            cache_value = encode_external_result(result)
             cache_values = dict([(key, cache_value) for key in cache_keys])
 
             with self.redis_client.pipeline() as pipe:
@@ -269,7 +388,9 @@ class FallbackCache(object):
                 for cache_key in cache_keys:
                     pipe.expire(cache_key, self.cache_expire)
                 pipe.execute()
-        except (simplejson.JSONDecodeError, RedisError):
+        except (OverflowError, struct.error, ValueError, RedisError):
+            # The result can't be encoded, e.g. for an accuracy out
+            # of range, or couldn't be stored.
             self.raven_client.captureException()
 
 
@@ -279,6 +400,9 @@ class DisabledCache(object):
     :class:`~ichnaea.api.locate.fallback.FallbackCache`.
     """
 
+    def flight_key(self, query):
+        return None
+
     def get(self, query):
         return None
 
@@ -302,6 +426,11 @@ class FallbackPositionSource(PositionSource):
         self.ratelimit = int(settings.get('ratelimit', 0))
         self.ratelimit_expire = int(settings.get('ratelimit_expire', 0))
         self.ratelimit_interval = int(settings.get('ratelimit_interval', 1))
+        self.rate_limiter = RateLimiter(
+            self.redis_client, chunk=int(settings.get('ratelimit_chunk', 1)))
+        self.coalesce_shared = bool(int(settings.get('coalesce_shared', 0)))
+        self.coalesce_timeout = float(settings.get('coalesce_timeout', 5.0))
+        self._flights = {}
         cache_expire = int(settings.get('cache_expire', 0))
         if not cache_expire:
             self.cache = DisabledCache()
@@ -324,8 +453,7 @@ class FallbackPositionSource(PositionSource):
         return 'fallback_ratelimit:%s' % (now // self.ratelimit_interval)
 
     def _ratelimit_reached(self):
-        return self.ratelimit and rate_limit_exceeded(
-            self.redis_client,
+        return self.ratelimit and self.rate_limiter.exceeded(
             self._ratelimit_key(),
             maxreq=self.ratelimit,
             expire=self.ratelimit_expire,
@@ -377,6 +505,61 @@ class FallbackPositionSource(PositionSource):
         except (simplejson.JSONDecodeError, RequestException):
             self.raven_client.captureException()
 
+    def _external_result(self, query):
+        # only rate limit the external call
+        if self._ratelimit_reached():
+            return None
+        result_data = self._make_external_call(query)
+        if result_data is not None:
+            # we got a new possibly not_found answer
+            self.cache.set(query, result_data)
+        return result_data
+
+    def _shared_result(self, query):
+        if not self.coalesce_shared:
+            return self._external_result(query)
+
+        token = self.cache.lock(query, self.coalesce_timeout)
+        if token is None:
+            # another process is already asking for the same networks,
+            # wait for it to populate the cache
+            self.cache.wait_unlocked(query, self.coalesce_timeout)
+            result_data = self.cache.get(query)
+            if result_data is not None:
+                self._stat_count('coalesce', tags=['status:shared'])
+                return result_data
+            self._stat_count('coalesce', tags=['status:timeout'])
+            return self._external_result(query)
+
+        try:
+            return self._external_result(query)
+        finally:
+            self.cache.unlock(query, token)
+
+    def _coalesced_result(self, query):
+        """
+        Make a single upstream lookup for all identical cacheable
+        queries running at the same time in this process and, if
+        `coalesce_shared` is enabled, across processes.
+        """
+        flight_key = self.cache.flight_key(query)
+        if flight_key is None:
+            return self._external_result(query)
+
+        flight = self._flights.get(flight_key)
+        if flight is not None:
+            self._stat_count('coalesce', tags=['status:local'])
+            return flight.wait(timeout=self.coalesce_timeout)
+
+        flight = self._flights[flight_key] = AsyncResult()
+        result_data = None
+        try:
+            result_data = self._shared_result(query)
+        finally:
+            del self._flights[flight_key]
+            flight.set(result_data)
+        return result_data
+
     def should_search(self, query, results):
         return (
             query.api_key.allow_fallback and
@@ -390,12 +573,8 @@ class FallbackPositionSource(PositionSource):
         if cached_result:
             # use our own cache, without checking the rate limit
             result_data = cached_result
-        elif not self._ratelimit_reached():
-            # only rate limit the external call
-            result_data = self._make_external_call(query)
-            if result_data is not None:
-                # we got a new possibly not_found answer
-                self.cache.set(query, result_data)
+        else:
+            result_data = self._coalesced_result(query)
 
         if result_data is not None and not result_data.not_found():
             result = self.result_type(
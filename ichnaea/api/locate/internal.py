@@ -60,6 +60,10 @@ class InternalPositionSource(CellPositionMixin,
             return False
         return True
 
+    def prefetch(self, queries):
+        self.prefetch_wifi(queries)
+        self.prefetch_cell(queries)
+
     def search(self, query):
         results = ResultList(self.result_type())
         for should, search in (
@@ -15,3 +15,4 @@ class OCIDPositionSource(CellPositionSource):
     area_model = OCIDCellArea
     fallback_field = None  #:
     source = DataSource.ocid  #:
+    station_cache_type = None  #:
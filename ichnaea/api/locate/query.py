@@ -1,5 +1,7 @@
 """Code representing a query."""
 
+import hashlib
+
 import six
 
 from ichnaea.api.locate.constants import (
@@ -75,6 +77,9 @@ class Query(object):
         self.http_session = http_session
         self.session = session
         self.stats_client = stats_client
+        # Station caches prefetched for a batch of queries,
+        # keyed by station type.
+        self.station_caches = {}
 
         self.fallback = fallback
         self.ip = ip
@@ -287,6 +292,44 @@ class Query(object):
             result['fallbacks'] = fallback_data
         return result
 
+    def fingerprint(self):
+        """
+        Returns a hash of all parts of this query used by the
+        non-GeoIP sources, or None if the query contains neither
+        cell nor wifi data.
+
+        Only the order of the wifi networks by signal strength is
+        used, as it decides which networks are used for the position.
+        Repeated scans with the same signal order share a fingerprint.
+        """
+        if not (self.cell or self.cell_area or self.wifi):
+            return None
+
+        def _key(key):
+            return tuple([getattr(key, field) for field in key._fields])
+
+        # Group the wifi networks by signal strength, strongest first,
+        # with the same default signal as the wifi source.
+        wifi_signals = {}
+        for wifi in self.wifi:
+            wifi_signals.setdefault(wifi.signal or -100, []).append(wifi.mac)
+        wifi_ranks = [sorted(wifi_signals[signal])
+                      for signal in sorted(wifi_signals, reverse=True)]
+
+        allow_fallback = None
+        if self.api_key is not None:
+            allow_fallback = bool(self.api_key.allow_fallback)
+
+        parts = (
+            self.api_type,
+            allow_fallback,
+            _key(self.fallback),
+            sorted([_key(cell.hashkey()) for cell in self.cell]),
+            sorted([_key(area.hashkey()) for area in self.cell_area]),
+            wifi_ranks,
+        )
+        return hashlib.sha1(repr(parts).encode('utf-8')).hexdigest()
+
     def collect_metrics(self):
         """Should detailed metrics be collected for this query?"""
         allowed = bool(self.api_key and self.api_key.log and self.api_type)
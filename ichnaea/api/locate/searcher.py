@@ -4,7 +4,13 @@ multiple sources to satisfy a given query.
 """
 
 from collections import defaultdict
+import time
 
+import gevent
+from gevent.event import Event
+from repoze.lru import ExpiringLRUCache
+
+from ichnaea.api.locate.constants import DataSource
 from ichnaea.api.locate.fallback import FallbackPositionSource
 from ichnaea.api.locate.geoip import (
     GeoIPCountrySource,
@@ -22,6 +28,10 @@ from ichnaea.api.locate.result import (
 )
 from ichnaea.constants import DEGREE_DECIMAL_PLACES
 
+#: Default delay in seconds, before sources not using the database
+#: are searched concurrently with the database sources.
+CONCURRENT_HEDGE = 0.1
+
 
 def _configure_searcher(klass, settings, geoip_db=None, raven_client=None,
                         redis_client=None, stats_client=None, _searcher=None):
@@ -65,14 +75,42 @@ class Searcher(object):
     A Searcher will use a collection of data sources
     to attempt to satisfy a user's query. It will loop over them
     in the order they are specified and use the most accurate result.
+
+    If a `concurrent_deadline` is configured in the `locate` section,
+    the sources are instead searched concurrently and the search stops
+    once the deadline in seconds is reached or one of the results
+    satisfies the query. Sources not using the database are only
+    started after the database sources are done or a `concurrent_hedge`
+    delay in seconds has passed.
+
+    If the searcher supports it and a `result_cache_size` and
+    `result_cache_expire` are configured, the results of queries with
+    the same :meth:`~ichnaea.api.locate.query.Query.fingerprint` are
+    cached in-process. Results based on GeoIP are never cached.
     """
 
     result_type = None  #: :class:`ichnaea.api.locate.result.Result`
+    result_cache_supported = False  #: Can results be cached?
     sources = ()  #:
     source_classes = ()  #:
 
     def __init__(self, settings,
                  geoip_db, raven_client, redis_client, stats_client):
+        self.raven_client = raven_client
+        self.stats_client = stats_client
+        searcher_settings = settings.get_map('locate', {})
+        self.concurrent_deadline = float(
+            searcher_settings.get('concurrent_deadline', 0))
+        self.concurrent_hedge = float(
+            searcher_settings.get('concurrent_hedge', CONCURRENT_HEDGE))
+
+        self.result_cache = None
+        cache_size = int(searcher_settings.get('result_cache_size', 0))
+        cache_expire = int(searcher_settings.get('result_cache_expire', 0))
+        if self.result_cache_supported and cache_size and cache_expire:
+            self.result_cache = ExpiringLRUCache(
+                cache_size, default_timeout=cache_expire)
+
         self.sources = []
         for name, source in self.source_classes:
             source_settings = settings.get_map('locate:%s' % name, {})
@@ -88,14 +126,173 @@ class Searcher(object):
     def _best_result(self, results):
         raise NotImplementedError()
 
-    def _search(self, query):
+    def _search_source(self, query, name, source):
+        start = time.time()
+        try:
+            return source.search(query)
+        finally:
+            if query.api_type and self.stats_client is not None:
+                duration = int(round((time.time() - start) * 1000))
+                self.stats_client.timing(
+                    '%s.source.timing' % query.api_type, duration,
+                    tags=['source:%s' % name])
+
+    def _source_groups(self):
+        # All sources using the database share the query's database
+        # session, so they have to be searched one after the other.
+        # Every other source gets its own group.
+        groups = []
+        database_group = None
+        for name, source in self.sources:
+            if not source.uses_database:
+                groups.append([(name, source)])
+            elif database_group is None:
+                database_group = [(name, source)]
+                groups.append(database_group)
+            else:
+                database_group.append((name, source))
+        return groups
+
+    def _satisfied(self, query, results):
+        # The result list always contains an empty result, which
+        # trivially satisfies queries without any data.
+        for result in results:
+            if not result.empty() and result.satisfies(query):
+                return True
+        return False
+
+    def _collect_results(self, found):
+        # Add the results found so far in the configured source order,
+        # so ties between equally accurate results are broken the same
+        # way as in the sequential search.
         results = ResultList(result=self.result_type())
         for name, source in self.sources:
+            if name in found:
+                results.add(found[name])
+        return results
+
+    def _search_group(self, query, group, found, changed, stop):
+        for name, source in group:
+            if stop.is_set():
+                break
+            results = self._collect_results(found)
+            if self._satisfied(query, results):
+                break
             if source.should_search(query, results):
-                results.add(source.search(query))
+                found[name] = self._search_source(query, name, source)
+                changed.set()
+
+    def _search_concurrent(self, query):
+        found = {}
+        changed = Event()
+        stop = Event()
+        greenlets = []
+
+        def spawn(groups):
+            for group in groups:
+                greenlet = gevent.spawn(
+                    self._search_group, query, group, found, changed, stop)
+                greenlets.append((group, greenlet))
+
+        # Sources not using the database, like the external fallback,
+        # are only started once the database sources are done or the
+        # hedge delay has passed. This avoids asking them for queries,
+        # which could be answered by the database alone.
+        delayed = []
+        database = []
+        for group in self._source_groups():
+            if group[0][1].uses_database:
+                database.append(group)
+            else:
+                delayed.append(group)
+        spawn(database)
+
+        start = time.time()
+        deadline = start + self.concurrent_deadline
+        hedge = start + min(self.concurrent_hedge, self.concurrent_deadline)
+        while not self._satisfied(query, self._collect_results(found)):
+            if any([greenlet.ready() and not greenlet.successful()
+                    for _, greenlet in greenlets]):
+                break
+            pending = [greenlet for _, greenlet in greenlets
+                       if not greenlet.ready()]
+            now = time.time()
+            if delayed and (not pending or now >= hedge):
+                spawn(delayed)
+                delayed = []
+                continue
+            if not pending or now >= deadline:
+                break
+            changed.clear()
+            gevent.wait(pending + [changed], count=1,
+                        timeout=(hedge if delayed else deadline) - now)
+
+        # Cancel all remaining sources. Database queries which are
+        # already running are allowed to finish, as the database
+        # session can't be shared with the next request.
+        stop.set()
+        for group, greenlet in greenlets:
+            if greenlet.ready():
+                continue
+            if group[0][1].uses_database:
+                greenlet.join()
+            else:
+                greenlet.kill()
+
+        # Raise errors the same way as the sequential search does.
+        for _, greenlet in greenlets:
+            if not greenlet.successful():
+                greenlet.get()
+
+        return self._collect_results(found)
+
+    def _search(self, query):
+        if self.concurrent_deadline > 0:
+            results = self._search_concurrent(query)
+        else:
+            results = ResultList(result=self.result_type())
+            for name, source in self.sources:
+                if source.should_search(query, results):
+                    results.add(self._search_source(query, name, source))
 
         return self._best_result(results)
 
+    def _cacheable(self, result):
+        return not result.empty() and result.source is not DataSource.geoip
+
+    def _search_cached(self, query):
+        fingerprint = None
+        if self.result_cache is not None:
+            fingerprint = query.fingerprint()
+        if fingerprint is None:
+            return self._search(query)
+
+        collect_stats = query.api_type and self.stats_client is not None
+        cached = self.result_cache.get(fingerprint)
+        if cached is not None:
+            result, duration = cached
+            if collect_stats:
+                self.stats_client.incr(
+                    '%s.result_cache' % query.api_type, tags=['status:hit'])
+                # Report the time it took to find the cached result.
+                self.stats_client.timing(
+                    '%s.result_cache.saved' % query.api_type, duration)
+            if result.source is not None:
+                # Report the source stats for the source which originally
+                # found the result, as if it had been asked again.
+                query.emit_source_stats(result.source, result)
+            return result
+
+        start = time.time()
+        result = self._search(query)
+        duration = int(round((time.time() - start) * 1000))
+        if collect_stats:
+            self.stats_client.incr(
+                '%s.result_cache' % query.api_type, tags=['status:miss'])
+        if self._cacheable(result):
+            self.result_cache.put(fingerprint, (result, duration))
+        return result
+
     def format_result(self, result):
         """
         Converts the result object into a dictionary representation.
@@ -105,6 +302,17 @@ class Searcher(object):
         """
         raise NotImplementedError()
 
+    def prefetch(self, queries):
+        """
+        Let all sources look up the data needed by a batch of
+        queries in bulk, before the queries are searched one by one.
+
+        :param queries: A list of queries.
+        :type queries: list
+        """
+        for name, source in self.sources:
+            source.prefetch(queries)
+
     def search(self, query):
         """
         Provide a type specific query result or return None.
@@ -115,7 +323,7 @@ class Searcher(object):
         :returns: A result_type specific dict.
         """
         query.emit_query_stats()
-        result = self._search(query)
+        result = self._search_cached(query)
         query.emit_result_stats(result)
         if not result.empty():
             return self.format_result(result)
@@ -128,6 +336,7 @@ class PositionSearcher(Searcher):
     """
 
     result_type = Position
+    result_cache_supported = True
     source_classes = (
         ('geoip', GeoIPPositionSource),
         ('internal', InternalPositionSource),
@@ -18,6 +18,7 @@ class Source(object):
     fallback_field = None  #:
     result_type = None  #:
     source = None  #:
+    uses_database = False  #:
 
     def __init__(self, settings,
                  geoip_db, raven_client, redis_client, stats_client):
@@ -50,6 +51,16 @@ class Source(object):
 
         return True
 
+    def prefetch(self, queries):
+        """
+        Prepare the data needed by a batch of queries in bulk,
+        before each of them is searched on its own.
+
+        :param queries: A list of queries.
+        :type queries: list
+        """
+        pass
+
     def search(self, query):
         """Provide a type specific possibly empty query result.
 
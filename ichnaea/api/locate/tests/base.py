@@ -287,6 +287,10 @@ class CommonLocateTest(BaseLocateTest):
             # check that the ttl was set
             ttl = self.redis_client.ttl(expected)
             self.assertTrue(7 * 24 * 3600 < ttl <= 8 * 24 * 3600)
+            # the deferred commands were sent at the end of the request
+            self.check_stats(timer=[
+                (self.metric_type + '.redis.timing', 1, [self.metric_path]),
+            ])
 
     def test_empty_json(self):
         res = self._call(ip=self.test_ip, status=200)
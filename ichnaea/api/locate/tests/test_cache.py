@@ -0,0 +1,196 @@
+import mock
+from redis import RedisError
+
+from ichnaea.api.locate.cache import (
+    configure_station_cache,
+    DisabledCache,
+    RedisStationCache,
+    StationCache,
+    TieredCache,
+)
+from ichnaea.cache import (
+    invalidate_stations,
+    redis_pipeline,
+    station_cache_key,
+)
+from ichnaea.models.station import (
+    StationPosition,
+    UNKNOWN_STATION,
+)
+from ichnaea.tests.base import (
+    LogTestCase,
+    RedisTestCase,
+)
+from ichnaea.tests.factories import CellFactory
+
+
+class TestConfigure(RedisTestCase):
+
+    def _configure(self, settings):
+        return configure_station_cache(
+            settings, self.raven_client, self.redis_client,
+            self.stats_client, 'wifi')
+
+    def test_no_settings(self):
+        self.assertTrue(isinstance(self._configure(None), DisabledCache))
+
+    def test_partial_settings(self):
+        cache = self._configure({'wifi_cache_size': '100'})
+        self.assertTrue(isinstance(cache, DisabledCache))
+
+    def test_local(self):
+        cache = self._configure(
+            {'wifi_cache_size': '100', 'wifi_cache_expire': '60'})
+        self.assertTrue(isinstance(cache, StationCache))
+        self.assertEqual(cache.expire, 60)
+
+    def test_shared(self):
+        cache = self._configure({'wifi_shared_cache': '1'})
+        self.assertTrue(isinstance(cache, RedisStationCache))
+
+    def test_tiered(self):
+        cache = self._configure({
+            'wifi_cache_size': '100',
+            'wifi_cache_expire': '60',
+            'wifi_shared_cache': '1',
+        })
+        self.assertTrue(isinstance(cache, TieredCache))
+
+
+class TestStationCache(LogTestCase):
+
+    def setUp(self):
+        super(TestStationCache, self).setUp()
+        self.cache = StationCache(
+            self.stats_client, 'wifi', size=2, expire=60)
+        self.position = StationPosition(1.0, 2.0, 10, None)
+
+    def test_disabled(self):
+        cache = DisabledCache()
+        self.assertEqual(cache.set({'a': self.position}), None)
+        self.assertEqual(cache.get(['a']), {})
+
+    def test_miss(self):
+        self.assertEqual(self.cache.get(['a', 'b']), {})
+        self.check_stats(counter=[
+            ('locate.wifi.cache', 1, 2, ['status:miss']),
+        ])
+
+    def test_hit(self):
+        self.cache.set({'a': self.position, 'b': UNKNOWN_STATION})
+        self.assertEqual(self.cache.get(['a', 'b', 'c']), {
+            'a': self.position,
+            'b': UNKNOWN_STATION,
+        })
+        self.check_stats(counter=[
+            ('locate.wifi.cache', 1, 2, ['status:hit']),
+            ('locate.wifi.cache', 1, 1, ['status:miss']),
+        ])
+
+    def test_expired(self):
+        cache = StationCache(self.stats_client, 'wifi', size=2, expire=-1)
+        cache.set({'a': self.position})
+        self.assertEqual(cache.get(['a']), {})
+
+    def test_eviction(self):
+        self.cache.set({'a': self.position})
+        self.cache.set({'b': self.position})
+        self.cache.set({'c': self.position})
+        self.assertEqual(len(self.cache.get(['a', 'b', 'c'])), 2)
+        self.check_stats(counter=[
+            ('locate.wifi.cache', 1, 1, ['status:eviction']),
+        ])
+
+
+class TestRedisStationCache(RedisTestCase):
+
+    def setUp(self):
+        super(TestRedisStationCache, self).setUp()
+        self.cache = RedisStationCache(
+            self.raven_client, self.redis_client, self.stats_client, 'wifi')
+        self.position = StationPosition(1.0, 2.0, 10, None)
+
+    def test_miss(self):
+        self.assertEqual(self.cache.get(['aaaaaaaaaaaa']), {})
+        self.check_stats(counter=[
+            ('locate.wifi.shared_cache', 1, 1, ['status:miss']),
+        ])
+
+    def test_hit(self):
+        self.cache.set({
+            'aaaaaaaaaaaa': self.position,
+            'bbbbbbbbbbbb': UNKNOWN_STATION,
+        })
+        self.assertEqual(
+            self.cache.get(['aaaaaaaaaaaa', 'bbbbbbbbbbbb', 'cccccccccccc']), {
+                'aaaaaaaaaaaa': self.position,
+                'bbbbbbbbbbbb': UNKNOWN_STATION,
+            })
+        self.check_stats(counter=[
+            ('locate.wifi.shared_cache', 1, 2, ['status:hit']),
+            ('locate.wifi.shared_cache', 1, 1, ['status:miss']),
+        ])
+
+    def test_set_keeps_existing(self):
+        self.cache.set({'aaaaaaaaaaaa': self.position})
+        self.cache.set({'aaaaaaaaaaaa': UNKNOWN_STATION})
+        self.assertEqual(self.cache.get(['aaaaaaaaaaaa']),
+                         {'aaaaaaaaaaaa': self.position})
+
+    def test_invalidated(self):
+        self.cache.set({'aaaaaaaaaaaa': self.position})
+        with redis_pipeline(self.redis_client) as pipe:
+            invalidate_stations(pipe, 'wifi', ['aaaaaaaaaaaa'])
+        # invalidated entries can't be cached again right away
+        self.cache.set({'aaaaaaaaaaaa': self.position})
+        self.assertEqual(self.cache.get(['aaaaaaaaaaaa']), {})
+        self.check_stats(counter=[
+            ('locate.wifi.shared_cache', 1, 1, ['status:miss']),
+        ])
+
+    def test_cell(self):
+        cache = RedisStationCache(
+            self.raven_client, self.redis_client, self.stats_client, 'cell')
+        key = CellFactory.build().hashkey()
+        cache.set({key: self.position})
+        self.assertTrue(
+            self.redis_client.exists(station_cache_key('cell', key)))
+        self.assertEqual(cache.get([key]), {key: self.position})
+
+    def test_failure(self):
+        mock_redis_client = mock.Mock()
+        mock_redis_client.mget.side_effect = RedisError()
+        cache = RedisStationCache(
+            self.raven_client, mock_redis_client, self.stats_client, 'wifi')
+        self.assertEqual(cache.get(['aaaaaaaaaaaa']), {})
+        self.check_raven([('RedisError', 1)])
+        self.check_stats(counter=[
+            ('locate.wifi.shared_cache', 1, 1, ['status:failure']),
+        ])
+
+
+class TestTieredCache(RedisTestCase):
+
+    def setUp(self):
+        super(TestTieredCache, self).setUp()
+        self.local_cache = StationCache(
+            self.stats_client, 'wifi', size=10, expire=60)
+        self.shared_cache = RedisStationCache(
+            self.raven_client, self.redis_client, self.stats_client, 'wifi')
+        self.cache = TieredCache(self.local_cache, self.shared_cache)
+        self.position = StationPosition(1.0, 2.0, 10, None)
+
+    def test_set(self):
+        self.cache.set({'aaaaaaaaaaaa': self.position})
+        self.assertEqual(self.local_cache.get(['aaaaaaaaaaaa']),
+                         {'aaaaaaaaaaaa': self.position})
+        self.assertEqual(self.shared_cache.get(['aaaaaaaaaaaa']),
+                         {'aaaaaaaaaaaa': self.position})
+
+    def test_get_from_shared(self):
+        self.shared_cache.set({'aaaaaaaaaaaa': self.position})
+        self.assertEqual(self.cache.get(['aaaaaaaaaaaa', 'bbbbbbbbbbbb']),
+                         {'aaaaaaaaaaaa': self.position})
+        # the shared entry is now also cached in-process
+        self.assertEqual(self.local_cache.get(['aaaaaaaaaaaa']),
+                         {'aaaaaaaaaaaa': self.position})
@@ -89,3 +89,46 @@ class TestCellPosition(BaseSourceTest):
         self.check_model_result(
             result, areas[0],
             accuracy=LAC_MIN_ACCURACY)
+
+
+class TestCellPositionCache(BaseSourceTest):
+
+    TestSource = CellPositionSource
+    settings = {'cell_shared_cache': '1'}
+
+    def test_cached(self):
+        cell = CellFactory()
+        cell2 = CellFactory(radio=cell.radio, mcc=cell.mcc, mnc=cell.mnc,
+                            lac=cell.lac, cid=cell.cid + 1,
+                            lat=cell.lat + 0.02, lon=cell.lon + 0.02)
+        self.session.flush()
+
+        query = self.model_query(cells=[cell, cell2])
+        result = self.source.search(query)
+        self.check_model_result(
+            result, cell,
+            lat=cell.lat + 0.01, lon=cell.lon + 0.01)
+        self.check_stats(counter=[
+            ('locate.cell.shared_cache', 1, 2, ['status:miss']),
+        ])
+
+        with self.db_call_checker() as check_db_calls:
+            result = self.source.search(query)
+            self.check_model_result(
+                result, cell,
+                lat=cell.lat + 0.01, lon=cell.lon + 0.01)
+            check_db_calls(rw=0, ro=0)
+        self.check_stats(counter=[
+            ('locate.cell.shared_cache', 1, 2, ['status:hit']),
+        ])
+
+    def test_not_found_cached(self):
+        cell = CellFactory.build()
+        query = self.model_query(cells=[cell])
+        for i in range(2):
+            result = self.source.search(query)
+            self.check_model_result(result, None)
+        self.check_stats(counter=[
+            ('locate.cell.shared_cache', 1, 1, ['status:miss']),
+            ('locate.cell.shared_cache', 1, 1, ['status:hit']),
+        ])
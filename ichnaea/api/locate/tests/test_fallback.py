@@ -1,4 +1,5 @@
 import colander
+import gevent
 import mock
 import requests_mock
 from redis import RedisError
@@ -7,7 +8,9 @@ from requests.exceptions import RequestException
 from ichnaea.api.exceptions import LocationNotFound
 from ichnaea.api.locate.constants import DataSource
 from ichnaea.api.locate.fallback import (
+    decode_external_result,
     DisabledCache,
+    encode_external_result,
     ExternalResult,
     FallbackCache,
     FallbackPositionSource,
@@ -49,6 +52,35 @@ class TestExternalResult(TestCase):
         self.assertFalse(result.not_found())
 
 
+class TestExternalResultCodec(TestCase):
+
+    def test_roundtrip(self):
+        result = ExternalResult(51.5366, 0.03989, 1500, None)
+        value = encode_external_result(result)
+        self.assertEqual(len(value), 21)
+        self.assertEqual(decode_external_result(value), result)
+
+    def test_fallback(self):
+        result = ExternalResult(51.5366, 0.03989, 1500, 'lacf')
+        value = encode_external_result(result)
+        self.assertEqual(decode_external_result(value), result)
+
+    def test_not_found(self):
+        result = ExternalResult(None, None, None, None)
+        value = encode_external_result(result)
+        self.assertEqual(value, b'\x00')
+        self.assertTrue(decode_external_result(value).not_found())
+
+    def test_json(self):
+        value = floatjson.float_dumps(
+            {'lat': 1.5, 'lon': 2.5, 'accuracy': 100, 'fallback': 'lacf'})
+        self.assertEqual(decode_external_result(value),
+                         ExternalResult(1.5, 2.5, 100, 'lacf'))
+
+    def test_json_not_found(self):
+        self.assertTrue(decode_external_result(b'"404"').not_found())
+
+
 class TestResultSchema(TestCase):
 
     schema = RESULT_SCHEMA
@@ -202,12 +234,36 @@ class TestCache(QueryTest):
         self.cache.set(query, result)
         keys = self.redis_client.keys('cache:fallback:cell:*')
         self.assertEqual(len(keys), 1)
-        self.assertEqual(self.redis_client.get(keys[0]), b'"404"')
+        self.assertEqual(self.redis_client.get(keys[0]), b'\x00')
         self.assertEqual(self.cache.get(query), result)
         self.check_stats(counter=[
             ('locate.fallback.cache', 1, 1, ['status:hit']),
         ])
 
+    def test_get_cell_json(self):
+        cell = CellFactory.build()
+        query = Query(cell=self.cell_model_query([cell]))
+        key = self.cache._cache_keys(query)[0]
+        self.redis_client.set(key, floatjson.float_dumps({
+            'lat': cell.lat, 'lon': cell.lon,
+            'accuracy': cell.range, 'fallback': None}))
+        self.assertEqual(self.cache.get(query),
+                         ExternalResult(cell.lat, cell.lon, cell.range, None))
+        self.check_stats(counter=[
+            ('locate.fallback.cache', 1, 1, ['status:hit']),
+        ])
+
+    def test_get_cell_invalid(self):
+        cell = CellFactory.build()
+        query = Query(cell=self.cell_model_query([cell]))
+        key = self.cache._cache_keys(query)[0]
+        self.redis_client.set(key, b'\x01\x02\x03')
+        self.assertEqual(self.cache.get(query), None)
+        self.check_raven([('error', 1)])
+        self.check_stats(counter=[
+            ('locate.fallback.cache', 1, 1, ['status:failure']),
+        ])
+
     def test_get_cell_multi(self):
         cells = CellFactory.build_batch(2)
         query = Query(cell=self.cell_model_query(cells))
@@ -280,6 +336,32 @@ class TestCache(QueryTest):
             ('locate.fallback.cache', 1, 1, ['status:bypassed']),
         ])
 
+    def test_set_invalid(self):
+        cells = CellFactory.build_batch(1)
+        query = Query(cell=self.cell_model_query(cells))
+        for accuracy in (2.0 ** 40, float('inf')):
+            self.cache.set(query, ExternalResult(
+                cells[0].lat, cells[0].lon, accuracy, None))
+            self.assertEqual(self.cache.get(query), None)
+        self.check_raven([('error', 1), ('OverflowError', 1)])
+
+    def test_unlock_owner(self):
+        cells = CellFactory.build_batch(1)
+        query = Query(cell=self.cell_model_query(cells))
+        lock_key = self.cache.lock_key(query)
+
+        # the lock expired and was acquired by another process
+        token = self.cache.lock(query, 5.0)
+        self.redis_client.delete(lock_key)
+        other_token = self.cache.lock(query, 5.0)
+        self.assertNotEqual(token, other_token)
+
+        # only the current owner can release it
+        self.cache.unlock(query, token)
+        self.assertTrue(self.redis_client.exists(lock_key))
+        self.cache.unlock(query, other_token)
+        self.assertFalse(self.redis_client.exists(lock_key))
+
 
 class TestSource(BaseSourceTest):
 
@@ -698,3 +780,86 @@ class TestSource(BaseSourceTest):
         self.check_stats(counter=[
             ('locate.fallback.cache', ['status:hit']),
         ])
+
+    def test_coalesce_local(self):
+        cell = CellFactory.build()
+        query = self.model_query(cells=[cell])
+        result_data = ExternalResult(
+            self.fallback_model.lat, self.fallback_model.lon,
+            self.fallback_model.range, 'lacf')
+
+        def slow_call(query):
+            gevent.sleep(0.05)
+            return result_data
+
+        with mock.patch.object(self.source, '_make_external_call',
+                               side_effect=slow_call) as mock_call:
+            greenlets = [gevent.spawn(self.source.search, query)
+                         for i in range(3)]
+            gevent.joinall(greenlets)
+
+        self.assertEqual(mock_call.call_count, 1)
+        for greenlet in greenlets:
+            self.check_model_result(greenlet.value, self.fallback_model)
+        self.check_stats(counter=[
+            ('locate.fallback.cache', 3, ['status:miss']),
+            ('locate.fallback.coalesce', 2, ['status:local']),
+        ])
+
+    def test_coalesce_shared(self):
+        source = self.TestSource(
+            settings=dict(self.settings, coalesce_shared='1'),
+            geoip_db=self.geoip_db,
+            raven_client=self.raven_client,
+            redis_client=self.redis_client,
+            stats_client=self.stats_client,
+        )
+        cell = CellFactory.build()
+        query = self.model_query(cells=[cell])
+        result_data = ExternalResult(
+            self.fallback_model.lat, self.fallback_model.lon,
+            self.fallback_model.range, 'lacf')
+
+        # another process is currently asking for the same cell
+        token = source.cache.lock(query, 5.0)
+        self.assertTrue(token)
+        self.assertEqual(source.cache.lock(query, 5.0), None)
+
+        def other_process():
+            gevent.sleep(0.1)
+            source.cache.set(query, result_data)
+            source.cache.unlock(query, token)
+
+        other = gevent.spawn(other_process)
+        with mock.patch.object(source, '_make_external_call') as mock_call:
+            result = source.search(query)
+        other.join()
+
+        self.assertFalse(mock_call.called)
+        self.check_model_result(result, self.fallback_model)
+        self.check_stats(counter=[
+            ('locate.fallback.coalesce', ['status:shared']),
+        ])
+
+    def test_coalesce_shared_lock(self):
+        source = self.TestSource(
+            settings=dict(self.settings, coalesce_shared='1'),
+            geoip_db=self.geoip_db,
+            raven_client=self.raven_client,
+            redis_client=self.redis_client,
+            stats_client=self.stats_client,
+        )
+        cell = CellFactory.build()
+
+        with requests_mock.Mocker() as mock_request:
+            mock_request.register_uri(
+                'POST', requests_mock.ANY, json=self.fallback_result)
+
+            query = self.model_query(cells=[cell])
+            result = source.search(query)
+            self.check_model_result(result, self.fallback_model)
+            self.assertEqual(mock_request.call_count, 1)
+
+        # the lock is released after the lookup
+        self.assertFalse(
+            self.redis_client.exists(source.cache.lock_key(query)))
@@ -244,6 +244,45 @@ class TestQuery(QueryTest, ConnectionTestCase):
             wifi=self.wifi_model_query(wifis))
         self.assertEqual(query.expected_accuracy, DataAccuracy.high)
 
+    def test_fingerprint(self):
+        cells = CellFactory.build_batch(2)
+        wifis = WifiShardFactory.build_batch(2)
+        cell_query = self.cell_model_query(cells)
+        wifi_query = self.wifi_model_query(wifis)
+
+        self.assertEqual(Query().fingerprint(), None)
+        fingerprint = Query(cell=cell_query, wifi=wifi_query).fingerprint()
+        self.assertEqual(len(fingerprint), 40)
+
+        # order and uniform signal strength changes are ignored
+        for wifi in wifi_query:
+            wifi['signal'] = -60
+        self.assertEqual(
+            Query(cell=cell_query[::-1], wifi=wifi_query[::-1]).fingerprint(),
+            fingerprint)
+
+        for query in (
+                Query(cell=cell_query[:1], wifi=wifi_query),
+                Query(cell=cell_query, wifi=wifi_query, api_type='locate'),
+                Query(cell=cell_query, wifi=wifi_query,
+                      fallback={'lacf': False}),
+                Query(cell=cell_query, wifi=wifi_query,
+                      api_key=self.api_key)):
+            self.assertNotEqual(query.fingerprint(), fingerprint)
+
+    def test_fingerprint_signal_order(self):
+        wifi_query = self.wifi_model_query(WifiShardFactory.build_batch(3))
+        wifi_query[0]['signal'] = -70
+        fingerprint = Query(wifi=wifi_query).fingerprint()
+
+        wifi_query[0]['signal'] = -75
+        self.assertEqual(Query(wifi=wifi_query).fingerprint(), fingerprint)
+
+        wifi_query[0]['signal'] = -90
+        self.assertNotEqual(Query(wifi=wifi_query).fingerprint(), fingerprint)
+        wifi_query[0]['signal'] = -85
+        self.assertNotEqual(Query(wifi=wifi_query).fingerprint(), fingerprint)
+
     def test_api_key(self):
         api_key = ApiKeyFactory.build()
         query = Query(api_key=api_key)
@@ -1,3 +1,6 @@
+import gevent
+
+from ichnaea.api.locate.constants import DataSource
 from ichnaea.api.locate.query import Query
 from ichnaea.api.locate.searcher import (
     CountrySearcher,
@@ -9,7 +12,10 @@ from ichnaea.api.locate.source import (
 )
 from ichnaea.config import DummyConfig
 from ichnaea.tests.base import ConnectionTestCase
-from ichnaea.tests.factories import ApiKeyFactory
+from ichnaea.tests.factories import (
+    ApiKeyFactory,
+    WifiShardFactory,
+)
 
 
 class TestCountrySource(CountrySource):
@@ -32,9 +38,43 @@ class TestPositionSource(PositionSource):
         return self.result_type(lat=1.0, lon=1.0, accuracy=1000.0)
 
 
+class TestSlowPositionSource(PositionSource):
+    fallback_field = 'ipf'
+
+    def search(self, query):
+        gevent.sleep(10.0)
+        return self.result_type(lat=2.0, lon=2.0, accuracy=10.0)
+
+
+class TestCoarsePositionSource(PositionSource):
+    fallback_field = 'ipf'
+
+    def search(self, query):
+        return self.result_type(lat=1.0, lon=1.0, accuracy=50000.0)
+
+
+class TestAccuratePositionSource(PositionSource):
+    fallback_field = 'ipf'
+
+    def search(self, query):
+        return self.result_type(lat=3.0, lon=3.0, accuracy=10.0)
+
+
+class TestDatabasePositionSource(PositionSource):
+    fallback_field = 'ipf'
+    uses_database = True
+    accuracy = 10.0
+    delay = 0.0
+
+    def search(self, query):
+        gevent.sleep(self.delay)
+        return self.result_type(lat=4.0, lon=4.0, accuracy=self.accuracy)
+
+
 class SearcherTest(ConnectionTestCase):
 
     searcher = None
+    settings = {}
 
     def setUp(self):
         super(SearcherTest, self).setUp()
@@ -50,7 +90,7 @@ class SearcherTest(ConnectionTestCase):
 
     def _init_searcher(self, klass):
         return klass(
-            settings=DummyConfig({}),
+            settings=DummyConfig(self.settings),
             geoip_db=self.geoip_db,
             raven_client=self.raven_client,
             redis_client=self.redis_client,
@@ -99,6 +139,145 @@ class TestSearcher(SearcherTest):
         result = self._search(TestSearcher)
         self.assertEqual(result['country_code'], 'DE')
 
+    def test_source_timing(self):
+        class TestSearcher(CountrySearcher):
+            source_classes = (
+                ('test', TestCountrySource),
+            )
+
+        self._search(TestSearcher)
+        self.check_stats(timer=[
+            ('locate.source.timing', 1, ['source:test']),
+        ])
+
+
+class TestConcurrentSearcher(SearcherTest):
+
+    settings = {'locate': {'concurrent_deadline': '0.2'}}
+
+    def test_result(self):
+        class TestSearcher(PositionSearcher):
+            source_classes = (
+                ('test', TestPositionSource),
+            )
+
+        result = self._search(TestSearcher)
+        self.assertAlmostEqual(result['lat'], 1.0)
+        self.assertAlmostEqual(result['accuracy'], 1000.0)
+        self.check_stats(timer=[
+            ('locate.source.timing', 1, ['source:test']),
+        ])
+
+    def test_deadline(self):
+        class TestSearcher(PositionSearcher):
+            source_classes = (
+                ('slow', TestSlowPositionSource),
+                ('coarse', TestCoarsePositionSource),
+            )
+
+        wifis = WifiShardFactory.build_batch(2)
+        with gevent.Timeout(5.0):
+            result = self._search(TestSearcher, wifi=[
+                {'mac': wifi.mac} for wifi in wifis])
+        self.assertAlmostEqual(result['lat'], 1.0)
+        self.assertAlmostEqual(result['accuracy'], 50000.0)
+        self.check_stats(timer=[
+            ('locate.source.timing', 1, ['source:coarse']),
+            ('locate.source.timing', 1, ['source:slow']),
+        ])
+
+    def test_satisfied(self):
+        class TestSearcher(PositionSearcher):
+            source_classes = (
+                ('slow', TestSlowPositionSource),
+                ('accurate', TestAccuratePositionSource),
+            )
+
+        wifis = WifiShardFactory.build_batch(2)
+        searcher = self._init_searcher(TestSearcher)
+        searcher.concurrent_deadline = 30.0
+        with gevent.Timeout(5.0):
+            result = searcher.search(self._make_query(wifi=[
+                {'mac': wifi.mac} for wifi in wifis]))
+        self.assertAlmostEqual(result['lat'], 3.0)
+        self.assertAlmostEqual(result['accuracy'], 10.0)
+
+    def test_order(self):
+        class TestSlowCoarseSource(PositionSource):
+            fallback_field = 'ipf'
+
+            def search(self, query):
+                gevent.sleep(0.05)
+                return self.result_type(lat=2.0, lon=2.0, accuracy=50000.0)
+
+        class TestSearcher(PositionSearcher):
+            source_classes = (
+                ('slow', TestSlowCoarseSource),
+                ('coarse', TestCoarsePositionSource),
+            )
+
+        wifis = WifiShardFactory.build_batch(2)
+        result = self._search(TestSearcher, wifi=[
+            {'mac': wifi.mac} for wifi in wifis])
+        # equally accurate results are picked in source order
+        self.assertAlmostEqual(result['lat'], 2.0)
+
+    def test_error(self):
+        class TestErrorSource(PositionSource):
+
+            def search(self, query):
+                raise ValueError('source error')
+
+        class TestSearcher(PositionSearcher):
+            source_classes = (
+                ('error', TestErrorSource),
+                ('slow', TestSlowPositionSource),
+            )
+
+        wifis = WifiShardFactory.build_batch(2)
+        with gevent.Timeout(5.0):
+            self.assertRaises(ValueError, self._search, TestSearcher,
+                              wifi=[{'mac': wifi.mac} for wifi in wifis])
+
+    def test_hedge(self):
+        class TestSearcher(PositionSearcher):
+            source_classes = (
+                ('database', TestDatabasePositionSource),
+                ('accurate', TestAccuratePositionSource),
+            )
+
+        wifis = WifiShardFactory.build_batch(2)
+        result = self._search(TestSearcher, wifi=[
+            {'mac': wifi.mac} for wifi in wifis])
+        self.assertAlmostEqual(result['lat'], 4.0)
+        # the database result was good enough
+        self.check_stats(timer=[
+            ('locate.source.timing', 1, ['source:database']),
+            ('locate.source.timing', 0, ['source:accurate']),
+        ])
+
+    def test_hedge_delay(self):
+        class TestSlowDatabaseSource(TestDatabasePositionSource):
+            accuracy = 50000.0
+            delay = 0.1
+
+        class TestSearcher(PositionSearcher):
+            source_classes = (
+                ('database', TestSlowDatabaseSource),
+                ('accurate', TestAccuratePositionSource),
+            )
+
+        wifis = WifiShardFactory.build_batch(2)
+        searcher = self._init_searcher(TestSearcher)
+        searcher.concurrent_hedge = 0.01
+        result = searcher.search(self._make_query(wifi=[
+            {'mac': wifi.mac} for wifi in wifis]))
+        self.assertAlmostEqual(result['lat'], 3.0)
+        self.check_stats(timer=[
+            ('locate.source.timing', 1, ['source:database']),
+            ('locate.source.timing', 1, ['source:accurate']),
+        ])
+
 
 class TestPositionSearcher(SearcherTest):
 
@@ -115,6 +294,98 @@ class TestPositionSearcher(SearcherTest):
         self.assertEqual(result['fallback'], 'ipf')
 
 
+class TestResultCache(SearcherTest):
+
+    settings = {'locate': {'result_cache_size': '10',
+                           'result_cache_expire': '60'}}
+
+    def setUp(self):
+        super(TestResultCache, self).setUp()
+        self.wifi = [{'mac': wifi.mac}
+                     for wifi in WifiShardFactory.build_batch(2)]
+
+    def _make_searcher(self, source):
+        class TestSearcher(PositionSearcher):
+            source_classes = (
+                ('test', source),
+            )
+
+        return self._init_searcher(TestSearcher)
+
+    def test_disabled(self):
+        self.settings = {}
+        searcher = self._make_searcher(TestPositionSource)
+        self.assertTrue(searcher.result_cache is None)
+        searcher.search(self._make_query(wifi=self.wifi))
+        self.check_stats(counter=[('locate.result_cache', 0)])
+
+    def test_cached(self):
+        searcher = self._make_searcher(TestPositionSource)
+        result = searcher.search(self._make_query(wifi=self.wifi))
+        searcher.sources = []
+        self.assertEqual(
+            searcher.search(self._make_query(wifi=self.wifi[::-1])), result)
+        self.check_stats(
+            counter=[('locate.result_cache', 1, ['status:hit']),
+                     ('locate.result_cache', 1, ['status:miss'])],
+            timer=[('locate.result_cache.saved', 1),
+                   ('locate.source.timing', 1, ['source:test'])])
+
+    def test_cached_source_stats(self):
+        class TestSource(PositionSource):
+            source = DataSource.internal
+
+            def search(self, query):
+                result = self.result_type(
+                    lat=1.0, lon=1.0, accuracy=10.0, source=self.source)
+                query.emit_source_stats(self.source, result)
+                return result
+
+        searcher = self._make_searcher(TestSource)
+        searcher.search(self._make_query(wifi=self.wifi))
+        searcher.search(self._make_query(wifi=self.wifi))
+        self.check_stats(counter=[
+            ('locate.result_cache', 1, ['status:hit']),
+            ('locate.source', 2,
+                ['key:test', 'country:none', 'source:internal',
+                 'accuracy:high', 'status:hit']),
+        ])
+
+    def test_no_data(self):
+        searcher = self._make_searcher(TestPositionSource)
+        searcher.search(self._make_query())
+        searcher.search(self._make_query())
+        self.assertEqual(len(searcher.result_cache.data), 0)
+        self.check_stats(counter=[('locate.result_cache', 0)])
+
+    def test_not_found(self):
+        class TestSource(PositionSource):
+
+            def search(self, query):
+                return self.result_type()
+
+        searcher = self._make_searcher(TestSource)
+        self.assertTrue(
+            searcher.search(self._make_query(wifi=self.wifi)) is None)
+        self.assertEqual(len(searcher.result_cache.data), 0)
+
+    def test_geoip(self):
+        class TestSource(PositionSource):
+            source = DataSource.geoip
+
+            def search(self, query):
+                return self.result_type(
+                    lat=1.0, lon=1.0, accuracy=1000.0, source=self.source)
+
+        searcher = self._make_searcher(TestSource)
+        searcher.search(self._make_query(wifi=self.wifi))
+        self.assertEqual(len(searcher.result_cache.data), 0)
+
+    def test_country(self):
+        searcher = self._init_searcher(CountrySearcher)
+        self.assertTrue(searcher.result_cache is None)
+
+
 class TestCountrySearcher(SearcherTest):
 
     def test_result(self):
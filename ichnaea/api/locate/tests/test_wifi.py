@@ -1,16 +1,82 @@
 from datetime import timedelta
 
+import numpy
+
 from ichnaea.api.locate.result import ResultList
 from ichnaea.api.locate.tests.base import BaseSourceTest
-from ichnaea.api.locate.wifi import WifiPositionSource
+from ichnaea.api.locate.wifi import (
+    cluster_elements,
+    filter_bssids_by_similarity,
+    WifiPositionSource,
+)
 from ichnaea.constants import (
     PERMANENT_BLOCKLIST_THRESHOLD,
     WIFI_MIN_ACCURACY,
 )
+from ichnaea.tests.base import TestCase
 from ichnaea.tests.factories import WifiShardFactory
 from ichnaea import util
 
 
+class TestClusterElements(TestCase):
+
+    def test_empty(self):
+        distances = numpy.zeros((0, 0), dtype=numpy.double)
+        self.assertEqual(cluster_elements([], distances, 1.0), [])
+
+    def test_single(self):
+        distances = numpy.zeros((1, 1), dtype=numpy.double)
+        self.assertEqual(cluster_elements(['a'], distances, 1.0), [['a']])
+
+    def test_separate(self):
+        distances = numpy.array([
+            [0.0, 5.0, 5.0],
+            [5.0, 0.0, 5.0],
+            [5.0, 5.0, 0.0],
+        ])
+        self.assertEqual(cluster_elements(['a', 'b', 'c'], distances, 1.0),
+                         [['a'], ['b'], ['c']])
+
+    def test_chain_order(self):
+        # a is close to c, c is close to b, but a is far from b
+        distances = numpy.array([
+            [0.0, 5.0, 1.0, 5.0],
+            [5.0, 0.0, 1.0, 5.0],
+            [1.0, 1.0, 0.0, 5.0],
+            [5.0, 5.0, 5.0, 0.0],
+        ])
+        self.assertEqual(
+            cluster_elements(['a', 'b', 'c', 'd'], distances, 1.0),
+            [['a', 'c', 'b'], ['d']])
+
+
+class TestFilterBssids(TestCase):
+
+    def test_empty(self):
+        self.assertEqual(filter_bssids_by_similarity([]), [])
+
+    def test_dissimilar(self):
+        bssids = ['00000000001f', '000000000058', '0a0000000000']
+        self.assertEqual(filter_bssids_by_similarity(bssids), bssids)
+
+    def test_arithmetic(self):
+        bssids = ['00000000001f', '000000000020', '000000000058']
+        self.assertEqual(filter_bssids_by_similarity(bssids),
+                         ['00000000001f', '000000000058'])
+
+    def test_hamming(self):
+        bssids = ['000000000058', '00000000005c', '00000000001f']
+        self.assertEqual(filter_bssids_by_similarity(bssids),
+                         ['000000000058', '00000000001f'])
+
+    def test_multiple_bytes(self):
+        bssids = ['010000000001', '000000000000']
+        self.assertEqual(filter_bssids_by_similarity(bssids),
+                         ['010000000001'])
+        bssids = ['030000000003', '000000000000']
+        self.assertEqual(filter_bssids_by_similarity(bssids), bssids)
+
+
 class TestWifi(BaseSourceTest):
 
     TestSource = WifiPositionSource
@@ -28,6 +94,45 @@ class TestWifi(BaseSourceTest):
             result, wifi,
             lon=wifi.lon + 0.000005, accuracy=WIFI_MIN_ACCURACY)
 
+    def test_wifi_single_query(self):
+        wifi = WifiShardFactory(mac='101010000001')
+        wifi2 = WifiShardFactory(
+            mac='1010a0000002', lat=wifi.lat, lon=wifi.lon + 0.00001)
+        wifi3 = WifiShardFactory.build(mac='1010f0000003')
+        self.session.flush()
+
+        query = self.model_query(wifis=[wifi, wifi2, wifi3])
+        with self.db_call_checker() as check_db_calls:
+            result = self.source.search(query)
+            check_db_calls(rw=1)
+        self.check_model_result(
+            result, wifi,
+            lon=wifi.lon + 0.000005, accuracy=WIFI_MIN_ACCURACY)
+
+    def test_wifi_prefetch(self):
+        wifi = WifiShardFactory()
+        wifi2 = WifiShardFactory(lat=wifi.lat, lon=wifi.lon + 0.00001)
+        wifi3 = WifiShardFactory(lat=wifi.lat + 1.0, lon=wifi.lon)
+        wifi4 = WifiShardFactory(lat=wifi.lat + 1.0, lon=wifi.lon + 0.00001)
+        self.session.flush()
+
+        query = self.model_query(wifis=[wifi, wifi2])
+        query2 = self.model_query(wifis=[wifi3, wifi4])
+        with self.db_call_checker() as check_db_calls:
+            self.source.prefetch_wifi([query, query2])
+            check_db_calls(rw=1)
+
+        with self.db_call_checker() as check_db_calls:
+            result = self.source.search(query)
+            result2 = self.source.search(query2)
+            check_db_calls(rw=0)
+        self.check_model_result(
+            result, wifi,
+            lon=wifi.lon + 0.000005, accuracy=WIFI_MIN_ACCURACY)
+        self.check_model_result(
+            result2, wifi3,
+            lon=wifi3.lon + 0.000005, accuracy=WIFI_MIN_ACCURACY)
+
     def test_wifi_no_position(self):
         wifi = WifiShardFactory()
         wifi2 = WifiShardFactory(lat=wifi.lat, lon=wifi.lon)
@@ -223,3 +328,52 @@ class TestWifi(BaseSourceTest):
         query = self.model_query(wifis=[wifi, wifis[1]])
         result = self.source.search(query)
         self.check_model_result(result, None)
+
+
+class TestWifiCache(BaseSourceTest):
+
+    TestSource = WifiPositionSource
+    settings = {'wifi_cache_size': '100', 'wifi_cache_expire': '60'}
+
+    def test_cached(self):
+        wifi = WifiShardFactory(radius=200)
+        wifi2 = WifiShardFactory(
+            lat=wifi.lat, lon=wifi.lon + 0.00001, radius=300)
+        wifi3 = WifiShardFactory.build()
+        self.session.flush()
+
+        query = self.model_query(wifis=[wifi, wifi2, wifi3])
+        result = self.source.search(query)
+        self.check_model_result(
+            result, wifi,
+            lon=wifi.lon + 0.000005, accuracy=WIFI_MIN_ACCURACY)
+
+        # Remove the networks from the database, so the second
+        # search has to be answered from the cache.
+        expected = {'lat': wifi.lat, 'lon': wifi.lon + 0.000005,
+                    'accuracy': WIFI_MIN_ACCURACY}
+        self.session.delete(wifi)
+        self.session.delete(wifi2)
+        self.session.flush()
+
+        result = self.source.search(query)
+        self.check_model_result(result, wifi, **expected)
+        self.check_stats(counter=[
+            ('locate.wifi.cache', 1, 3, ['status:miss']),
+            ('locate.wifi.cache', 1, 3, ['status:hit']),
+        ])
+
+    def test_blocked_cached(self):
+        wifi = WifiShardFactory(radius=200)
+        wifi2 = WifiShardFactory(
+            lat=wifi.lat, lon=wifi.lon + 0.00001, radius=300,
+            block_count=PERMANENT_BLOCKLIST_THRESHOLD, block_last=None)
+        self.session.flush()
+
+        query = self.model_query(wifis=[wifi, wifi2])
+        for i in range(2):
+            result = self.source.search(query)
+            self.check_model_result(result, None)
+        self.check_stats(counter=[
+            ('locate.wifi.cache', 1, 2, ['status:hit']),
+        ])
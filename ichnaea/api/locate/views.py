@@ -14,10 +14,8 @@ class BaseLocateView(BaseAPIView):
     not_found = LocationNotFound
     searcher = None  #:
 
-    def locate(self, api_key):
-        request_data, errors = self.preprocess_request()
-
-        query = Query(
+    def prepare_query(self, api_key, request_data):
+        return Query(
             fallback=request_data.get('fallbacks'),
             ip=self.request.client_addr,
             cell=request_data.get('cell'),
@@ -30,6 +28,10 @@ class BaseLocateView(BaseAPIView):
             stats_client=self.stats_client,
         )
 
+    def locate(self, api_key):
+        request_data, errors = self.preprocess_request()
+        query = self.prepare_query(api_key, request_data)
+
         searcher = getattr(self.request.registry, self.searcher)
         return searcher.search(query)
 
@@ -1,12 +1,16 @@
 """Search implementation using a wifi database."""
 
-from collections import defaultdict, namedtuple
+from collections import namedtuple
 from operator import attrgetter
 
 import numpy
-from sqlalchemy.orm import load_only
-from sqlalchemy.sql import or_
 
+from ichnaea.api.locate.cache import (
+    BatchCache,
+    configure_station_cache,
+    DisabledCache,
+    TieredCache,
+)
 from ichnaea.api.locate.constants import (
     DataSource,
     MAX_WIFI_CLUSTER_METERS,
@@ -15,57 +19,68 @@ from ichnaea.api.locate.constants import (
 )
 from ichnaea.api.locate.result import Position
 from ichnaea.api.locate.source import PositionSource
-from ichnaea.constants import (
-    PERMANENT_BLOCKLIST_THRESHOLD,
-    TEMPORARY_BLOCKLIST_DURATION,
-    WIFI_MIN_ACCURACY,
-)
+from ichnaea.constants import WIFI_MIN_ACCURACY
 from ichnaea.geocalc import (
     aggregate_position,
-    distance,
+    distance_matrix,
+)
+from ichnaea.models import (
+    encode_mac,
+    WifiShard,
+)
+from ichnaea.models.station import (
+    station_position,
+    UNKNOWN_STATION,
 )
-from ichnaea.models import WifiShard
-from ichnaea import util
 
 Network = namedtuple('Network', 'mac lat lon radius signal')
+WifiStation = namedtuple('WifiStation', 'mac lat lon radius')
 
+# Number of set bits for each possible byte value.
+_POPCOUNT = numpy.array(
+    [bin(i).count('1') for i in range(256)], dtype=numpy.int16)
 
-def cluster_elements(items, distance_fn, threshold):
+
+def cluster_elements(items, distances, threshold):
     """
-    Generic pairwise clustering routine.
+    Generic pairwise single-linkage clustering routine.
+
+    Clusters are grown one at a time, starting with the first not yet
+    clustered element and always adding the lowest indexed element
+    which is close enough to any member of the cluster. This retains
+    both the order of the clusters and the order of elements inside
+    each cluster, relative to the order of the passed in items.
 
     :param items: A list of elements to cluster.
-    :param distance_fn: A pairwise distance function over elements.
+    :param distances: A square numpy array of pairwise distances
+                      between the elements.
     :param threshold: A numeric threshold for clustering;
                       clusters P, Q will be joined if
-                      distance_fn(a,b) <= threshold,
+                      distances[a][b] <= threshold,
                       for any a in P, b in Q.
 
     :returns: A list of lists of elements, each sub-list being a cluster.
     """
-    distance_matrix = [[distance_fn(a, b) for a in items] for b in items]
-    clusters = [[i] for i in range(len(items))]
-
-    def cluster_distance(a, b):
-        return min([distance_matrix[i][j] for i in a for j in b])
-
-    merged_one = True
-    while merged_one:
-        merged_one = False
-        for i in range(len(clusters)):
-            if merged_one:
-                break
-            for j in range(len(clusters)):
-                if merged_one:
-                    break
-                if i == j:
-                    continue
-                a = clusters[i]
-                b = clusters[j]
-                if cluster_distance(a, b) <= threshold:
-                    clusters.pop(j)
-                    a.extend(b)
-                    merged_one = True
+    if not len(items):
+        return []
+
+    neighbors = numpy.asarray(distances) <= threshold
+    unclustered = numpy.ones(len(items), dtype=numpy.bool_)
+    clusters = []
+    for start in range(len(items)):
+        if not unclustered[start]:
+            continue
+        unclustered[start] = False
+        cluster = [start]
+        candidates = neighbors[start] & unclustered
+        while candidates.any():
+            # argmax returns the index of the first True value
+            i = int(candidates.argmax())
+            unclustered[i] = False
+            cluster.append(i)
+            candidates |= neighbors[i]
+            candidates &= unclustered
+        clusters.append(cluster)
 
     return [[items[i] for i in c] for c in clusters]
 
@@ -77,30 +92,22 @@ def filter_bssids_by_similarity(bssids, distance_threshold=2):
     hard-wired to 2, meaning that two BSSIDs are clustered together
     if they are within a numeric difference of 2 of one another or
     a hamming distance of 2.
-    """
-
-    def bytes_of_hex_string(hs):
-        return [int(hs[i:i + 2], 16) for i in range(0, len(hs), 2)]
-
-    def hamming_distance(a, b):
-        h = 0
-        v = a ^ b
-        while v:
-            h += 1
-            v &= v - 1
-        return h
-
-    def hamming_or_arithmetic_byte_difference(a, b):
-        return min(abs(a - b), hamming_distance(a, b))
 
-    def bssid_difference(a, b):
-        abytes = bytes_of_hex_string(a)
-        bbytes = bytes_of_hex_string(b)
-        return sum(hamming_or_arithmetic_byte_difference(a, b) for
-                   (a, b) in zip(abytes, bbytes))
-
-    clusters = cluster_elements(
-        bssids, bssid_difference, distance_threshold)
+    The byte-wise differences are calculated for all pairs of BSSIDs
+    at once, based on a (n, 6) array of the packed MAC address bytes.
+    """
+    macs = numpy.frombuffer(
+        b''.join([encode_mac(bssid) for bssid in bssids]),
+        dtype=numpy.uint8).reshape(-1, 6)
+
+    left = macs[:, numpy.newaxis, :]
+    right = macs[numpy.newaxis, :, :]
+    hamming = _POPCOUNT[left ^ right]
+    arithmetic = numpy.abs(
+        left.astype(numpy.int16) - right.astype(numpy.int16))
+    differences = numpy.minimum(hamming, arithmetic).sum(axis=2)
+
+    clusters = cluster_elements(bssids, differences, distance_threshold)
     return [cluster[0] for cluster in clusters]
 
 
@@ -130,11 +137,12 @@ def get_clusters(wifis, lookups):
     # Sort networks by signal strengths in query.
     wifi_networks.sort(key=attrgetter('signal'), reverse=True)
 
-    def wifi_distance(one, two):
-        return distance(one.lat, one.lon, two.lat, two.lon)
-
+    positions = numpy.array(
+        [(network.lat, network.lon) for network in wifi_networks],
+        dtype=numpy.double)
     clusters = cluster_elements(
-        wifi_networks, wifi_distance, MAX_WIFI_CLUSTER_METERS)
+        wifi_networks, distance_matrix(positions, positions),
+        MAX_WIFI_CLUSTER_METERS)
 
     # Only consider clusters that have at least 2 found networks
     # inside them. Otherwise someone could use a combination of
@@ -189,40 +197,63 @@ def aggregate_cluster_position(cluster, result_type):
     return result_type(lat=lat, lon=lon, accuracy=accuracy)
 
 
-def query_database(query, raven_client):
-    macs = [lookup.mac for lookup in query.wifi]
+def query_database(query, raven_client, cache=None):
+    """
+    Look up the positions of all the WiFi networks in the query.
+
+    Positions are first looked up in the passed in station cache and
+    only the networks missing from the cache are queried from the
+    database. The database results, including networks which weren't
+    found, are then stored in the cache.
+    """
+    macs = []
+    for lookup in query.wifi:
+        if lookup.mac not in macs:
+            macs.append(lookup.mac)
     if not macs:  # pragma: no cover
         return []
 
+    positions = _query_positions(query.session, macs, raven_client, cache)
+
     result = []
-    today = util.utcnow().date()
-    temp_blocked = today - TEMPORARY_BLOCKLIST_DURATION
+    for mac in macs:
+        position = positions.get(mac)
+        if position is not None and position.usable():
+            result.append(WifiStation(
+                mac=mac, lat=position.lat,
+                lon=position.lon, radius=position.radius))
+    return result
+
+
+def _query_positions(session, macs, raven_client, cache=None):
+    if cache is None:
+        cache = DisabledCache()
+
+    positions = {}
 
     try:
-        load_fields = ('lat', 'lon', 'radius')
-        shards = defaultdict(list)
-        for mac in macs:
-            shards[WifiShard.shard_model(mac)].append(mac)
-
-        for shard, shard_macs in shards.items():
-            rows = (
-                query.session.query(shard)
-                             .filter(shard.mac.in_(shard_macs))
-                             .filter(shard.lat.isnot(None))
-                             .filter(shard.lon.isnot(None))
-                             .filter(or_(
-                                 shard.block_count.is_(None),
-                                 shard.block_count <
-                                     PERMANENT_BLOCKLIST_THRESHOLD))
-                             .filter(or_(
-                                 shard.block_last.is_(None),
-                                 shard.block_last < temp_blocked))
-                             .options(load_only(*load_fields))
-            ).all()
-            result.extend(list(rows))
+        positions.update(cache.get(macs))
+
+        missing = [mac for mac in macs if mac not in positions]
+        new_positions = {}
+        if missing:
+            load_fields = ('lat', 'lon', 'radius', 'block_count', 'block_last')
+            rows = WifiShard.querymacs(session, missing, fields=load_fields)
+            for row in rows:
+                new_positions[row.mac] = station_position(
+                    row.lat, row.lon, row.radius,
+                    block_count=row.block_count,
+                    block_last=row.block_last)
+            for mac in missing:
+                if mac not in new_positions:
+                    new_positions[mac] = UNKNOWN_STATION
+
+        positions.update(new_positions)
+        cache.set(new_positions)
     except Exception:
         raven_client.captureException()
-    return result
+
+    return positions
 
 
 class WifiPositionMixin(object):
@@ -233,16 +264,43 @@ class WifiPositionMixin(object):
 
     raven_client = None
     result_type = Position
+    uses_database = True
+
+    def __init__(self, settings, *args, **kw):
+        super(WifiPositionMixin, self).__init__(settings, *args, **kw)
+        self.wifi_cache = configure_station_cache(
+            settings, self.raven_client, self.redis_client,
+            self.stats_client, 'wifi')
 
     def should_search_wifi(self, query, results):
         return bool(query.wifi)
 
+    def prefetch_wifi(self, queries):
+        queries = [query for query in queries if query.wifi]
+        if not queries:
+            return
+
+        macs = []
+        seen = set()
+        for query in queries:
+            for lookup in query.wifi:
+                if lookup.mac not in seen:
+                    seen.add(lookup.mac)
+                    macs.append(lookup.mac)
+
+        cache = TieredCache(BatchCache(), self.wifi_cache)
+        # All queries of a batch share the same database session.
+        _query_positions(queries[0].session, macs, self.raven_client, cache)
+        for query in queries:
+            query.station_caches['wifi'] = cache
+
     def search_wifi(self, query):
         result = self.result_type()
         if not query.wifi:
             return result
 
-        wifis = query_database(query, self.raven_client)
+        cache = query.station_caches.get('wifi', self.wifi_cache)
+        wifis = query_database(query, self.raven_client, cache)
         clusters = get_clusters(wifis, query.wifi)
         if clusters:
             cluster = pick_best_cluster(clusters)
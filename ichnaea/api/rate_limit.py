@@ -1,27 +1,150 @@
 """A Redis based rate limit implementation."""
+import hashlib
+import threading
+
 from redis import RedisError
+from redis.exceptions import NoScriptError
+from repoze.lru import LRUCache
+
+from ichnaea.cache import RedisBatch
+
+# Reserve up to ARGV[3] requests from the limit of ARGV[1] requests,
+# but at least the ARGV[2] requests needed right now. Returns the
+# number of reserved requests, or zero if the limit is exceeded,
+# in which case the needed requests are still counted.
+RESERVE_SCRIPT = '''\
+local current = tonumber(redis.call('GET', KEYS[1]) or '0')
+local available = tonumber(ARGV[1]) - current
+local needed = tonumber(ARGV[2])
+local reserved = 0
+if available >= needed then
+    reserved = math.min(math.max(needed, tonumber(ARGV[3])), available)
+    redis.call('INCRBY', KEYS[1], reserved)
+else
+    redis.call('INCRBY', KEYS[1], needed)
+end
+redis.call('EXPIRE', KEYS[1], ARGV[4])
+return reserved
+'''
+RESERVE_SCRIPT_SHA = hashlib.sha1(RESERVE_SCRIPT.encode('ascii')).hexdigest()
+
+#: Reserved chunks are limited to this fraction of the rate limit.
+CHUNK_LIMIT_RATIO = 100
 
 
-def rate_limit_exceeded(redis_client, key,
-                        maxreq=0, expire=86400, on_error=False):
+def configure_rate_limiter(settings, redis_client):
     """
-    Return `True` if the rate limit is exceeded otherwise `False`.
-
-    :param redis_client: A :class:`ichnaea.cache.RedisClient`
-    :param key: The Redis key to be used.
-    :param maxreq: The maximum number of requests.
-    :param expire: How many seconds should the Redis key be retained.
-    :param on_error: If Redis could not be connected, report this
-                     as the return status.
+    Configure and return a :class:`~ichnaea.api.rate_limit.RateLimiter`,
+    reserving requests in chunks of the `ratelimit_chunk` setting.
+    """
+    if not settings:
+        settings = {}
+    return RateLimiter(
+        redis_client, chunk=int(settings.get('ratelimit_chunk', 1)))
+
+
+class RateLimiter(object):
     """
-    if maxreq:
+    A RateLimiter counts requests per key in Redis, reserving chunks
+    of requests and counting them down locally.
+
+    Reservations are made atomically via a Lua script and never exceed
+    the limit. Instead each process can hold up to `chunk - 1` reserved
+    but unused requests per key, which are counted in Redis and not
+    available to other processes. The chunk is limited to a
+    :data:`~ichnaea.api.rate_limit.CHUNK_LIMIT_RATIO` fraction of each
+    limit. With a `chunk` of one or for small limits, each request is
+    counted in Redis.
+    """
+
+    def __init__(self, redis_client, chunk=1, size=1000):
+        self.redis_client = redis_client
+        self.chunk = max(int(chunk), 1)
+        # The keys contain a time period, so old entries are simply
+        # evicted from the bounded cache.
+        self._reserved = LRUCache(size)
+        # Guards taking and returning local reservations, as other
+        # greenlets run while waiting for Redis.
+        self._lock = threading.Lock()
+
+    def _incr(self, batch, key, count, expire):
+        def add_commands(pipe):
+            pipe.incr(key, count)
+            pipe.expire(key, expire)
+
+        return int(batch.execute(add_commands)[0])
+
+    def _reserve(self, batch, key, args):
+        def add_commands(pipe):
+            pipe.evalsha(RESERVE_SCRIPT_SHA, 1, key, *args)
+
+        try:
+            return int(batch.execute(add_commands)[0])
+        except NoScriptError:
+            # The script isn't yet loaded into this Redis server.
+            self.redis_client.script_load(RESERVE_SCRIPT)
+            return int(batch.execute(add_commands)[0])
+
+    def _take(self, key, count):
+        # Take up to count requests from the local reservation,
+        # or the entire reservation if it isn't enough.
+        with self._lock:
+            reserved = self._reserved.get(key, 0)
+            taken = count if reserved >= count else reserved
+            self._reserved.put(key, reserved - taken)
+            return taken
+
+    def _give_back(self, key, count):
+        if count > 0:
+            with self._lock:
+                self._reserved.put(key, self._reserved.get(key, 0) + count)
+
+    def exceeded(self, key, maxreq=0, expire=86400, on_error=False,
+                 count=1, batch=None):
+        """
+        Return `True` if the rate limit is exceeded otherwise `False`.
+
+        :param key: The Redis key to be used.
+        :param maxreq: The maximum number of requests.
+        :param expire: How many seconds should the Redis key be retained.
+        :param on_error: If Redis could not be connected, report this
+                         as the return status.
+        :param count: The number of requests to add to the rate limit.
+        :param batch: A request specific :class:`ichnaea.cache.RedisBatch`,
+                      whose deferred commands are sent along with the
+                      reservation.
+        """
+        if not maxreq:
+            return False
+
+        if batch is None:
+            batch = RedisBatch(self.redis_client)
+
+        chunk = min(self.chunk, maxreq // CHUNK_LIMIT_RATIO)
+        if chunk <= 1:
+            try:
+                return self._incr(batch, key, count, expire) > maxreq
+            except RedisError:  # pragma: no cover
+                # If we cannot connect to Redis, return error value.
+                return on_error
+
+        reserved = self._take(key, count)
+        if reserved == count:
+            return False
+
         try:
-            with redis_client.pipeline() as pipe:
-                pipe.incr(key, 1)
-                pipe.expire(key, expire)
-                count, expire = pipe.execute()
-                return count > maxreq
+            reserved += self._reserve(
+                batch, key, [maxreq, count - reserved, chunk, expire])
         except RedisError:  # pragma: no cover
             # If we cannot connect to Redis, return error value.
+            self._give_back(key, reserved)
             return on_error
-    return False
+
+        if reserved < count:
+            # The limit is exceeded, keep the remaining reservation
+            # for smaller requests.
+            self._give_back(key, reserved)
+            return True
+
+        self._give_back(key, reserved - count)
+        return False
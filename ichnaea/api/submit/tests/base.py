@@ -6,6 +6,7 @@ from ichnaea.api.exceptions import (
     ParseError,
     ServiceUnavailable,
 )
+from ichnaea.data.tasks import update_incoming
 from ichnaea.models import Radio
 from ichnaea import util
 
@@ -104,6 +105,22 @@ class BaseSubmitTest(object):
             ('request', [self.metric_path, 'method:post', 'status:503']),
         ])
 
+    def test_incoming_queue(self):
+        incoming_queue = self.celery_app.data_queues['update_incoming']
+        self.app.app.registry.incoming_queue = incoming_queue
+        try:
+            self._post_one_cell(nickname=self.nickname)
+        finally:
+            self.app.app.registry.incoming_queue = None
+
+        self._assert_queue_size(0)
+        self.assertEqual(incoming_queue.size(), 1)
+        self.assertEqual(update_incoming.delay().get(), 1)
+        self.assertEqual(incoming_queue.size(), 0)
+        item = self.queue.dequeue(self.queue.queue_key())[0]
+        self.assertEqual(item['metadata']['nickname'], self.nickname)
+        self.check_stats(counter=['data.batch.upload'])
+
     def test_headers_email_without_nickname(self):
         self._post_one_cell(nickname=None, email=self.email)
         item = self.queue.dequeue(self.queue.queue_key())[0]
@@ -24,6 +24,7 @@ class BaseSubmitView(BaseAPIView):
 
     def __init__(self, request):
         super(BaseSubmitView, self).__init__(request)
+        self.incoming_queue = request.registry.incoming_queue
         self.email, self.nickname = self.get_request_user_data()
 
     def decode_request_header(self, header_name):
@@ -64,20 +65,31 @@ class BaseSubmitView(BaseAPIView):
 
         # data pipeline using new internal data format
         reports = request_data['items']
-        batch_size = 50
-        for i in range(0, len(reports), batch_size):
-            batch = reports[i:i + batch_size]
-            # insert reports, expire the task if it wasn't processed
-            # after six hours to avoid queue overload
-            queue_reports.apply_async(
-                kwargs={
-                    'api_key': api_key.valid_key,
-                    'email': self.email,
-                    'ip': self.request.client_addr,
-                    'nickname': self.nickname,
-                    'reports': batch,
-                },
-                expires=21600)
+        metadata = {
+            'api_key': api_key.valid_key,
+            'email': self.email,
+            'ip': self.request.client_addr,
+            'nickname': self.nickname,
+        }
+
+        if self.incoming_queue is not None:
+            # add each report with its metadata to the incoming queue
+            # in one round trip, together with any other pending Redis
+            # commands
+            items = [{'report': report, 'metadata': metadata}
+                     for report in reports]
+
+            def add_commands(pipe):
+                self.incoming_queue.enqueue(items, pipe=pipe)
+
+            self.redis_batch.execute(add_commands)
+        else:
+            batch_size = 50
+            for i in range(0, len(reports), batch_size):
+                upload = dict(metadata, reports=reports[i:i + batch_size])
+                # insert reports, expire the task if it wasn't processed
+                # after six hours to avoid queue overload
+                queue_reports.apply_async(kwargs=upload, expires=21600)
 
         self.emit_upload_metrics(len(reports), api_key)
 
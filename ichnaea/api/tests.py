@@ -1,12 +1,29 @@
 import time
 
 from colander import MappingSchema, String
+import gevent
+import mock
 from pyramid.request import Request
 
 from ichnaea.api import exceptions as api_exceptions
-from ichnaea.api.rate_limit import rate_limit_exceeded
+from ichnaea.api.key import (
+    ApiKeyCache,
+    ApiKeySnapshot,
+    configure_api_key_cache,
+)
+from ichnaea.api.rate_limit import (
+    configure_rate_limiter,
+    RateLimiter,
+)
 from ichnaea.api.schema import InternalSchemaNode, InternalMapping
+from ichnaea.api.unique_ip import (
+    configure_unique_ip_buffer,
+    UniqueIPBuffer,
+)
+from ichnaea.cache import RedisBatch
+from ichnaea.models import ApiKey
 from ichnaea.tests.base import (
+    DBTestCase,
     RedisTestCase,
     TestCase,
 )
@@ -73,40 +90,213 @@ class TestExceptions(TestCase):
         self.assertTrue('parseError' in response.text)
 
 
-class TestLimiter(RedisTestCase):
-
-    def test_limiter_maxrequests(self):
-        api_key = 'key_a'
-        maxreq = 5
-        expire = 1
-        for i in range(maxreq):
-            self.assertFalse(rate_limit_exceeded(
-                self.redis_client,
-                api_key,
-                maxreq=maxreq,
-                expire=expire,
-            ))
-        self.assertTrue(rate_limit_exceeded(
-            self.redis_client,
-            api_key,
-            maxreq=maxreq,
-            expire=expire,
-        ))
-
-    def test_limiter_expiry(self):
-        api_key = 'key_b'
-        maxreq = 100
-        expire = 1
-        self.assertFalse(rate_limit_exceeded(
-            self.redis_client,
-            api_key,
-            maxreq=maxreq,
-            expire=expire,
-        ))
+class TestRateLimiter(RedisTestCase):
+
+    def _counter(self, key):
+        return int(self.redis_client.get(key))
+
+    def test_configure(self):
+        limiter = configure_rate_limiter(None, self.redis_client)
+        self.assertEqual(limiter.chunk, 1)
+        limiter = configure_rate_limiter(
+            {'ratelimit_chunk': '10'}, self.redis_client)
+        self.assertEqual(limiter.chunk, 10)
+
+    def test_maxrequests(self):
+        limiter = RateLimiter(self.redis_client)
+        for i in range(5):
+            self.assertFalse(limiter.exceeded('key_a', maxreq=5))
+        self.assertEqual(self._counter('key_a'), 5)
+        self.assertTrue(limiter.exceeded('key_a', maxreq=5))
+        # requests over the limit are still counted
+        self.assertEqual(self._counter('key_a'), 6)
+
+    def test_expiry(self):
+        limiter = RateLimiter(self.redis_client)
+        self.assertFalse(limiter.exceeded('key_b', maxreq=1, expire=1))
         time.sleep(1)
-        self.assertFalse(rate_limit_exceeded(
-            self.redis_client,
-            api_key,
-            maxreq=maxreq,
-            expire=expire,
-        ))
+        self.assertFalse(limiter.exceeded('key_b', maxreq=1, expire=1))
+
+    def test_no_limit(self):
+        limiter = RateLimiter(self.redis_client)
+        self.assertFalse(limiter.exceeded('key_b', maxreq=0))
+        self.assertFalse(self.redis_client.exists('key_b'))
+
+    def test_chunk(self):
+        self.redis_client.set('key_c', 500)
+        limiter = RateLimiter(self.redis_client, chunk=5)
+        self.assertFalse(limiter.exceeded('key_c', maxreq=507, expire=60))
+        self.assertEqual(self._counter('key_c'), 505)
+        self.assertTrue(0 < self.redis_client.ttl('key_c') <= 60)
+        for i in range(4):
+            self.assertFalse(limiter.exceeded('key_c', maxreq=507))
+        self.assertEqual(self._counter('key_c'), 505)
+        # only the remaining two requests are reserved
+        self.assertFalse(limiter.exceeded('key_c', maxreq=507))
+        self.assertEqual(self._counter('key_c'), 507)
+        self.assertFalse(limiter.exceeded('key_c', maxreq=507))
+        self.assertTrue(limiter.exceeded('key_c', maxreq=507))
+        self.assertEqual(self._counter('key_c'), 508)
+
+    def test_chunk_limited(self):
+        limiter = RateLimiter(self.redis_client, chunk=10)
+        self.assertFalse(limiter.exceeded('key_c', maxreq=300))
+        # the chunk is limited to a fraction of the limit
+        self.assertEqual(self._counter('key_c'), 3)
+
+    def test_chunk_shared(self):
+        self.redis_client.set('key_d', 594)
+        limiter1 = RateLimiter(self.redis_client, chunk=4)
+        limiter2 = RateLimiter(self.redis_client, chunk=4)
+        self.assertFalse(limiter1.exceeded('key_d', maxreq=600))
+        self.assertFalse(limiter2.exceeded('key_d', maxreq=600))
+        self.assertEqual(self._counter('key_d'), 600)
+        self.assertTrue(limiter2.exceeded('key_d', maxreq=600, count=2))
+        self.assertFalse(limiter2.exceeded('key_d', maxreq=600))
+        self.assertFalse(limiter1.exceeded('key_d', maxreq=600, count=3))
+        self.assertTrue(limiter1.exceeded('key_d', maxreq=600))
+
+    def test_chunk_small_limit(self):
+        limiter1 = RateLimiter(self.redis_client, chunk=5)
+        limiter2 = RateLimiter(self.redis_client, chunk=5)
+        # small limits aren't reserved in chunks, so one process
+        # can use up all the requests not used by the other one
+        self.assertFalse(limiter1.exceeded('key_e', maxreq=10))
+        for i in range(9):
+            self.assertFalse(limiter2.exceeded('key_e', maxreq=10))
+        self.assertEqual(self._counter('key_e'), 10)
+        self.assertTrue(limiter1.exceeded('key_e', maxreq=10))
+        self.assertTrue(limiter2.exceeded('key_e', maxreq=10))
+        self.assertEqual(self._counter('key_e'), 12)
+
+    def test_chunk_concurrent(self):
+        limiter = RateLimiter(self.redis_client, chunk=10)
+        reserve = limiter._reserve
+
+        def slow_reserve(*args):
+            gevent.sleep(0.01)
+            return reserve(*args)
+
+        with mock.patch.object(limiter, '_reserve', side_effect=slow_reserve):
+            greenlets = [gevent.spawn(limiter.exceeded, 'key_f', maxreq=1005)
+                         for i in range(20)]
+            gevent.joinall(greenlets)
+            self.assertEqual([g.value for g in greenlets], [False] * 20)
+            self.assertFalse(limiter.exceeded('key_f', maxreq=1005))
+
+        # all concurrent reservations are kept and used up
+        self.assertEqual(self._counter('key_f'), 200)
+        self.assertEqual(limiter._reserved.get('key_f'), 179)
+
+
+class TestUniqueIPBuffer(RedisTestCase):
+
+    def test_configure(self):
+        buf = configure_unique_ip_buffer(None, self.redis_client)
+        self.assertEqual((buf.flush_size, buf.flush_interval), (1, 0))
+        buf = configure_unique_ip_buffer(
+            {'unique_ip_flush_size': '100', 'unique_ip_flush_interval': '5'},
+            self.redis_client)
+        self.assertEqual((buf.flush_size, buf.flush_interval), (100, 5))
+
+    def test_unbuffered(self):
+        buf = UniqueIPBuffer(self.redis_client)
+        buf.add('apiuser:a', '127.0.0.1')
+        self.assertEqual(len(buf), 0)
+        self.assertEqual(self.redis_client.pfcount('apiuser:a'), 1)
+        self.assertTrue(0 < self.redis_client.ttl('apiuser:a') <= 691200)
+
+    def test_flush_size(self):
+        buf = UniqueIPBuffer(self.redis_client, flush_size=3)
+        buf.add('apiuser:a', '127.0.0.1')
+        buf.add('apiuser:a', '127.0.0.1')
+        buf.add('apiuser:b', '127.0.0.1')
+        self.assertEqual(len(buf), 2)
+        self.assertEqual(self.redis_client.keys('apiuser:*'), [])
+        buf.add('apiuser:a', '127.0.0.2')
+        self.assertEqual(len(buf), 0)
+        self.assertEqual(self.redis_client.pfcount('apiuser:a'), 2)
+        self.assertEqual(self.redis_client.pfcount('apiuser:b'), 1)
+
+    def test_flush_interval(self):
+        buf = UniqueIPBuffer(self.redis_client, flush_size=100,
+                             flush_interval=1)
+        buf.add('apiuser:a', '127.0.0.1')
+        self.assertEqual(len(buf), 1)
+        time.sleep(1)
+        buf.add('apiuser:a', '127.0.0.2')
+        self.assertEqual(len(buf), 0)
+        self.assertEqual(self.redis_client.pfcount('apiuser:a'), 2)
+
+    def test_flush(self):
+        buf = UniqueIPBuffer(self.redis_client, flush_size=100)
+        buf.flush()
+        buf.add('apiuser:a', '127.0.0.1')
+        buf.flush()
+        self.assertEqual(len(buf), 0)
+        self.assertEqual(self.redis_client.pfcount('apiuser:a'), 1)
+
+    def test_batch(self):
+        batch = RedisBatch(self.redis_client)
+        buf = UniqueIPBuffer(self.redis_client)
+        buf.add('apiuser:a', '127.0.0.1', batch=batch)
+        self.assertEqual(self.redis_client.keys('apiuser:*'), [])
+        batch.execute()
+        self.assertEqual(self.redis_client.pfcount('apiuser:a'), 1)
+
+
+class TestApiKeyCache(DBTestCase):
+
+    def setUp(self):
+        super(TestApiKeyCache, self).setUp()
+        self.session.add(ApiKey(valid_key='cached', maxreq=10, log=True,
+                                allow_fallback=True, shortname='short'))
+        self.session.flush()
+
+    def test_configure(self):
+        cache = configure_api_key_cache(None, self.stats_client)
+        self.assertTrue(cache._cache is None)
+        cache = configure_api_key_cache(
+            {'key_cache_size': '10', 'key_cache_expire': '60'},
+            self.stats_client)
+        self.assertFalse(cache._cache is None)
+
+    def test_disabled(self):
+        cache = ApiKeyCache(self.stats_client, size=0)
+        api_key = cache.get(self.session, 'cached')
+        self.assertEqual(api_key, ApiKeySnapshot(
+            valid_key='cached', maxreq=10, log=True,
+            allow_fallback=True, shortname='short'))
+        self.assertEqual(api_key.name, 'short')
+        self.assertEqual(cache.get(self.session, 'unknown'), None)
+        self.check_stats(total=0)
+
+    def test_cached(self):
+        cache = ApiKeyCache(self.stats_client)
+        api_key = cache.get(self.session, 'cached')
+        self.session.query(ApiKey).delete()
+        self.session.flush()
+        self.assertEqual(cache.get(self.session, 'cached'), api_key)
+        cache.clear()
+        self.assertEqual(cache.get(self.session, 'cached'), None)
+        self.check_stats(counter=[
+            ('api.key.cache', 1, ['status:hit']),
+            ('api.key.cache', 2, ['status:miss']),
+        ])
+
+    def test_invalid(self):
+        cache = ApiKeyCache(self.stats_client)
+        self.assertEqual(cache.get(self.session, 'unknown'), None)
+        self.session.add(ApiKey(valid_key='unknown'))
+        self.session.flush()
+        self.assertEqual(cache.get(self.session, 'unknown'), None)
+        self.check_stats(counter=[
+            ('api.key.cache', 1, ['status:hit']),
+            ('api.key.cache', 1, ['status:miss']),
+        ])
+
+    def test_empty(self):
+        api_key = ApiKeySnapshot.empty(log=False)
+        self.assertEqual(api_key.valid_key, None)
+        self.assertEqual(api_key.name, None)
+        self.assertFalse(api_key.log)
@@ -0,0 +1,94 @@
+"""
+Buffered logging of the unique IP addresses of API users into Redis
+HyperLogLog structures.
+"""
+
+from collections import defaultdict
+import time
+
+from ichnaea.cache import RedisBatch
+
+UNIQUE_IP_EXPIRE = 691200  #: Retain the Redis keys for 8 days.
+
+
+def configure_unique_ip_buffer(settings, redis_client):
+    """
+    Configure and return a :class:`~ichnaea.api.unique_ip.UniqueIPBuffer`,
+    based on the `unique_ip_flush_size` and `unique_ip_flush_interval`
+    settings.
+    """
+    if not settings:
+        settings = {}
+    return UniqueIPBuffer(
+        redis_client,
+        flush_size=int(settings.get('unique_ip_flush_size', 1)),
+        flush_interval=int(settings.get('unique_ip_flush_interval', 0)))
+
+
+class UniqueIPBuffer(object):
+    """
+    A UniqueIPBuffer collects the IP addresses per Redis key in-process
+    and adds them in one PFADD command per key.
+
+    The buffer is flushed once it holds `flush_size` distinct entries
+    or `flush_interval` seconds after the last flush, whichever comes
+    first. With a `flush_size` of one, each IP address is sent at once.
+    """
+
+    def __init__(self, redis_client, flush_size=1, flush_interval=0):
+        self.redis_client = redis_client
+        self.flush_size = max(int(flush_size), 1)
+        self.flush_interval = int(flush_interval)
+        self._pending = defaultdict(set)
+        self._size = 0
+        self._last_flush = time.time()
+
+    def __len__(self):
+        return self._size
+
+    def _flush_due(self):
+        if self._size >= self.flush_size:
+            return True
+        if self.flush_interval:
+            return time.time() - self._last_flush >= self.flush_interval
+        return False
+
+    def _take(self):
+        pending, self._pending = self._pending, defaultdict(set)
+        self._size = 0
+        self._last_flush = time.time()
+
+        def add_commands(pipe):
+            for key, values in pending.items():
+                pipe.pfadd(key, *values)
+                pipe.expire(key, UNIQUE_IP_EXPIRE)
+
+        return add_commands
+
+    def add(self, key, ip, batch=None):
+        """
+        Add the IP address to the HyperLogLog stored at the Redis key.
+
+        :param batch: A request specific :class:`ichnaea.cache.RedisBatch`,
+                      into which the buffered commands are deferred
+                      once the buffer is due to be flushed.
+        """
+        values = self._pending[key]
+        if ip not in values:
+            values.add(ip)
+            self._size += 1
+
+        if self._flush_due():
+            if batch is None:
+                batch = RedisBatch(self.redis_client)
+                batch.defer(self._take())
+                batch.execute()
+            else:
+                batch.defer(self._take())
+
+    def flush(self):
+        """Send all buffered IP addresses to Redis."""
+        if self._size:
+            batch = RedisBatch(self.redis_client)
+            batch.defer(self._take())
+            batch.execute()
@@ -11,8 +11,8 @@ from ichnaea.api.exceptions import (
     InvalidAPIKey,
     ParseError,
 )
-from ichnaea.api.rate_limit import rate_limit_exceeded
-from ichnaea.models.api import ApiKey
+from ichnaea.api.key import ApiKeySnapshot
+from ichnaea.cache import RedisBatch
 from ichnaea import util
 from ichnaea.webapp.view import BaseView
 
@@ -33,9 +33,13 @@ class BaseAPIView(BaseView):
 
     def __init__(self, request):
         super(BaseAPIView, self).__init__(request)
+        self.api_key_cache = request.registry.api_key_cache
+        self.rate_limiter = request.registry.rate_limiter
         self.raven_client = request.registry.raven_client
         self.redis_client = request.registry.redis_client
         self.stats_client = request.registry.stats_client
+        self.unique_ip_buffer = request.registry.unique_ip_buffer
+        self.redis_batch = RedisBatch(self.redis_client)
 
     def log_unique_ip(self, apikey_shortname):
         try:
@@ -48,10 +52,7 @@ class BaseAPIView(BaseView):
                 api_name=apikey_shortname,
                 date=util.utcnow().date().strftime('%Y-%m-%d'),
             )
-            with self.redis_client.pipeline() as pipe:
-                pipe.pfadd(redis_key, ip)
-                pipe.expire(redis_key, 691200)  # 8 days
-                pipe.execute()
+            self.unique_ip_buffer.add(redis_key, ip, batch=self.redis_batch)
 
     def log_count(self, apikey_shortname, apikey_log):
         self.stats_client.incr(
@@ -65,6 +66,13 @@ class BaseAPIView(BaseView):
             except Exception:  # pragma: no cover
                 self.raven_client.captureException()
 
+    def rate_limit_key(self, api_key_text):
+        """Return the Redis key counting today's requests for the key."""
+        return 'apilimit:{key}:{time}'.format(
+            key=api_key_text,
+            time=util.utcnow().strftime('%Y%m%d')
+        )
+
     def check(self):
         api_key = None
         api_key_text = self.request.GET.get('key', None)
@@ -76,8 +84,8 @@ class BaseAPIView(BaseView):
 
         if api_key_text is not None:
             try:
-                session = self.request.db_ro_session
-                api_key = session.query(ApiKey).get(api_key_text)
+                api_key = self.api_key_cache.get(
+                    self.request.db_ro_session, api_key_text)
             except Exception:  # pragma: no cover
                 # if we cannot connect to backend DB, skip api key check
                 self.raven_client.captureException()
@@ -85,15 +93,10 @@ class BaseAPIView(BaseView):
         if api_key is not None:
             self.log_count(api_key.name, api_key.log)
 
-            rate_key = 'apilimit:{key}:{time}'.format(
-                key=api_key_text,
-                time=util.utcnow().strftime('%Y%m%d')
-            )
-
-            should_limit = rate_limit_exceeded(
-                self.redis_client,
-                rate_key,
-                maxreq=api_key.maxreq
+            should_limit = self.rate_limiter.exceeded(
+                self.rate_limit_key(api_key_text),
+                maxreq=api_key.maxreq,
+                batch=self.redis_batch,
             )
 
             if should_limit:
@@ -106,7 +109,7 @@ class BaseAPIView(BaseView):
 
         # If we failed to look up an ApiKey, create an empty one
         # rather than passing None through
-        api_key = api_key or ApiKey(valid_key=None)
+        api_key = api_key or ApiKeySnapshot.empty()
         return self.view(api_key)
 
     def preprocess_request(self):
@@ -138,10 +141,30 @@ class BaseAPIView(BaseView):
 
         return (validated_data, errors)
 
+    def flush_redis(self):
+        """
+        Send all remaining deferred Redis commands and report the time
+        spent waiting for Redis during this request.
+        """
+        try:
+            self.redis_batch.execute()
+        except Exception:  # pragma: no cover
+            self.raven_client.captureException()
+
+        if self.redis_batch.round_trips:
+            self.stats_client.timing(
+                self.view_type + '.redis.timing',
+                int(round(self.redis_batch.duration * 1000.0)),
+                tags=['path:' + self.metric_path])
+
     def __call__(self):
         """Execute the view and return a response."""
-        if self.check_api_key:
-            return self.check()
-        else:
-            api_key = ApiKey(valid_key=None, allow_fallback=False, log=False)
-            return self.view(api_key)
+        try:
+            if self.check_api_key:
+                return self.check()
+            else:
+                api_key = ApiKeySnapshot.empty(
+                    allow_fallback=False, log=False)
+                return self.view(api_key)
+        finally:
+            self.flush_redis()
@@ -4,6 +4,7 @@ Holds global celery application state and startup / shutdown handlers.
 from celery import Celery
 from celery.app import app_or_default
 from celery.signals import (
+    worker_init,
     worker_process_init,
     worker_process_shutdown,
 )
@@ -14,6 +15,22 @@ from ichnaea.async.config import (
     shutdown_worker,
 )
 from ichnaea.config import read_config
+from ichnaea.preload import (
+    preload,
+    thaw,
+)
+
+
+@worker_init.connect
+def init_worker_main(signal, sender, **kw):  # pragma: no cover
+    """
+    Called automatically when `celery worker` is started. This is executed
+    in the main process, before forking the worker processes.
+
+    Calls :func:`ichnaea.preload.preload`.
+    """
+    conf = read_config()
+    preload(geoip_filename=conf.get('geoip', 'db_path'))
 
 
 @worker_process_init.connect
@@ -22,8 +39,10 @@ def init_worker_process(signal, sender, **kw):  # pragma: no cover
     Called automatically when `celery worker` is started. This is executed
     inside each forked worker process.
 
-    Reads the app config and calls :func:`ichnaea.async.config.init_worker`.
+    Calls :func:`ichnaea.preload.thaw`, reads the app config and calls
+    :func:`ichnaea.async.config.init_worker`.
     """
+    thaw()
     # get the app in the current worker process
     celery_app = app_or_default()
     conf = read_config()
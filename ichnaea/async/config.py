@@ -17,6 +17,7 @@ from ichnaea.log import (
     configure_raven,
     configure_stats,
 )
+from ichnaea.models.wifi import WIFI_SHARDS
 from ichnaea.queue import (
     DataQueue,
     ExportQueue,
@@ -84,16 +85,23 @@ def configure_data(redis_client):
     """
     data_queues = {
         'update_cell': DataQueue('update_cell', redis_client,
-                                 queue_key='update_cell'),
+                                 queue_key='update_cell', binary=True),
         'update_cellarea': DataQueue('update_cellarea', redis_client,
                                      queue_key='update_cell_lac'),
+        'update_incoming': DataQueue('update_incoming', redis_client,
+                                     queue_key='update_incoming'),
         'update_mapstat': DataQueue('update_mapstat', redis_client,
-                                    queue_key='update_mapstat'),
+                                    queue_key='update_mapstat', binary=True),
         'update_score': DataQueue('update_score', redis_client,
-                                  queue_key='update_score'),
+                                  queue_key='update_score', binary=True),
+        # BBB: wifi observations are queued per shard
         'update_wifi': DataQueue('update_wifi', redis_client,
-                                 queue_key='update_wifi'),
+                                 queue_key='update_wifi', binary=True),
     }
+    for shard_id in WIFI_SHARDS.keys():
+        name = 'update_wifi_' + shard_id
+        data_queues[name] = DataQueue(name, redis_client,
+                                      queue_key=name, binary=True)
     return data_queues
 
 
@@ -146,9 +154,10 @@ def init_worker(celery_app, app_config,
     celery_app.stats_client = configure_stats(
         app_config, _client=_stats_client)
 
+    # only a few tasks do GeoIP lookups, open the database on first use
     celery_app.geoip_db = configure_geoip(
         app_config.get('geoip', 'db_path'), raven_client=raven_client,
-        _client=_geoip_db)
+        lazy=True, _client=_geoip_db)
 
     # configure data / export queues
     celery_app.all_queues = all_queues = set([q.name for q in CELERY_QUEUES])
@@ -178,6 +187,8 @@ def shutdown_worker(celery_app):
     celery_app.redis_client.connection_pool.disconnect()
     del celery_app.redis_client
 
+    celery_app.stats_client.stop()
+    celery_app.stats_client.flush()
     del celery_app.stats_client
 
     del celery_app.all_queues
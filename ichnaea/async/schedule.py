@@ -7,6 +7,8 @@ from datetime import timedelta
 
 from celery.schedules import crontab
 
+from ichnaea.models.wifi import WIFI_SHARDS
+
 
 CELERYBEAT_SCHEDULE = {
 
@@ -17,6 +19,12 @@ CELERYBEAT_SCHEDULE = {
         'schedule': timedelta(seconds=60),
         'options': {'expires': 57},
     },
+    'requeue-expired': {
+        'task': 'ichnaea.data.tasks.requeue_expired',
+        'args': (600, ),
+        'schedule': timedelta(seconds=60),
+        'options': {'expires': 57},
+    },
     'monitor-ocid-import': {
         'task': 'ichnaea.data.tasks.monitor_ocid_import',
         'schedule': timedelta(seconds=600),
@@ -80,11 +88,18 @@ CELERYBEAT_SCHEDULE = {
         'schedule': timedelta(seconds=9),
         'options': {'expires': 10},
     },
+    'update-incoming': {
+        'task': 'ichnaea.data.tasks.update_incoming',
+        'schedule': timedelta(seconds=5),
+        'args': (1000, ),
+        'options': {'expires': 10},
+    },
     'update-wifi': {
+        # BBB: process the remaining unsharded wifi observations
         'task': 'ichnaea.data.tasks.update_wifi',
-        'schedule': timedelta(seconds=6),
+        'schedule': timedelta(seconds=60),
         'args': (1000, ),
-        'options': {'expires': 10},
+        'options': {'expires': 57},
     },
 
     'schedule-update-cellarea': {
@@ -100,3 +115,13 @@ CELERYBEAT_SCHEDULE = {
     },
 
 }  #:
+
+for shard_id in WIFI_SHARDS.keys():
+    # one task per wifi shard, each only touching its own table
+    CELERYBEAT_SCHEDULE['update-wifi-' + shard_id] = {
+        'task': 'ichnaea.data.tasks.update_wifi',
+        'schedule': timedelta(seconds=6),
+        'args': (500, shard_id),
+        'options': {'expires': 10},
+    }
+del shard_id
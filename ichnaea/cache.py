@@ -3,11 +3,27 @@ Functionality related to using Redis as a cache and a queue.
 """
 
 from contextlib import contextmanager
+import time
 
 import redis
 from redis.exceptions import RedisError
 from six.moves.urllib.parse import urlparse
 
+from ichnaea.models import (
+    encode_cellid,
+    encode_mac,
+)
+from ichnaea.models.station import encode_station_position
+
+#: Number of seconds a station position is kept in the shared cache.
+STATION_CACHE_EXPIRE = 86400
+
+#: Value marking a cached station position as invalid.
+STATION_CACHE_INVALID = b'invalid'
+
+#: Number of seconds an invalidated station position can't be cached.
+STATION_INVALID_EXPIRE = 60
+
 
 def configure_redis(cache_url, _client=None):
     """
@@ -55,15 +71,116 @@ def redis_pipeline(redis_client, execute=True):
             pipe.execute()
 
 
+def station_cache_key(station_type, station_key):
+    """
+    Return the Redis key under which the position of the station
+    is cached. Wifi stations are identified by their mac address,
+    cell stations by their cell hashkey.
+    """
+    if station_type == 'wifi':
+        return (RedisClient.cache_keys['station_wifi'] +
+                encode_mac(station_key))
+    return RedisClient.cache_keys['station_cell'] + encode_cellid(
+        station_key.radio, station_key.mcc, station_key.mnc,
+        station_key.lac, station_key.cid)
+
+
+def cache_station_positions(pipe, station_type, positions, nx=False):
+    """
+    Add commands to the Redis pipeline to cache the passed in
+    dictionary of station keys to station positions.
+
+    :param nx: Only cache positions for stations not yet in the cache.
+    """
+    for station_key, position in positions.items():
+        pipe.set(station_cache_key(station_type, station_key),
+                 encode_station_position(position),
+                 ex=STATION_CACHE_EXPIRE, nx=nx)
+
+
+def invalidate_stations(pipe, station_type, station_keys):
+    """
+    Add commands to the Redis pipeline to invalidate the cached
+    positions of the passed in stations.
+
+    The entries are replaced by short-lived invalidation markers
+    instead of being deleted. A concurrent locate query might have
+    read the old station values from the database before they were
+    changed, and would otherwise cache them again.
+    """
+    for station_key in station_keys:
+        pipe.set(station_cache_key(station_type, station_key),
+                 STATION_CACHE_INVALID, ex=STATION_INVALID_EXPIRE)
+
+
+class RedisBatch(object):
+    """
+    A RedisBatch collects the fire-and-forget Redis commands made while
+    handling a single request and sends them together with the next
+    commands whose results are needed, or at the end of the request.
+
+    It keeps track of the number of round trips to Redis and the
+    total time spent waiting for them.
+    """
+
+    def __init__(self, redis_client):
+        self.redis_client = redis_client
+        self.duration = 0.0  #: Seconds spent waiting for Redis.
+        self.round_trips = 0  #: Number of executed pipelines.
+        self._deferred = []
+
+    def defer(self, func):
+        """
+        Defer adding commands to a pipeline. The passed in function is
+        later called with the pipeline as its only argument.
+        """
+        self._deferred.append(func)
+
+    def execute(self, func=None):
+        """
+        Execute all deferred commands and the commands added by calling
+        `func` with the pipeline, in a single round trip.
+
+        Errors of the deferred commands are ignored, errors of the
+        commands added by `func` are raised.
+
+        :returns: The list of results of the commands added by `func`.
+        """
+        deferred, self._deferred = self._deferred, []
+        if not deferred and func is None:
+            return []
+
+        start = time.time()
+        try:
+            with self.redis_client.pipeline() as pipe:
+                for add_commands in deferred:
+                    add_commands(pipe)
+                skip = len(pipe)
+                if func is not None:
+                    func(pipe)
+                results = pipe.execute(raise_on_error=False)[skip:]
+        finally:
+            self.duration += time.time() - start
+            self.round_trips += 1
+
+        for result in results:
+            if isinstance(result, Exception):
+                raise result
+        return results
+
+
 class RedisClient(redis.StrictRedis):
     """A strict pingable RedisClient."""
 
     cache_keys = {
         'downloads': b'cache:downloads',
         'fallback_cell': b'cache:fallback:cell:',
+        'fallback_lock': b'cache:fallback:lock:',
         'fallback_wifi': b'cache:fallback:wifi:',
         'leaders': b'cache:leaders',
         'leaders_weekly': b'cache:leaders_weekly',
+        'station_cell': b'cache:station:cell:',
+        'station_wifi': b'cache:station:wifi:',
         'stats': b'cache:stats',
         'stats_regions': b'cache:stats_regions:1',
         'stats_cell_json': b'cache:stats_cell_json',
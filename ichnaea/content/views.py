@@ -1,8 +1,6 @@
 import operator
 import os
 
-import boto
-from boto.exception import S3ResponseError
 from pyramid.decorator import reify
 from pyramid.events import NewResponse
 from pyramid.events import subscriber
@@ -96,6 +94,10 @@ def s3_list_downloads(assets_bucket, assets_url, raven_client):
     if not assets_url.endswith('/'):  # pragma: no cover
         assets_url = assets_url + '/'
 
+    # boto is slow to import and only needed for the downloads page
+    import boto
+    from boto.exception import S3ResponseError
+
     conn = boto.connect_s3()
     bucket = conn.lookup(assets_bucket, validate=False)
     if bucket is None:  # pragma: no cover
@@ -2,7 +2,6 @@ from collections import namedtuple
 from contextlib import closing
 import uuid
 
-import boto
 import requests
 import simplejson
 from six.moves.urllib.parse import urlparse
@@ -76,6 +75,70 @@ class ExportQueue(DataTask):
                     queue.enqueue(items, queue_key, pipe=self.pipe)
 
 
+class IncomingQueue(DataTask):
+    """
+    Distributes the reports queued by the submit views in the
+    `update_incoming` data queue to the export queues.
+
+    Each queued item is a single report together with its metadata,
+    in the same format as the export queue items. The reports of all
+    uploads are grouped by export queue and queue key, so each queue
+    key is only added to once per call.
+    """
+
+    def __init__(self, task, session, pipe):
+        DataTask.__init__(self, task, session)
+        self.pipe = pipe
+        self.data_queue = task.app.data_queues['update_incoming']
+        self.export_queues = task.app.export_queues
+
+    def _items(self, records):
+        for record in records:
+            if 'reports' in record:
+                # BBB: whole uploads queued by older web workers
+                metadata = {
+                    'api_key': record['api_key'],
+                    'email': record['email'],
+                    'ip': record['ip'],
+                    'nickname': record['nickname'],
+                }
+                for report in record['reports']:
+                    yield {'report': report, 'metadata': metadata}
+            else:
+                yield record
+
+    def _targets(self, api_key):
+        targets = []
+        for name, queue in self.export_queues.items():
+            if queue.export_allowed(api_key):
+                targets.append((name, queue.queue_key(api_key)))
+        return targets
+
+    def __call__(self, batch=1000):
+        records = self.data_queue.dequeue(batch=batch, pipe=self.pipe)
+
+        api_key_targets = {}
+        target_items = {}
+        for item in self._items(records):
+            api_key = item['metadata']['api_key']
+            targets = api_key_targets.get(api_key)
+            if targets is None:
+                targets = api_key_targets[api_key] = self._targets(api_key)
+            for target in targets:
+                target_items.setdefault(target, []).append(item)
+
+        for (name, queue_key), items in target_items.items():
+            self.export_queues[name].enqueue(items, queue_key, pipe=self.pipe)
+
+        if self.data_queue.size() >= batch:
+            self.task.apply_async(
+                kwargs={'batch': batch},
+                countdown=2,
+                expires=10)
+
+        return len(records)
+
+
 class ReportExporter(DataTask):
 
     def __init__(self, task, session, export_queue_name, queue_key):
@@ -90,14 +153,11 @@ class ReportExporter(DataTask):
 
     def __call__(self, export_task, upload_task):
         export_queue = self.export_queue
-        if not export_queue.enough_data(self.queue_key):  # pragma: no cover
-            return
-
-        items = export_queue.dequeue(self.queue_key, batch=self.batch)
-        if items and len(items) < self.batch:  # pragma: no cover
-            # race condition, something emptied the queue in between
-            # our llen call and fetching the items, put them back
-            export_queue.enqueue(items, self.queue_key)
+        # only take items if there are enough of them, checked
+        # atomically, so concurrent tasks can't race each other
+        items = export_queue.dequeue(
+            self.queue_key, batch=self.batch, minimum=max(self.batch, 1))
+        if not items:  # pragma: no cover
             return
 
         if self.metadata:  # pragma: no cover
@@ -194,6 +254,9 @@ class S3Uploader(ReportUploader):
             api_key=api_key, year=year, month=month, day=day)
         key_name += uuid.uuid1().hex + '.json.gz'
 
+        # boto is slow to import and only needed by the S3 exporter
+        import boto
+
         try:
             with self.stats_client.timed(self.stats_prefix + 'upload',
                                          tags=self.stats_tags):
@@ -16,7 +16,7 @@ class MapStatUpdater(DataTask):
     def __call__(self, batch=1000):
         queue = self.task.app.data_queues['update_mapstat']
         today = util.utcnow().date()
-        positions = queue.dequeue(batch=batch)
+        positions = queue.dequeue(batch=batch, pipe=self.pipe)
         if not positions:
             return 0
 
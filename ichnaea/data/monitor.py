@@ -120,3 +120,24 @@ class QueueSize(object):
             result[name] = value = self.redis_client.llen(name)
             self.stats_client.gauge('queue', value, tags=['queue:' + name])
         return result
+
+
+class QueueReaper(object):
+    """
+    Puts the items of data queue batches back into their queues, if
+    the worker processing them crashed without acknowledging them.
+    """
+
+    def __init__(self, task):
+        self.task = task
+        self.stats_client = task.stats_client
+
+    def __call__(self, timeout=600):
+        result = {}
+        for queue in self.task.app.data_queues.values():
+            name = queue.queue_key()
+            result[name] = value = queue.requeue_expired(timeout=timeout)
+            if value:
+                self.stats_client.incr(
+                    'queue.requeued', value, tags=['queue:' + name])
+        return result
@@ -3,7 +3,6 @@ import csv
 from datetime import datetime, timedelta
 import os
 
-import boto
 import requests
 from sqlalchemy.sql import text
 
@@ -136,6 +135,9 @@ class CellExport(object):
             self.write_stations_to_s3(path, bucket)
 
     def write_stations_to_s3(self, path, bucketname):
+        # boto is slow to import and only needed for the upload
+        import boto
+
         conn = boto.connect_s3()
         bucket = conn.get_bucket(bucketname)
         with closing(boto.s3.key.Key(bucket)) as key:
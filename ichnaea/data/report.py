@@ -7,15 +7,17 @@ from ichnaea.models import (
     Cell,
     CellBlocklist,
     CellObservation,
-    CellReport,
-    Report,
     Score,
     ScoreKey,
     User,
     WifiObservation,
-    WifiReport,
     WifiShard,
 )
+from ichnaea.models.fastschema import (
+    validate_cell_report,
+    validate_report,
+    validate_wifi_report,
+)
 
 
 class ReportQueue(DataTask):
@@ -29,7 +31,6 @@ class ReportQueue(DataTask):
         self.ip = ip
         self.nickname = nickname
         self.cell_queue = self.task.app.data_queues['update_cell']
-        self.wifi_queue = self.task.app.data_queues['update_wifi']
 
     def __call__(self, reports):
         userid = self.process_user(self.nickname, self.email)
@@ -69,13 +70,9 @@ class ReportQueue(DataTask):
 
         if name == 'wifi':
             # there is only one combined table structure
-            shards = defaultdict(list)
-            for mac in unknown_keys:
-                shards[WifiShard.shard_model(mac)].append(mac)
-            for shard, macs in shards.items():
-                query = (self.session.query(shard.mac)
-                                     .filter(shard.mac.in_(macs)))
-                unknown_keys -= set([r.mac for r in query.all()])
+            stations = WifiShard.querymacs(
+                self.session, list(unknown_keys), fields=('mac', ))
+            unknown_keys -= set([sta.mac for sta in stations])
         elif name == 'cell':
             # first check the station table, which is more likely to contain
             # stations
@@ -139,10 +136,17 @@ class ReportQueue(DataTask):
             # determine scores for stations
             new_station_count[name] += self.new_stations(name, station_keys)
 
-        for name, queue in (('cell', self.cell_queue),
-                            ('wifi', self.wifi_queue)):
-            if observations[name]:
-                queue.enqueue(list(observations[name]), pipe=self.pipe)
+        if observations['cell']:
+            self.cell_queue.enqueue(
+                list(observations['cell']), pipe=self.pipe)
+
+        # queue the wifi observations per shard
+        sharded_obs = defaultdict(list)
+        for obs in observations['wifi']:
+            sharded_obs[WifiShard.shard_id(obs.mac)].append(obs)
+        for shard_id, values in sharded_obs.items():
+            queue = self.task.app.data_queues['update_wifi_' + shard_id]
+            queue.enqueue(values, pipe=self.pipe)
 
         self.process_mapstat(positions)
         self.process_score(userid, positions, new_station_count)
@@ -156,25 +160,29 @@ class ReportQueue(DataTask):
         malformed = {'cell': 0, 'wifi': 0}
         observations = {'cell': {}, 'wifi': {}}
 
-        report = Report.create(**data)
+        # The fast validators match the Report, CellReport and
+        # WifiReport schemas, without creating the report instances.
+        report = validate_report(data)
         if report is None:
             return (None, None, malformed)
 
-        for name, report_cls, obs_cls in (
-                ('cell', CellReport, CellObservation),
-                ('wifi', WifiReport, WifiObservation)):
+        for name, validate, obs_cls in (
+                ('cell', validate_cell_report, CellObservation),
+                ('wifi', validate_wifi_report, WifiObservation)):
             observations[name] = {}
 
             if data.get(name):
                 for item in data[name]:
                     # validate the cell/wifi specific fields
-                    item_report = report_cls.create(**item)
+                    item_report = validate(item)
                     if item_report is None:
                         malformed[name] += 1
                         continue
 
                     # combine general and specific report data into one
-                    item_obs = obs_cls.combine(report, item_report)
+                    values = report.copy()
+                    values.update(item_report)
+                    item_obs = obs_cls(**values)
                     item_key = item_obs.hashkey()
 
                     # if we have better data for the same key, ignore
@@ -19,7 +19,7 @@ class ScoreUpdater(DataTask):
 
     def __call__(self, batch=1000):
         score_values = defaultdict(int)
-        for score in self.queue.dequeue(batch=batch):
+        for score in self.queue.dequeue(batch=batch, pipe=self.pipe):
             key = score['hashkey']
             if key.time is None:
                 key.time = self.today
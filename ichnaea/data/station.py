@@ -2,17 +2,20 @@ from collections import defaultdict
 
 import numpy
 
+from ichnaea.cache import (
+    invalidate_stations,
+)
 from ichnaea.constants import (
     PERMANENT_BLOCKLIST_THRESHOLD,
     TEMPORARY_BLOCKLIST_DURATION,
 )
 from ichnaea.data.base import DataTask
 from ichnaea.geocalc import (
-    centroid,
     circle_radius,
-    country_for_location,
+    countries_for_locations,
     country_matches_location,
     distance,
+    group_centroids,
 )
 from ichnaea.models import (
     Cell,
@@ -44,6 +47,7 @@ class CellRemover(DataTask):
         if changed_areas:
             area_queue.enqueue(changed_areas, pipe=self.pipe)
 
+        invalidate_stations(self.pipe, 'cell', cell_keys)
         return cells_removed
 
 
@@ -75,6 +79,28 @@ class StationUpdater(DataTask):
                 count,
                 tags=tags)
 
+    def observation_positions(self, station_obs):
+        """
+        Return a dictionary mapping each station key to a two-tuple of
+        the lat/lon array of its observations and their centroid.
+
+        The centroids of all stations are computed in one call.
+        """
+        keys = list(station_obs.keys())
+        offsets = [0]
+        points = []
+        for key in keys:
+            points.extend([(obs.lat, obs.lon) for obs in station_obs[key]])
+            offsets.append(len(points))
+        points = numpy.array(points, dtype=numpy.double).reshape(-1, 2)
+        centroids = group_centroids(points, offsets)
+
+        result = {}
+        for i, key in enumerate(keys):
+            result[key] = (points[offsets[i]:offsets[i + 1]],
+                           (float(centroids[i, 0]), float(centroids[i, 1])))
+        return result
+
     def __call__(self, batch=10):
         raise NotImplementedError()
 
@@ -153,8 +179,8 @@ class CellUpdater(StationUpdater):
                       'reason:moving'])
             self.remove_task.delay(moving_keys)
 
-    def new_station_values(self, station, station_key,
-                           first_blocked, observations):
+    def new_station_values(self, station, station_key, first_blocked,
+                           observations, obs_positions, obs_centroid):
         # This function returns a 3-tuple, the first element is True,
         # if the station was found to be moving.
         # The second element is either None or a dict of values,
@@ -163,10 +189,7 @@ class CellUpdater(StationUpdater):
         # if the station did exist and should be updated
 
         obs_length = len(observations)
-        obs_positions = numpy.array(
-            [(obs.lat, obs.lon) for obs in observations],
-            dtype=numpy.double)
-        obs_lat, obs_lon = centroid(obs_positions)
+        obs_lat, obs_lon = obs_centroid
 
         values = {
             'modified': self.utcnow,
@@ -257,7 +280,8 @@ class CellUpdater(StationUpdater):
             return (False, None, values)
 
     def __call__(self, batch=10):
-        all_observations = self.data_queue.dequeue(batch=batch)
+        all_observations = self.data_queue.dequeue(
+            batch=batch, pipe=self.pipe)
         drop_counter = defaultdict(int)
         added = 0
         new_stations = 0
@@ -274,9 +298,11 @@ class CellUpdater(StationUpdater):
             stations[station.hashkey()] = station
 
         blocklist = self.blocklisted_stations(station_obs.keys())
+        positions = self.observation_positions(station_obs)
 
         new_station_values = []
         changed_station_values = []
+        changed_stations = set()
         moving_stations = set()
         for station_key, observations in station_obs.items():
             blocked, first_blocked, block = blocklist.get(
@@ -295,8 +321,11 @@ class CellUpdater(StationUpdater):
                 # We discovered an actual new never before seen station.
                 new_stations += 1
 
+            obs_positions, obs_centroid = positions[station_key]
             moving, new_values, changed_values = self.new_station_values(
-                station, station_key, first_blocked, observations)
+                station, station_key, first_blocked,
+                observations, obs_positions, obs_centroid)
+            changed_stations.add(station_key)
             if moving:
                 moving_stations.add((station_key, block))
             else:
@@ -327,6 +356,11 @@ class CellUpdater(StationUpdater):
                 batch_values = changed_station_values[i:i + ins_batch]
                 self.session.bulk_update_mappings(Cell, batch_values)
 
+        if changed_stations:
+            # invalidate cached positions
+            invalidate_stations(
+                self.pipe, self.station_type, changed_stations)
+
         if self.updated_areas:
             self.queue_area_updates()
 
@@ -346,11 +380,27 @@ class CellUpdater(StationUpdater):
 
 
 class WifiUpdater(StationUpdater):
+    """
+    Updates the wifi stations based on the queued observations.
+
+    With a `shard_id`, only the observations queued for this one
+    :class:`~ichnaea.models.wifi.WifiShard` are processed, so each
+    transaction only touches a single shard table.
+    """
 
     max_dist_meters = 5000
     queue_name = 'update_wifi'
     station_type = 'wifi'
 
+    def __init__(self, task, session, pipe,
+                 remove_task=None, update_task=None, shard_id=None):
+        self.shard_id = shard_id
+        if shard_id is not None:
+            self.queue_name = 'update_wifi_' + shard_id
+        super(WifiUpdater, self).__init__(
+            task, session, pipe,
+            remove_task=remove_task, update_task=update_task)
+
     def emit_stats(self, stats_counter, drop_counter):
         day = self.today
         StatCounter(StatKey.wifi, day).incr(
@@ -369,7 +419,8 @@ class WifiUpdater(StationUpdater):
                       'action:add',
                       'reason:moving'])
 
-    def station_values(self, station_key, shard_station, observations):
+    def station_values(self, station_key, shard_station, observations,
+                       obs_positions, obs_centroid):
         """
         Return two-tuple of status, value dict where status is one of:
         `new`, `new_moving`, `moving`, `changed`.
@@ -391,10 +442,7 @@ class WifiUpdater(StationUpdater):
         }
 
         obs_length = len(observations)
-        obs_positions = numpy.array(
-            [(obs.lat, obs.lon) for obs in observations],
-            dtype=numpy.double)
-        obs_new_lat, obs_new_lon = centroid(obs_positions)
+        obs_new_lat, obs_new_lon = obs_centroid
         obs_max_lat, obs_max_lon = numpy.nanmax(obs_positions, axis=0)
         obs_min_lat, obs_min_lon = numpy.nanmin(obs_positions, axis=0)
         obs_box_dist = distance(obs_min_lat, obs_min_lon,
@@ -441,7 +489,8 @@ class WifiUpdater(StationUpdater):
                 'min_lat': float(obs_min_lat),
                 'max_lon': float(obs_max_lon),
                 'min_lon': float(obs_min_lon),
-                'country': country_for_location(obs_new_lat, obs_new_lon),
+                # filled in for all new stations of a shard at once
+                'country': None,
                 'radius': radius,
                 'samples': obs_length,
                 'source': None,
@@ -503,10 +552,9 @@ class WifiUpdater(StationUpdater):
                 country = shard_station.country
                 if (country and not country_matches_location(
                         new_lat, new_lon, country)):
-                    # reset country if it no longer matches
+                    # reset country if it no longer matches,
+                    # it is filled in for the entire shard at once
                     country = None
-                if not country:
-                    country = country_for_location(new_lat, new_lon)
                 values.update({
                     'lat': new_lat,
                     'lon': new_lon,
@@ -536,10 +584,11 @@ class WifiUpdater(StationUpdater):
                 sharded_obs[shard][obs.mac].append(obs)
         return sharded_obs
 
-    def _query_stations(self, shard, shard_values):
-        macs = list(shard_values.keys())
-        rows = (self.session.query(shard)
-                            .filter(shard.mac.in_(macs))).all()
+    def _query_stations(self, sharded_obs):
+        macs = []
+        for shard_values in sharded_obs.values():
+            macs.extend(shard_values.keys())
+        rows = WifiShard.querymacs(self.session, macs)
 
         blocklist = {}
         stations = {}
@@ -548,10 +597,22 @@ class WifiUpdater(StationUpdater):
             blocklist[row.mac] = row.blocked(today=self.today)
         return (blocklist, stations)
 
-    def _update_shard(self, shard, shard_values,
+    def _fill_countries(self, results):
+        # Look up the countries of all stations without one at once.
+        missing = [result for result in results
+                   if not result['country'] and result['lat'] is not None]
+        if not missing:
+            return
+        countries = countries_for_locations(
+            [(result['lat'], result['lon']) for result in missing])
+        for result, country in zip(missing, countries):
+            result['country'] = country
+
+    def _update_shard(self, shard, shard_values, blocklist, stations,
                       drop_counter, stats_counter):
         new_data = defaultdict(list)
-        blocklist, stations = self._query_stations(shard, shard_values)
+        changed_stations = set()
+        positions = self.observation_positions(shard_values)
 
         for station_key, observations in shard_values.items():
             if blocklist.get(station_key, False):
@@ -564,15 +625,20 @@ class WifiUpdater(StationUpdater):
                 # We discovered an actual new never before seen station.
                 stats_counter['new_station'] += 1
 
+            obs_positions, obs_centroid = positions[station_key]
             status, result = self.station_values(
-                station_key, shard_station, observations)
+                station_key, shard_station, observations,
+                obs_positions, obs_centroid)
             new_data[status].append(result)
+            changed_stations.add(station_key)
 
             if status in ('moving', 'new_moving'):
                 stats_counter['block'] += 1
             else:
                 stats_counter['obs'] += len(observations)
 
+        self._fill_countries(new_data['new'] + new_data['changed'])
+
         if new_data['new']:
             # do a batch insert of new stations
             stmt = shard.__table__.insert(
@@ -592,23 +658,31 @@ class WifiUpdater(StationUpdater):
             self.session.bulk_update_mappings(
                 shard, new_data['changed'] + new_data['moving'])
 
+        if changed_stations:
+            # invalidate cached positions, including cached
+            # entries for previously unknown stations
+            invalidate_stations(
+                self.pipe, self.station_type, changed_stations)
+
     def __call__(self, batch=10):
         sharded_obs = self._shard_observations(
-            self.data_queue.dequeue(batch=batch))
+            self.data_queue.dequeue(batch=batch, pipe=self.pipe))
         if not sharded_obs:
             return
 
         drop_counter = defaultdict(int)
         stats_counter = defaultdict(int)
 
+        # look up the existing stations of all shards at once
+        blocklist, stations = self._query_stations(sharded_obs)
         for shard, shard_values in sharded_obs.items():
-            self._update_shard(shard, shard_values,
+            self._update_shard(shard, shard_values, blocklist, stations,
                                drop_counter, stats_counter)
 
         self.emit_stats(stats_counter, drop_counter)
 
         if self.data_queue.enough_data(batch=batch):  # pragma: no cover
             self.update_task.apply_async(
-                kwargs={'batch': batch},
+                kwargs={'batch': batch, 'shard_id': self.shard_id},
                 countdown=2,
                 expires=10)
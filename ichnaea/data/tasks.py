@@ -68,6 +68,11 @@ def monitor_queue_size(self):
     return monitor.QueueSize(self)()
 
 
+@celery_app.task(base=BaseTask, bind=True, queue='celery_monitor')
+def requeue_expired(self, timeout=600):
+    return monitor.QueueReaper(self)(timeout=timeout)
+
+
 @celery_app.task(base=BaseTask, bind=True, queue='celery_export')
 def schedule_export_reports(self):
     return export.ExportScheduler(self, None)(export_reports)
@@ -108,6 +113,12 @@ def queue_reports(self, reports=(),
         )(reports)
 
 
+@celery_app.task(base=BaseTask, bind=True, queue='celery_reports')
+def update_incoming(self, batch=1000):
+    with self.redis_pipeline() as pipe:
+        return export.IncomingQueue(self, None, pipe)(batch=batch)
+
+
 @celery_app.task(base=BaseTask, bind=True, queue='celery_upload')
 def upload_reports(self, export_queue_name, data, queue_key=None):
     uploaders = {
@@ -143,13 +154,14 @@ def update_cell(self, batch=1000):
 
 
 @celery_app.task(base=BaseTask, bind=True, queue='celery_wifi')
-def update_wifi(self, batch=1000):
+def update_wifi(self, batch=1000, shard_id=None):
     with self.redis_pipeline() as pipe:
         with self.db_session() as session:
             station.WifiUpdater(
                 self, session, pipe,
                 remove_task=None,
                 update_task=update_wifi,
+                shard_id=shard_id,
             )(batch=batch)
 
 
@@ -11,8 +11,10 @@ from ichnaea.config import DummyConfig
 from ichnaea.data.tasks import (
     schedule_export_reports,
     queue_reports,
+    update_incoming,
 )
 from ichnaea.models import ApiKey
+from ichnaea.queue import ExportQueue
 from ichnaea.tests.base import CeleryTestCase
 from ichnaea.tests.factories import (
     CellFactory,
@@ -144,6 +146,43 @@ class TestExporter(BaseExportTest):
         for key, num in expected:
             self.assertEqual(self.queue_length(key), num)
 
+    def test_incoming_queue(self):
+        incoming_queue = self.celery_app.data_queues['update_incoming']
+        metadata = {'email': None, 'ip': None, 'nickname': None}
+        items = []
+        for api_key in ('test', 'test2', 'test', None):
+            items.append({'report': {'timestamp': 1.0},
+                          'metadata': dict(metadata, api_key=api_key)})
+        # BBB: a whole upload queued by an older web worker
+        items.append(dict(metadata, api_key='test2',
+                          reports=[{'timestamp': 2.0}, {'timestamp': 3.0}]))
+        incoming_queue.enqueue(items)
+
+        export_queues = self.celery_app.export_queues
+        with mock.patch.object(ExportQueue, 'enqueue', autospec=True,
+                               side_effect=ExportQueue.enqueue) as enqueue:
+            self.assertEqual(update_incoming.delay().get(), 5)
+
+        # one enqueue call per export queue key
+        self.assertEqual(enqueue.call_count, len(export_queues))
+        self.assertEqual(incoming_queue.size(), 0)
+        expected = [
+            (export_queues['test'].queue_key(), 6),
+            (export_queues['everything'].queue_key(), 6),
+            (export_queues['no_test'].queue_key(), 4),
+        ]
+        for key, num in expected:
+            self.assertEqual(self.queue_length(key), num)
+
+        items = export_queues['no_test'].dequeue(
+            export_queues['no_test'].queue_key())
+        self.assertEqual(
+            sorted([item['report']['timestamp'] for item in items]),
+            [1.0, 1.0, 2.0, 3.0])
+        self.assertEqual(
+            sorted([item['metadata']['api_key'] for item in items]),
+            [None, 'test2', 'test2', 'test2'])
+
     def test_one_queue(self):
         self.add_reports(3)
         triggered = schedule_export_reports.delay().get()
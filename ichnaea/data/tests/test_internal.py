@@ -13,6 +13,7 @@ from ichnaea.models import (
     User,
     WifiShard,
 )
+from ichnaea.models.wifi import WIFI_SHARDS
 
 
 class TestUploader(BaseExportTest):
@@ -32,6 +33,10 @@ class TestUploader(BaseExportTest):
         self.celery_app.export_queues = configure_export(
             self.redis_client, config)
 
+    def _update_wifi(self):
+        for shard_id in WIFI_SHARDS.keys():
+            update_wifi.delay(shard_id=shard_id).get()
+
     def test_stats(self):
         self.session.add(ApiKey(valid_key='e5444-794', log=True))
         self.session.flush()
@@ -43,7 +48,7 @@ class TestUploader(BaseExportTest):
 
         schedule_export_reports.delay().get()
         update_cell.delay().get()
-        update_wifi.delay().get()
+        self._update_wifi()
 
         self.check_stats(counter=[
             ('data.export.batch', 1, 1, ['key:internal']),
@@ -51,13 +56,16 @@ class TestUploader(BaseExportTest):
             ('data.report.upload', 1, 3, ['key:test']),
             ('data.report.upload', 1, 6, ['key:e5444-794']),
             ('data.observation.insert', 1, 12, ['type:cell']),
-            ('data.observation.insert', 1, 24, ['type:wifi']),
             ('data.observation.upload', 1, 3, ['type:cell', 'key:test']),
             ('data.observation.upload', 1, 6, ['type:wifi', 'key:test']),
             ('data.observation.upload', 0, ['type:cell', 'key:no_key']),
             ('data.observation.upload', 1, 6, ['type:cell', 'key:e5444-794']),
             ('data.observation.upload', 1, 12, ['type:wifi', 'key:e5444-794']),
         ])
+        # the wifi observations are inserted by one task per shard
+        inserted = self.find_stats_messages(
+            'counter', 'data.observation.insert', msg_tags=['type:wifi'])
+        self.assertEqual(sum([msg[1] for msg in inserted]), 24)
 
     def test_cell(self):
         reports = self.add_reports(cell_factor=1, wifi_factor=0)
@@ -116,7 +124,7 @@ class TestUploader(BaseExportTest):
     def test_wifi(self):
         reports = self.add_reports(cell_factor=0, wifi_factor=1)
         schedule_export_reports.delay().get()
-        update_wifi.delay().get()
+        self._update_wifi()
 
         position = reports[0]['position']
         wifi_data = reports[0]['wifiAccessPoints'][0]
@@ -145,7 +153,7 @@ class TestUploader(BaseExportTest):
         queue.enqueue(items, queue.queue_key())
 
         schedule_export_reports.delay().get()
-        update_wifi.delay().get()
+        self._update_wifi()
 
         shard = WifiShard.shard_model(mac)
         wifis = self.session.query(shard).all()
@@ -155,7 +163,7 @@ class TestUploader(BaseExportTest):
     def test_wifi_invalid(self):
         self.add_reports(cell_factor=0, wifi_factor=1, wifi_key='abcd')
         schedule_export_reports.delay().get()
-        update_wifi.delay().get()
+        self._update_wifi()
         self.check_stats(counter=[
             ('data.report.upload', 1, 1, ['key:test']),
             ('data.report.drop', 1, 1, ['reason:malformed', 'key:test']),
@@ -7,6 +7,7 @@ from ichnaea.data.tasks import (
     monitor_api_users,
     monitor_ocid_import,
     monitor_queue_size,
+    requeue_expired,
 )
 from ichnaea.tests.base import CeleryTestCase
 from ichnaea.tests.factories import OCIDCellFactory
@@ -106,6 +107,23 @@ class TestMonitorTasks(CeleryTestCase):
         )
         self.assertEqual(result, data)
 
+    def test_requeue_expired(self):
+        queue = self.celery_app.data_queues['update_score']
+        queue.enqueue([{'hashkey': None, 'value': 1}] * 3)
+        token, items = queue.reserve(batch=2)
+        self.assertEqual(len(items), 2)
+
+        result = requeue_expired.delay(timeout=60).get()
+        self.assertEqual(result['update_score'], 0)
+        self.assertEqual(queue.size(), 1)
+
+        result = requeue_expired.delay(timeout=-1).get()
+        self.assertEqual(result['update_score'], 2)
+        self.assertEqual(queue.size(), 3)
+        self.check_stats(counter=[
+            ('queue.requeued', 1, 2, ['queue:update_score']),
+        ])
+
 
 class TestMonitorAPIUsersTasks(CeleryTestCase):
 
@@ -1,10 +1,18 @@
 from datetime import timedelta
 
+from ichnaea.cache import (
+    cache_station_positions,
+    redis_pipeline,
+    station_cache_key,
+    STATION_CACHE_INVALID,
+    STATION_INVALID_EXPIRE,
+)
 from ichnaea.constants import (
     PERMANENT_BLOCKLIST_THRESHOLD,
     TEMPORARY_BLOCKLIST_DURATION,
 )
 from ichnaea.data.tasks import (
+    remove_cell,
     update_cell,
     update_wifi,
     scan_areas,
@@ -17,6 +25,11 @@ from ichnaea.models import (
     StatKey,
     WifiShard,
 )
+from ichnaea.models.station import (
+    decode_station_position,
+    StationPosition,
+    UNKNOWN_STATION,
+)
 from ichnaea.tests.base import CeleryTestCase
 from ichnaea.tests.factories import (
     CellFactory,
@@ -37,6 +50,24 @@ class StationTest(CeleryTestCase):
         stat_counter = StatCounter(stat_key, util.utcnow())
         self.assertEqual(stat_counter.get(self.redis_client), value)
 
+    def cache_positions(self, station_type, positions):
+        with redis_pipeline(self.redis_client) as pipe:
+            cache_station_positions(pipe, station_type, positions)
+
+    def cached_position(self, station_type, station_key):
+        value = self.redis_client.get(
+            station_cache_key(station_type, station_key))
+        if value is None or value == STATION_CACHE_INVALID:
+            return value
+        return decode_station_position(value)
+
+    def check_invalidated(self, station_type, station_key):
+        self.assertEqual(self.cached_position(station_type, station_key),
+                         STATION_CACHE_INVALID)
+        ttl = self.redis_client.ttl(
+            station_cache_key(station_type, station_key))
+        self.assertTrue(0 < ttl <= STATION_INVALID_EXPIRE)
+
 
 class TestCell(StationTest):
 
@@ -352,6 +383,37 @@ class TestCell(StationTest):
         self.assertEqual(cell.range, 468)
         self.assertEqual(cell.total_measures, 5)
 
+    def test_update_cached(self):
+        cell1 = CellFactory(total_measures=3)
+        cell2 = CellFactory(total_measures=3)
+        key1 = cell1.hashkey()
+        key2 = cell2.hashkey()
+        self.cache_positions('cell', {
+            key1: StationPosition(cell1.lat, cell1.lon, cell1.range, None)})
+        obs = [
+            CellObservationFactory(
+                lat=cell1.lat + 0.004, lon=cell1.lon, **key1.__dict__),
+            CellObservationFactory(
+                lat=cell2.lat + 0.004, lon=cell2.lon, **key2.__dict__),
+        ]
+        self.data_queue.enqueue(obs)
+        self.session.commit()
+
+        self.assertEqual(update_cell.delay().get(), (2, 0))
+        self.check_invalidated('cell', key1)
+        self.check_invalidated('cell', key2)
+
+    def test_remove_cached(self):
+        cell = CellFactory()
+        key = cell.hashkey()
+        self.session.commit()
+        self.cache_positions('cell', {
+            key: StationPosition(cell.lat, cell.lon, cell.range, None)})
+
+        remove_cell.delay([key]).get()
+        self.assertEqual(self.session.query(Cell).count(), 0)
+        self.check_invalidated('cell', key)
+
 
 class TestWifi(StationTest):
 
@@ -385,6 +447,24 @@ class TestWifi(StationTest):
         self.assertEqual(wifi.block_last, None)
         self.assertEqual(wifi.block_count, None)
 
+    def test_shard_queue(self):
+        obs = WifiObservationFactory.build()
+        shard_id = WifiShard.shard_id(obs.mac)
+        other_id = [i for i in '0123456789abcdef' if i != shard_id][0]
+        shard_queue = self.celery_app.data_queues['update_wifi_' + shard_id]
+        shard_queue.enqueue([obs])
+
+        update_wifi.delay(shard_id=other_id).get()
+        update_wifi.delay().get()
+        self.assertEqual(shard_queue.size(), 1)
+
+        update_wifi.delay(shard_id=shard_id).get()
+        self.assertEqual(shard_queue.size(), 0)
+        shard = WifiShard.shard_model(obs.mac)
+        wifis = self.session.query(shard).all()
+        self.assertEqual(len(wifis), 1)
+        self.assertEqual(wifis[0].mac, obs.mac)
+
     def test_update(self):
         utcnow = util.utcnow()
         obs = []
@@ -447,6 +527,25 @@ class TestWifi(StationTest):
         self.assertEqual(found.radius, 260)
         self.assertEqual(found.samples, 4)
 
+    def test_update_cached(self):
+        obs = WifiObservationFactory.build()
+        wifi = WifiShardFactory(samples=3)
+        obs2 = WifiObservationFactory(
+            key=wifi.mac, lat=wifi.lat + 1.0, lon=wifi.lon)
+        # cache the first station as unknown and the second as known
+        self.cache_positions('wifi', {
+            obs.mac: UNKNOWN_STATION,
+            wifi.mac: StationPosition(
+                wifi.lat, wifi.lon, wifi.radius, None),
+        })
+        self.data_queue.enqueue([obs, obs2])
+        self.session.commit()
+        update_wifi.delay().get()
+
+        self.check_invalidated('wifi', obs.mac)
+        # the second station was moved and is blocked
+        self.check_invalidated('wifi', wifi.mac)
+
     def test_temp_blocked(self):
         utcnow = util.utcnow()
         bad_wifi = WifiObservationFactory.build()
@@ -1,44 +1,112 @@
 """
 Contains helper functions for various geo related calculations.
+
+The country bounding boxes are loaded from the pre-computed
+:mod:`ichnaea.geocalc_snapshot` module on first use, so importing
+this module doesn't need to import and process the entire
+`country_bounding_boxes` data set.
 """
 
 from operator import attrgetter
 from collections import namedtuple
+import math
 
-from country_bounding_boxes import (
-    _best_guess_iso_2,
-    _best_guess_iso_3,
-    countries,
-    country_subunits_by_iso_code,
-)
 import numpy
 from six import string_types
 
 from ichnaea import _geocalc
 from ichnaea import constants
 
-_bbox_cache = []
+_country_tables = None
 _radius_cache = {}
 Subunit = namedtuple('Subunit', 'bbox alpha2 alpha3 radius')
+CountryTables = namedtuple(
+    'CountryTables', 'subunits by_code grid alpha2 codes bounds grid_table')
+
+#: Size in degrees of the grid cells used to index the bounding boxes.
+BBOX_GRID_SIZE = 5.0
+_GRID_ROWS = int(180 // BBOX_GRID_SIZE)
+_GRID_COLUMNS = int(360 // BBOX_GRID_SIZE)
+
+
+def _as_points(points, columns=2):
+    # Return a C contiguous double array with the given number of columns.
+    return numpy.ascontiguousarray(
+        points, dtype=numpy.double).reshape(-1, columns)
+
+
+def _country_diagonals(subunits):
+    boxes = [(lat1, lon1, lat2, lon2)
+             for (lon1, lat1, lon2, lat2) in
+             [subunit.bbox for subunit in subunits]]
+    return bbox_diagonals(boxes)
 
 
 def _fill_bbox_cache():
+    # Compute the subunits from the country_bounding_boxes data set,
+    # this is only used to generate the snapshot module.
+    from country_bounding_boxes import (
+        _best_guess_iso_2,
+        _best_guess_iso_3,
+        countries,
+    )
+
     cached = []
+    known = []
     for country in countries:
         iso2 = _best_guess_iso_2(country)
         iso3 = _best_guess_iso_3(country)
         if not (iso2 and iso3):
             continue
-        (lon1, lat1, lon2, lat2) = country.bbox
-        radius = _geocalc.distance(lat1, lon1, lat2, lon2) / 2.0
+        known.append((country, iso2, iso3))
+
+    diagonals = _country_diagonals([country for country, _, _ in known])
+    for (country, iso2, iso3), diagonal in zip(known, diagonals):
         cached.append(Subunit(bbox=country.bbox,
                               alpha2=iso2.upper(),
                               alpha3=iso3.upper(),
-                              radius=int(radius)))
+                              radius=int(diagonal / 2.0)))
     # sort by largest radius first
     return list(sorted(cached, key=attrgetter('radius'), reverse=True))
 
 
+def _grid_cells(lats, lons):
+    # Return the flat grid cell index for arrays of lat/lon values.
+    # Points on the northern or eastern edge of the world fall into
+    # the last row or column.
+    rows = numpy.clip(
+        numpy.floor((numpy.asarray(lats) + 90.0) / BBOX_GRID_SIZE),
+        0, _GRID_ROWS - 1).astype(numpy.intp)
+    columns = numpy.clip(
+        numpy.floor((numpy.asarray(lons) + 180.0) / BBOX_GRID_SIZE),
+        0, _GRID_COLUMNS - 1).astype(numpy.intp)
+    return rows * _GRID_COLUMNS + columns
+
+
+def _grid_cell(lat, lon):
+    # Scalar variant of _grid_cells, avoiding the numpy call overhead.
+    row = min(max(int(math.floor((lat + 90.0) / BBOX_GRID_SIZE)), 0),
+              _GRID_ROWS - 1)
+    column = min(max(int(math.floor((lon + 180.0) / BBOX_GRID_SIZE)), 0),
+                 _GRID_COLUMNS - 1)
+    return row * _GRID_COLUMNS + column
+
+
+def _fill_bbox_grid(subunits):
+    # Map each grid cell to the indexes of all subunits whose
+    # bounding box overlaps with it.
+    grid = {}
+    for i, subunit in enumerate(subunits):
+        (lon1, lat1, lon2, lat2) = subunit.bbox
+        first = _grid_cell(lat1, lon1)
+        last = _grid_cell(lat2, lon2)
+        for row in range(first // _GRID_COLUMNS, last // _GRID_COLUMNS + 1):
+            for column in range(first % _GRID_COLUMNS,
+                                last % _GRID_COLUMNS + 1):
+                grid.setdefault(row * _GRID_COLUMNS + column, []).append(i)
+    return dict([(cell, tuple(indexes)) for cell, indexes in grid.items()])
+
+
 def aggregate_position(circles, minimum_accuracy):
     """
     Calculate the aggregate position based on a number of circles
@@ -73,6 +141,33 @@ def centroid(points):
     return (float(avg_lat), float(avg_lon))
 
 
+def group_centroids(points, offsets):
+    """
+    Compute the centroids for multiple groups of points in one call.
+
+    The points for all groups are passed in as one two-dimensional
+    lat/lon array. The offsets sequence contains the start index of
+    each group and as its last entry the total number of points.
+
+    Returns a two-dimensional lat/lon array with one row per group.
+
+    Uses :func:`ichnaea._geocalc.group_centroids` internally.
+    """
+    return _geocalc.group_centroids(
+        _as_points(points), numpy.asarray(offsets, dtype=numpy.intp))
+
+
+def bbox_diagonals(boxes):
+    """
+    Compute the length of the diagonal in meters for many bounding boxes
+    in one call. Each box is given as a
+    (min_lat, min_lon, max_lat, max_lon) row.
+
+    Uses :func:`ichnaea._geocalc.bbox_diagonals` internally.
+    """
+    return _geocalc.bbox_diagonals(_as_points(boxes, columns=4))
+
+
 def circle_radius(lat, lon, max_lat, max_lon, min_lat, min_lon):
     """
     Compute the maximum distance, in meters, from a (lat, lon) point
@@ -94,8 +189,14 @@ def country_for_location(lat, lon):
     Return a ISO alpha2 country code matching the provided location.
     If the location is found inside multiple or no countries return None.
     """
+    if lat is None or lon is None or not (
+            -90.0 <= lat <= 90.0 and -180.0 <= lon <= 180.0):
+        return None
+
+    tables = country_tables()
     res = set()
-    for subunit in _bbox_cache:
+    for i in tables.grid.get(_grid_cell(lat, lon), ()):
+        subunit = tables.subunits[i]
         (lon1, lat1, lon2, lat2) = subunit.bbox
         if (lon1 <= lon <= lon2) and (lat1 <= lat <= lat2):
             res.add(subunit.alpha2)
@@ -107,12 +208,52 @@ def country_for_location(lat, lon):
     return None
 
 
+def countries_for_locations(points):
+    """
+    Return a list of ISO alpha2 country codes matching the provided
+    locations (two-dimensional lat/lon array), using the same rules
+    as :func:`~ichnaea.geocalc.country_for_location`.
+
+    All points are checked against the candidate bounding boxes of
+    their grid cell in one vectorized operation.
+    """
+    points = _as_points(points)
+    if not len(points):
+        return []
+
+    lats = points[:, [0]]
+    lons = points[:, [1]]
+    valid = ((lats >= -90.0) & (lats <= 90.0) &
+             (lons >= -180.0) & (lons <= 180.0))
+    cells = _grid_cells(numpy.where(valid, lats, 0.0)[:, 0],
+                        numpy.where(valid, lons, 0.0)[:, 0])
+
+    # candidate subunit indexes per point, padded with -1
+    tables = country_tables()
+    candidates = tables.grid_table[cells]
+    boxes = tables.bounds[candidates]
+    inside = (valid & (candidates >= 0) &
+              (boxes[:, :, 0] <= lons) & (lons <= boxes[:, :, 2]) &
+              (boxes[:, :, 1] <= lats) & (lats <= boxes[:, :, 3]))
+
+    # a point matches a single country if the smallest and largest
+    # matching country ids are the same
+    codes = tables.codes[candidates]
+    lowest = numpy.where(inside, codes, len(tables.alpha2)).min(axis=1)
+    highest = numpy.where(inside, codes, -1).max(axis=1)
+
+    result = [None] * len(points)
+    for index in numpy.nonzero(lowest == highest)[0]:
+        result[index] = tables.alpha2[lowest[index]]
+    return result
+
+
 def country_matches_location(lat, lon, country_code, margin=0):
     """
     Return whether or not a given (lat, lon) pair is inside one of the
     country subunits associated with a given alpha2 country code.
     """
-    for country in country_subunits_by_iso_code(country_code):
+    for country in _subunits_by_code(country_code):
         (lon1, lat1, lon2, lat2) = country.bbox
         if lon1 - margin <= lon and lon <= lon2 + margin and \
            lat1 - margin <= lat and lat <= lat2 + margin:
@@ -135,13 +276,10 @@ def country_max_radius(country_code):
     if value:
         return value
 
-    diagonals = []
-    for country in country_subunits_by_iso_code(country_code):
-        (lon1, lat1, lon2, lat2) = country.bbox
-        diagonals.append(distance(lat1, lon1, lat2, lon2))
-    if diagonals:
+    diagonals = _country_diagonals(_subunits_by_code(country_code))
+    if len(diagonals):
         # Divide by two to get radius, round to 1 km and convert to meters
-        radius = max(diagonals) / 2.0 / 1000.0
+        radius = float(diagonals.max()) / 2.0 / 1000.0
         value = _radius_cache[country_code] = round(radius) * 1000.0
 
     return value
@@ -157,6 +295,28 @@ def distance(lat1, lon1, lat2, lon2):
     return _geocalc.distance(lat1, lon1, lat2, lon2)
 
 
+def distance_matrix(points1, points2):
+    """
+    Compute the pairwise distances in meters between two sets of points
+    (two-dimensional lat/lon arrays).
+
+    Returns an array of shape (len(points1), len(points2)).
+
+    Uses :func:`ichnaea._geocalc.distance_matrix` internally.
+    """
+    return _geocalc.distance_matrix(_as_points(points1), _as_points(points2))
+
+
+def point_distances(lat, lon, points):
+    """
+    Compute the distances in meters from a (lat, lon) point to each
+    of the points in a two-dimensional lat/lon array.
+
+    Uses :func:`ichnaea._geocalc.point_distances` internally.
+    """
+    return _geocalc.point_distances(lat, lon, _as_points(points))
+
+
 def latitude_add(lat, lon, meters):
     """
     Return a latitude in degrees which is shifted by
@@ -185,5 +345,78 @@ def longitude_add(lat, lon, meters):
                    constants.MAX_LON))
 
 
-# fill the bbox cache
-_bbox_cache = _fill_bbox_cache()
+def _fill_bbox_arrays(subunits, grid):
+    # Return numpy versions of the bounding boxes and grid index,
+    # used by the vectorized countries_for_locations function.
+    alpha2 = sorted(set([subunit.alpha2 for subunit in subunits]))
+    alpha2_ids = dict([(code, i) for i, code in enumerate(alpha2)])
+    codes = numpy.array(
+        [alpha2_ids[subunit.alpha2] for subunit in subunits] + [-1],
+        dtype=numpy.intp)
+    # the last entry is a dummy box never matching any point
+    bounds = numpy.array(
+        [subunit.bbox for subunit in subunits] + [(1.0, 1.0, -1.0, -1.0)],
+        dtype=numpy.double)
+    width = max([len(indexes) for indexes in grid.values()] + [1])
+    table = numpy.full((_GRID_ROWS * _GRID_COLUMNS, width), -1,
+                       dtype=numpy.intp)
+    for cell, indexes in grid.items():
+        table[cell, :len(indexes)] = indexes
+    return (alpha2, codes, bounds, table)
+
+
+def _fill_country_tables(subunits):
+    by_code = {}
+    for subunit in subunits:
+        by_code.setdefault(subunit.alpha2, []).append(subunit)
+        by_code.setdefault(subunit.alpha3, []).append(subunit)
+    grid = _fill_bbox_grid(subunits)
+    alpha2, codes, bounds, grid_table = _fill_bbox_arrays(subunits, grid)
+    return CountryTables(subunits=subunits, by_code=by_code, grid=grid,
+                         alpha2=alpha2, codes=codes, bounds=bounds,
+                         grid_table=grid_table)
+
+
+def country_tables():
+    """
+    Return the :class:`CountryTables` lookup tables, loading the
+    country subunits snapshot and building the tables on first use.
+    """
+    global _country_tables
+    if _country_tables is None:
+        from ichnaea.geocalc_snapshot import SUBUNITS
+        _country_tables = _fill_country_tables(
+            [Subunit(*values) for values in SUBUNITS])
+    return _country_tables
+
+
+def _subunits_by_code(country_code):
+    if not isinstance(country_code, string_types):
+        return []
+    return country_tables().by_code.get(country_code.upper(), [])
+
+
+def write_snapshot(filename):
+    """
+    Write the country subunits computed from the `country_bounding_boxes`
+    data set into a Python module, to be used as
+    :mod:`ichnaea.geocalc_snapshot`.
+
+    This needs to be re-run whenever the `country_bounding_boxes`
+    dependency is updated.
+    """
+    lines = [
+        '"""',
+        'Pre-computed country subunits, generated by',
+        ':func:`ichnaea.geocalc.write_snapshot`, do not edit.',
+        '"""',
+        '',
+        'SUBUNITS = [',
+    ]
+    for subunit in _fill_bbox_cache():
+        lines.append('    (%r,' % (tuple(subunit.bbox), ))
+        lines.append('     %r, %r, %r),' % (
+            str(subunit.alpha2), str(subunit.alpha3), subunit.radius))
+    lines.append(']')
+    with open(filename, 'w') as fd:
+        fd.write('\n'.join(lines) + '\n')
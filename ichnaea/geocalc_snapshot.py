@@ -0,0 +1,637 @@
+"""
+Pre-computed country subunits, generated by
+:func:`ichnaea.geocalc.write_snapshot`, do not edit.
+"""
+
+SUBUNITS = [
+    ((73.6073242187, 20.2637207031, 134.75234375, 53.5556152344),
+     'CN', 'CHN', 3157996),
+    ((-74.0020507813, -33.7421875, -34.80546875, 5.25795898437),
+     'BR', 'BRA', 2990300),
+    ((52.7350585938, 42.3025390625, 180.0, 81.28046875),
+     'RU', 'RUS', 2964332),
+    ((-124.709960938, 24.5423339844, -66.9870117187, 49.3696777344),
+     'US', 'USA', 2826310),
+    ((95.206640625, -10.9096679688, 140.976171875, 5.90703125),
+     'ID', 'IDN', 2699858),
+    ((-141.002148438, 41.6748535156, -52.6536621094, 83.1161132813),
+     'CA', 'CAN', 2696181),
+    ((112.908203125, -39.1455078125, 153.616894531, -10.0517578125),
+     'AU', 'AUS', 2582221),
+    ((27.351953125, 41.1992675781, 68.9416992188, 81.8541992187),
+     'RU', 'RUS', 2388737),
+    ((-75.7081054687, -55.8916992188, -66.4357910156, -17.5060546875),
+     'CL', 'CHL', 2169741),
+    ((68.1650390625, 8.0783203125, 97.3435546875, 35.4958984375),
+     'IN', 'IND', 2126243),
+    ((-73.5762695312, -55.0321289062, -53.6685546875, -21.8025390625),
+     'AR', 'ARG', 2024878),
+    ((-118.401367187, 14.5454101562, -86.6962890625, 32.7153320313),
+     'MX', 'MEX', 1892812),
+    ((46.6091796875, 40.6086425781, 87.3228515625, 55.3895996094),
+     'KZ', 'KAZ', 1689950),
+    ((-178.19453125, 51.6036621094, -130.0140625, 71.4076660156),
+     'US', 'USA', 1610667),
+    ((-180.0, -89.9989257812, -0.1845703125, -61.07265625),
+     'AQ', 'ATA', 1608346),
+    ((-72.8180664062, 59.8154785156, -11.4255371094, 83.599609375),
+     'GL', 'GRL', 1536855),
+    ((-174.540820313, -11.4568359375, -151.782617188, 3.92353515625),
+     'KI', 'KIR', 1521662),
+    ((12.213671875, -13.4538085938, 31.2740234375, 5.312109375),
+     'CD', 'COD', 1481769),
+    ((-8.68334960938, 18.9866210938, 11.9678710938, 37.0923828125),
+     'DZ', 'DZA', 1421921),
+    ((138.061914063, 5.27724609375, 162.993457031, 9.59331054687),
+     'FM', 'FSM', 1394745),
+    ((5.68434188608e-14, -89.9989257812, 180.0, -65.1296875),
+     'AQ', 'ATA', 1382786),
+    ((34.6162109375, 16.3717773438, 55.641015625, 32.1245117188),
+     'SA', 'SAU', 1374488),
+    ((87.7431640625, 41.5955078125, 119.897851563, 52.1172851562),
+     'MN', 'MNG', 1340566),
+    ((-81.3366210937, -18.3456054688, -68.6852539062, -0.041748046875),
+     'PE', 'PER', 1230138),
+    ((44.0232421875, 25.1020996094, 63.3051757812, 39.7685546875),
+     'IR', 'IRN', 1213001),
+    ((-12.2806152344, 10.1432617187, 4.23466796875, 24.9956054688),
+     'ML', 'MLI', 1200857),
+    ((21.8252929688, 8.665625, 38.6094726563, 22.2024414063),
+     'SD', 'SDN', 1170676),
+    ((99.6462890625, 0.861962890625, 119.266308594, 7.35166015625),
+     'MY', 'MYS', 1145700),
+    ((-79.0254394531, -4.2359375, -66.8760253906, 12.434375),
+     'CO', 'COL', 1144411),
+    ((92.1795898438, 9.875390625, 101.147265625, 28.5170410156),
+     'MM', 'MMR', 1137173),
+    ((-17.0030761719, 21.420703125, -1.06552734375, 35.9298828125),
+     'MA', 'MAR', 1117154),
+    ((9.31025390625, 19.4966308594, 25.1504882813, 33.1819335937),
+     'LY', 'LBY', 1093565),
+    ((60.843359375, 23.7533691406, 77.0486328125, 37.0366699219),
+     'PK', 'PAK', 1069018),
+    ((30.2217773438, -26.8616210938, 40.84453125, -10.4643554688),
+     'MZ', 'MOZ', 1068277),
+    ((16.4475585938, -34.7857421875, 32.8861328125, -22.1462890625),
+     'ZA', 'ZAF', 1064606),
+    ((0.1638671875, 11.6962890625, 15.9631835938, 23.5178710938),
+     'NE', 'NER', 1062690),
+    ((-151.512402344, -20.8758789063, -136.293896484, -8.78154296875),
+     'PF', 'PYF', 1057297),
+    ((13.4482421875, 7.47529296875, 23.9833984375, 23.4452148437),
+     'TD', 'TCD', 1050920),
+    ((32.9989257813, 3.45610351562, 47.9782226563, 14.8522949219),
+     'ET', 'ETH', 1036803),
+    ((116.96953125, 5.06020507812, 126.593359375, 20.8412597656),
+     'PH', 'PHL', 1019651),
+    ((128.649121094, 30.24140625, 141.329199219, 45.4654785156),
+     'JP', 'JPN', 1010271),
+    ((11.7430664063, -18.0197265625, 24.0466796875, -4.42890625),
+     'AO', 'AGO', 1009315),
+    ((-73.3662109375, 0.68798828125, -59.82890625, 12.1778808594),
+     'VE', 'VEN', 982573),
+    ((-69.645703125, -22.8916992188, -57.4956542969, -9.71044921875),
+     'BO', 'BOL', 977223),
+    ((11.7216796875, -28.9387695313, 25.2587890625, -16.9676757813),
+     'NA', 'NAM', 959290),
+    ((40.964453125, -1.6953125, 51.390234375, 11.9836914062),
+     'SO', 'SOM', 953962),
+    ((4.7990234375, 58.0209472656, 30.9606445313, 71.1420898438),
+     'NO', 'NOR', 944605),
+    ((-17.0639648438, 14.7453613281, -4.82260742187, 27.2859375),
+     'MR', 'MRT', 941923),
+    ((97.3739257812, 5.63676757813, 105.641015625, 20.4244140625),
+     'TH', 'THA', 935492),
+    ((140.862304687, -11.6305664062, 154.280761719, -1.35322265625),
+     'PG', 'PNG', 935080),
+    ((102.127441406, 8.58325195312, 109.444921875, 23.3452148438),
+     'VN', 'VNM', 908578),
+    ((25.6689453125, 35.8314453125, 44.8171875, 42.0932617188),
+     'TR', 'TUR', 895473),
+    ((14.4311523438, 2.27006835937, 27.4033203125, 10.9962402344),
+     'CF', 'CAF', 864596),
+    ((29.3234375, -11.7162109375, 40.4635742188, -0.994921875),
+     'TZ', 'TZA', 856185),
+    ((55.9756835938, 37.1722167969, 73.1369140625, 45.5553710938),
+     'UZ', 'UZB', 851644),
+    ((2.68603515625, 4.27739257813, 14.6271484375, 13.8728515625),
+     'NG', 'NGA', 844555),
+    ((43.2571289063, -25.5705078125, 50.4827148438, -12.0795898437),
+     'MG', 'MDG', 840385),
+    ((21.97890625, -18.0415039062, 33.6615234375, -8.19365234375),
+     'ZM', 'ZMB', 835886),
+    ((60.4857421875, 29.3919433594, 74.8913085938, 38.4563964844),
+     'AF', 'AFG', 832309),
+    ((11.1471679688, 55.3463867188, 24.15546875, 69.0368652344),
+     'SE', 'SWE', 828503),
+    ((24.7032226563, 21.9948730469, 36.8713867188, 31.6549804687),
+     'EG', 'EGY', 806919),
+    ((22.1318359375, 44.3875976562, 40.1283203125, 52.3535644531),
+     'UA', 'UKR', 795300),
+    ((24.1473632813, 3.49072265625, 35.268359375, 12.2230957031),
+     'SS', 'SSD', 781068),
+    ((8.5328125, 1.67622070312, 16.1833984375, 13.078515625),
+     'CM', 'CMR', 761051),
+    ((52.4938476563, 35.1708007813, 66.629296875, 42.7784667969),
+     'TM', 'TKM', 741492),
+    ((51.6592773438, -49.7098632812, 70.55546875, -46.3268554687),
+     'TF', 'ATF', 725289),
+    ((33.9, -4.6923828125, 41.883984375, 5.49228515625),
+     'KE', 'KEN', 719123),
+    ((6.627734375, 37.9391113281, 18.4858398438, 47.0821289063),
+     'IT', 'ITA', 701734),
+    ((19.97734375, -26.8541992188, 29.36484375, -17.7875976562),
+     'BW', 'BWA', 697421),
+    ((-4.7625, 42.3404785156, 8.14033203125, 51.0971191406),
+     'FR', 'FRA', 690137),
+    ((-9.23564453125, 36.0259277344, 3.30673828125, 43.7645507812),
+     'ES', 'ESP', 685214),
+    ((155.677539063, -11.8322265625, 166.929199219, -6.60888671875),
+     'SB', 'SLB', 682129),
+    ((51.9776367188, 16.6483886719, 59.8375, 26.3563476563),
+     'OM', 'OMN', 675281),
+    ((42.5490234375, 12.6076660156, 53.0856445313, 18.9961425781),
+     'YE', 'YEM', 665886),
+    ((130.889257813, 33.4869628906, 141.993164062, 41.5055664062),
+     'JP', 'JPN', 661280),
+    ((38.7735351563, 29.063671875, 48.546484375, 37.371875),
+     'IQ', 'IRQ', 647313),
+    ((11.1301757813, -5.004296875, 18.6221679688, 3.6873046875),
+     'CG', 'COG', 637697),
+    ((-62.6509765625, -27.5538085938, -54.241796875, -19.2862304688),
+     'PY', 'PRY', 628317),
+    ((20.6221679688, 59.816015625, 31.5365234375, 70.06484375),
+     'FI', 'FIN', 622883),
+    ((100.114941406, 13.9211914063, 107.653125, 22.4952636719),
+     'LA', 'LAO', 620744),
+    ((174.587207031, -21.705859375, 180.0, -12.476953125),
+     'FJ', 'FJI', 588031),
+    ((-84.8872070313, 19.85546875, -74.1368164063, 23.1904296875),
+     'CU', 'CUB', 585904),
+    ((-17.0987792969, 20.8061523438, -8.68212890625, 27.6564453125),
+     'EH', 'ESH', 571608),
+    ((25.2240234375, -22.4020507813, 33.0067382813, -15.6430664062),
+     'ZW', 'ZWE', 555211),
+    ((5.85751953125, 47.2788085938, 15.0166015625, 55.0587402344),
+     'DE', 'DEU', 536684),
+    ((-5.52353515625, 9.42470703125, 2.38916015625, 15.0778808594),
+     'BF', 'BFA', 532373),
+    ((19.646484375, 34.9344726563, 28.2318359375, 41.7437988281),
+     'GR', 'GRC', 531898),
+    ((69.2291015625, 39.2075195312, 80.2461914063, 43.2403808594),
+     'KG', 'KGZ', 511806),
+    ((-15.0512207031, 7.21591796875, -7.68120117187, 12.6739257812),
+     'GN', 'GIN', 504809),
+    ((166.477636719, -47.263671875, 174.370117188, -40.4900390625),
+     'NZ', 'NZL', 491279),
+    ((-61.3908203125, 1.20122070312, -56.4828125, 8.54931640625),
+     'GY', 'GUY', 490631),
+    ((-8.60356445312, 4.35131835938, -2.505859375, 10.7240722656),
+     'CI', 'CIV', 488226),
+    ((-80.9627929687, -4.990625, -75.249609375, 1.45537109375),
+     'EC', 'ECU', 478673),
+    ((36.4267578125, 12.3765625, 43.1166992187, 18.005078125),
+     'ER', 'ERI', 476059),
+    ((172.705957031, -41.6106445312, 178.536230469, -34.4291015625),
+     'NZ', 'NZL', 473674),
+    ((8.703125, -3.91630859375, 14.4805664063, 2.30219726562),
+     'GA', 'GAB', 471790),
+    ((14.1286132813, 49.0207519531, 24.1057617188, 54.8381835937),
+     'PL', 'POL', 469926),
+    ((159.928222656, -22.6611328125, 168.1390625, -19.1146484375),
+     'NC', 'NCL', 469742),
+    ((32.6704101562, -17.1310546875, 35.8927734375, -9.39501953125),
+     'MW', 'MWI', 464049),
+    ((-78.9856445312, 20.9374023438, -72.747265625, 26.9400878906),
+     'BS', 'BHS', 460115),
+    ((-180.0, 64.2797363281, -169.729150391, 71.5961914063),
+     'RU', 'RUS', 458434),
+    ((80.0516601563, 26.3603027344, 88.1615234375, 30.3875),
+     'NP', 'NPL', 455344),
+    ((20.241796875, 43.6708007812, 29.705859375, 48.2634765625),
+     'RO', 'ROU', 445532),
+    ((176.7, -12.7, 180.0, -5.4),
+     'TV', 'TUV', 444414),
+    ((176.7, -12.7, 180.0, -5.4),
+     'TV', 'TUV', 444414),
+    ((7.49560546875, 30.2293945312, 11.5359375, 37.3403808594),
+     'TN', 'TUN', 437093),
+    ((29.5619140625, -1.469921875, 34.9782226563, 4.22021484375),
+     'UG', 'UGA', 436618),
+    ((10.5576171875, 74.3521484375, 33.629296875, 80.4778320312),
+     'SJ', 'SJM', 434283),
+    ((-3.24389648438, 4.76245117188, 1.18720703125, 11.1668945312),
+     'GH', 'GHA', 431563),
+    ((23.1750976563, 51.2650390625, 32.7102539063, 56.1458007812),
+     'BY', 'BLR', 414209),
+    ((67.349609375, 36.6840332031, 75.11875, 41.0351074219),
+     'TJ', 'TJK', 414031),
+    ((-17.5356445312, 12.3280273437, -11.382421875, 16.67890625),
+     'SN', 'SEN', 410047),
+    ((35.764453125, 32.3172851562, 42.3590820313, 37.297265625),
+     'SY', 'SYR', 408795),
+    ((-5.65625, 50.0213867188, 1.74658203125, 55.8079589844),
+     'GB', 'GBR', 405852),
+    ((166.526074219, -20.241796875, 169.896289063, -13.7094726563),
+     'VU', 'VUT', 404933),
+    ((166.844726563, 5.7998046875, 171.756835937, 11.1686523438),
+     'MH', 'MHL', 402494),
+    ((88.0234375, 20.7904296875, 92.631640625, 26.5715332031),
+     'BD', 'BGD', 397844),
+    ((124.348632812, 37.7190429687, 130.687304688, 42.9981445313),
+     'KP', 'PRK', 397576),
+    ((-7.54296875, 54.689453125, -0.774267578125, 60.8318847656),
+     'GB', 'GBR', 395680),
+    ((42.6564453125, 7.9970703125, 48.9385742188, 11.4998046875),
+     'SO', 'SOM', 395441),
+    ((-89.3625976562, 12.9792480469, -83.1575195312, 16.5139648438),
+     'HN', 'HND', 387137),
+    ((123.679785156, 24.2660644531, 129.714648438, 28.5174804688),
+     'JP', 'JPN', 382248),
+    ((0.76337890625, 6.216796875, 3.83447265625, 12.3838378906),
+     'BJ', 'BEN', 381999),
+    ((169.522949219, -1.26337890625, 174.77890625, 3.14877929687),
+     'KI', 'KIR', 381445),
+    ((102.319726563, 10.4112304687, 107.60546875, 14.705078125),
+     'KH', 'KHM', 373125),
+    ((-58.4381347656, -34.9328125, -53.1255859375, -30.1010742188),
+     'UY', 'URY', 366196),
+    ((-83.02734375, 7.22006835938, -77.1959960937, 9.5978515625),
+     'PA', 'PAN', 346874),
+    ((-87.6701660156, 10.7353515625, -83.1575195312, 15.0080566406),
+     'NI', 'NIC', 340910),
+    ((-160.243457031, 18.9639160156, -154.804199219, 22.2231445312),
+     'US', 'USA', 336056),
+    ((139.820898438, 41.4232421875, 145.833007812, 45.5095214844),
+     'JP', 'JPN', 332188),
+    ((13.5171875, 42.4329101562, 19.4009765625, 46.5346191406),
+     'HR', 'HRV', 326127),
+    ((131.134960938, 3.021875, 134.659570313, 7.712109375),
+     'PW', 'PLW', 325638),
+    ((-11.5075195312, 4.35131835938, -7.39990234375, 8.5376953125),
+     'LR', 'LBR', 325033),
+    ((-58.0544921875, 1.84223632812, -53.9904785156, 5.99345703125),
+     'SR', 'SUR', 322582),
+    ((9.5240234375, 46.3997070312, 17.1473632813, 49.0011230469),
+     'AT', 'AUT', 319614),
+    ((-9.47973632812, 37.0054199219, -6.2125, 42.1374023437),
+     'PT', 'PRT', 317764),
+    ((-92.23515625, 13.7365234375, -88.2283203125, 17.81640625),
+     'GT', 'GTM', 312065),
+    ((34.95078125, 29.1904785156, 39.2927734375, 33.3722167969),
+     'JO', 'JOR', 310760),
+    ((51.568359375, 22.621484375, 56.3879882813, 26.0681640625),
+     'AE', 'ARE', 310300),
+    ((-24.4756835937, 63.4066894531, -13.5561035156, 66.5260742187),
+     'IS', 'ISL', 309303),
+    ((-31.2829589844, 36.9415527344, -25.02734375, 39.5208496094),
+     'PT', 'PRT', 308445),
+    ((39.9783203125, 41.0702148437, 46.6725585938, 43.5697753906),
+     'GE', 'GEO', 308157),
+    ((44.7682617188, 38.3987304687, 50.3659179688, 41.8909667969),
+     'AZ', 'AZE', 306952),
+    ((22.3440429688, 41.2435546875, 28.5853515625, 44.2377929688),
+     'BG', 'BGR', 304267),
+    ((16.0930664063, 45.7530273437, 22.8766601563, 48.5534667969),
+     'HU', 'HUN', 299870),
+    ((-0.090185546875, 6.08940429687, 1.7779296875, 11.115625),
+     'TG', 'TGO', 297705),
+    ((143.838574219, -43.6193359375, 148.47421875, -39.5801757813),
+     'AU', 'AUS', 295829),
+    ((126.007519531, 34.2964355469, 129.572851563, 38.6234375),
+     'KR', 'KOR', 288540),
+    ((12.0897460938, 48.5762207031, 18.8322265625, 51.0377929687),
+     'CZ', 'CZE', 277796),
+    ((-82.39, 11.16, -79.6, 15.33),
+     'CO', 'COL', 276652),
+    ((-180.0, -20.6705078125, -178.251123047, -16.1260742188),
+     'FJ', 'FJI', 268966),
+    ((172.494824219, 51.3722167969, 179.779980469, 53.0129882813),
+     'US', 'USA', 264372),
+    ((145.152148438, 14.111328125, 145.835449219, 18.8067871094),
+     'MP', 'MNP', 263583),
+    ((118.287304688, 21.925, 121.929003906, 25.2769042969),
+     'TW', 'TWN', 262934),
+    ((-54.6162597656, 2.12104492187, -51.6525390625, 5.7822265625),
+     'GF', 'GUF', 261622),
+    ((-10.390234375, 51.4737304688, -6.02739257812, 55.3658203125),
+     'IE', 'IRL', 260120),
+    ((21.0149414063, 55.6675292969, 28.2020507813, 58.0634277344),
+     'LV', 'LVA', 255635),
+    ((-85.9080078125, 8.07065429687, -82.5635742187, 11.189453125),
+     'CR', 'CRI', 252317),
+    ((-18.160546875, 27.6463867188, -13.4229492187, 29.2372070313),
+     'ES', 'ESP', 247892),
+    ((79.7078125, 5.94936523438, 81.876953125, 9.8126953125),
+     'LK', 'LKA', 245764),
+    ((-13.2926757812, 6.90654296875, -10.283203125, 9.99653320312),
+     'SL', 'SLE', 238531),
+    ((34.2453125, 29.47734375, 35.9134765625, 33.4317382812),
+     'IL', 'ISR', 233645),
+    ((20.8998046875, 53.89296875, 26.7756835938, 56.4111816406),
+     'LT', 'LTU', 233207),
+    ((16.8626953125, 47.7634277344, 22.538671875, 49.5977050781),
+     'SK', 'SVK', 231893),
+    ((-72.000390625, 17.6355957031, -68.3391601562, 19.9139648437),
+     'DO', 'DOM', 230608),
+    ((8.121484375, 54.6288574219, 12.6657226563, 57.7369140625),
+     'DK', 'DNK', 222680),
+    ((19.1184570313, 42.2421386719, 22.9768554688, 45.0977050781),
+     'RS', 'SRB', 221944),
+    ((21.8544921875, 57.5254882812, 28.1510742188, 59.6390136719),
+     'EE', 'EST', 216909),
+    ((26.6189453125, 45.4504394531, 30.1310546875, 48.477734375),
+     'MD', 'MDA', 214627),
+    ((3.133, 50.75, 7.217, 53.683),
+     'NL', 'NLD', 214274),
+    ((16.2263671875, 42.5597167969, 19.5837890625, 45.2765625),
+     'BA', 'BIH', 202188),
+    ((5.97001953125, 45.8300292969, 10.4545898438, 47.7756347656),
+     'CH', 'CHE', 202011),
+    ((129.580078125, 31.0151367188, 132.00859375, 33.9277832031),
+     'JP', 'JPN', 197969),
+    ((15.7366210938, 42.5866699219, 19.0412109375, 45.2157226563),
+     'BA', 'BIH', 197170),
+    ((-25.3415527344, 14.8182128906, -22.6818847656, 17.1936523438),
+     'CV', 'CPV', 194014),
+    ((-16.7118164062, 10.9401367188, -13.6735351562, 12.6799316406),
+     'GW', 'GNB', 191553),
+    ((43.439453125, 38.8690429688, 46.584765625, 41.2909667969),
+     'AM', 'ARM', 189800),
+    ((88.7387695312, 26.7015625, 92.0833984375, 28.3111816406),
+     'BT', 'BTN', 187633),
+    ((-74.478125, 18.0391601563, -71.6453125, 20.0936523438),
+     'HT', 'HTI', 187621),
+    ((19.2806640625, 39.653515625, 21.0310546875, 42.6479492188),
+     'AL', 'ALB', 181884),
+    ((-175.362353516, -21.4505859375, -173.921875, -18.5653320313),
+     'TO', 'TON', 177182),
+    ((92.3528320313, 10.5207519531, 93.0766601563, 13.5454589844),
+     'IN', 'IND', 172709),
+    ((72.7724609375, 8.251953125, 73.08359375, 11.2627441406),
+     'IN', 'IND', 168258),
+    ((-16.8248046875, 13.0641601562, -13.8267089844, 13.812109375),
+     'GM', 'GMB', 167368),
+    ((12.435546875, 36.6878417969, 15.6346679688, 38.2958984375),
+     'IT', 'ITA', 167043),
+    ((108.635644531, 18.2182617188, 111.013671875, 20.1377441406),
+     'CN', 'CHN', 164256),
+    ((-89.2375, 15.888671875, -87.7886230469, 18.4823242188),
+     'BZ', 'BLZ', 163446),
+    ((165.889160156, -52.5703125, 169.233496094, -50.5309570312),
+     'NZ', 'NZL', 161904),
+    ((27.0517578125, -30.6422851563, 29.3907226563, -28.5817382813),
+     'LS', 'LSO', 160943),
+    ((-91.6541503906, -1.3419921875, -89.259375, 0.125830078125),
+     'EC', 'ECU', 156153),
+    ((29.0141601562, -4.455859375, 30.8114257813, -2.31298828125),
+     'BI', 'BDI', 155378),
+    ((1.22333984375, 38.6588378906, 4.3220703125, 40.0750976562),
+     'ES', 'ESP', 154710),
+    ((92.71328125, 6.74868164062, 93.9295898438, 9.24389648438),
+     'IN', 'IND', 154042),
+    ((132.032617188, 32.7520019531, 134.738867188, 34.3583984375),
+     'JP', 'JPN', 153932),
+    ((124.915039062, -9.5119140625, 127.29609375, -8.13994140625),
+     'TL', 'TLS', 151424),
+    ((28.8576171875, -2.80859375, 30.8765625, -1.0630859375),
+     'RW', 'RWA', 148331),
+    ((8.180859375, 38.9096679688, 9.8052734375, 41.2570800781),
+     'IT', 'ITA', 147666),
+    ((-90.1059082031, 13.1640136719, -87.7153320312, 14.4311035156),
+     'SV', 'SLV', 147044),
+    ((13.3782226563, 45.4283691406, 16.5162109375, 46.86328125),
+     'SI', 'SVN', 144808),
+    ((2.85546875, 49.5108886719, 6.364453125, 50.8059570312),
+     'BE', 'BEL', 144222),
+    ((-5.2623046875, 51.3904296875, -2.6623046875, 53.4192871094),
+     'GB', 'GBR', 143161),
+    ((-67.9370605469, 17.947265625, -65.2948730469, 18.5221679687),
+     'PR', 'PRI', 143134),
+    ((18.8390625, 44.6326171875, 21.533203125, 46.1691894531),
+     'RS', 'SRB', 135482),
+    ((20.4486328125, 40.8499023437, 23.0056640625, 42.3581542969),
+     'MK', 'MKD', 135385),
+    ((41.7646484375, 10.941015625, 43.409765625, 12.70859375),
+     'DJ', 'DJI', 132933),
+    ((9.3859375, 0.960107421875, 11.3353515625, 2.30444335938),
+     'GQ', 'GNQ', 131616),
+    ((154.540039063, -6.86279296875, 155.957617188, -5.0138671875),
+     'PG', 'PNG', 129272),
+    ((-61.1450195313, -52.3080078125, -57.791796875, -51.269921875),
+     'FK', 'FLK', 128937),
+    ((-178.194384766, -14.3249023437, -176.128076172, -13.2216796875),
+     'WF', 'WLF', 127323),
+    ((46.5314453125, 28.5331542969, 48.4424804688, 30.0973144531),
+     'KW', 'KWT', 127059),
+    ((2.52490234375, 50.6976074219, 5.89248046875, 51.4911132813),
+     'BE', 'BEL', 125576),
+    ((18.436328125, 41.8690917969, 20.34765625, 43.5423339844),
+     'ME', 'MNE', 121450),
+    ((-78.3395019531, 17.7149414062, -76.2107910156, 18.5222167969),
+     'JM', 'JAM', 121104),
+    ((19.6043945313, 54.3500976562, 22.83125, 55.2866699219),
+     'RU', 'RUS', 115726),
+    ((35.10859375, 33.0756835938, 36.5849609375, 34.6787109375),
+     'LB', 'LBN', 112189),
+    ((30.7875, -27.3099609375, 32.112890625, -25.74296875),
+     'SZ', 'SWZ', 109253),
+    ((-8.14482421875, 54.0512695312, -5.47041015625, 55.241796875),
+     'GB', 'GBR', 108537),
+    ((20.0294921875, 41.8538085937, 21.7529296875, 43.2610839844),
+     'RS', 'SRB', 105366),
+    ((8.565625, 41.3849121094, 9.5564453125, 43.021484375),
+     'FR', 'FRA', 99718),
+    ((50.7545898438, 24.5646484375, 51.6088867188, 26.1532714844),
+     'QA', 'QAT', 98198),
+    ((39.1823242188, -6.4537109375, 39.8709960937, -4.90615234375),
+     'TZ', 'TZA', 94098),
+    ((-81.4190917969, 19.271875, -79.7422851563, 19.7657226563),
+     'KY', 'CYM', 92057),
+    ((32.7126953125, 35.0003417969, 34.5560546875, 35.6620605469),
+     'CY', 'CYP', 91344),
+    ((43.2266601563, -12.3682617187, 44.5267578125, -11.3684570312),
+     'KM', 'COM', 89963),
+    ((114.063867187, 4.02397460938, 115.326757813, 5.02236328125),
+     'BN', 'BRN', 89332),
+    ((-38.0174316406, -54.866796875, -35.7985839844, -53.9840820313),
+     'GS', 'SGS', 86936),
+    ((32.3009765625, 34.5695800781, 34.0501953125, 35.1826660156),
+     'CY', 'CYP', 86759),
+    ((-172.498681641, -9.35830078125, -171.186425781, -8.546484375),
+     'TK', 'TKL', 85035),
+    ((-172.778515625, -14.047265625, -171.449560547, -13.465234375),
+     'WS', 'WSM', 78724),
+    ((34.8727539063, 31.3513183594, 35.5720703125, 32.5344238281),
+     'PS', 'PSE', 73587),
+    ((-61.9061035156, 10.0646484375, -60.9176269531, 10.840234375),
+     'TT', 'TTO', 69138),
+    ((53.3158203125, 12.3189941406, 54.5111328125, 12.7157714844),
+     'YE', 'YEM', 68524),
+    ((-17.3, 32.4, -16.25, 33.15),
+     'PT', 'PRT', 64403),
+    ((-7.42260742188, 61.4143066406, -6.4060546875, 62.3556640625),
+     'FO', 'FRO', 58722),
+    ((73.38203125, 3.22939453125, 73.5283203125, 4.24765625),
+     'MV', 'MDV', 57191),
+    ((5.725, 49.4454589844, 6.49375, 50.1671875),
+     'LU', 'LUX', 48692),
+    ((-61.7940917969, 15.8860351562, -61.1726074219, 16.506640625),
+     'GP', 'GLP', 47869),
+    ((-176.84765625, -44.3305664062, -176.122558594, -43.717578125),
+     'NZ', 'NZL', 44740),
+    ((-65.0236328125, 17.7017089844, -64.58046875, 18.3852050781),
+     'VI', 'VIR', 44641),
+    ((55.2328125, -21.3690429688, 55.8390625, -20.8651367188),
+     'RE', 'REU', 42113),
+    ((8.43427734375, 3.21708984375, 8.95068359375, 3.75830078125),
+     'GQ', 'GNQ', 41553),
+    ((126.165625, 33.2015136719, 126.93125, 33.5532226562),
+     'KR', 'KOR', 40569),
+    ((-61.353515625, 12.6947265625, -61.1240234375, 13.3587402344),
+     'VC', 'VCT', 38954),
+    ((57.3176757813, -20.5131835938, 57.7919921875, -19.9899414063),
+     'MU', 'MUS', 38188),
+    ((-72.3423828125, 21.7517089844, -71.6369140625, 21.9519042969),
+     'TC', 'TCA', 38067),
+    ((19.5190429688, 60.0116699219, 20.611328125, 60.4058105469),
+     'AX', 'ALA', 37289),
+    ((12.315, 35.487, 12.893, 35.885),
+     'IT', 'ITA', 34218),
+    ((113.838867187, 22.1951660156, 114.335253906, 22.5649902344),
+     'HK', 'HKG', 32771),
+    ((-61.2197265625, 14.4262695312, -60.8262695312, 14.8752929688),
+     'MQ', 'MTQ', 32728),
+    ((-64.6951171875, 18.3991210938, -64.2735839844, 18.7526855469),
+     'VG', 'VGB', 29663),
+    ((-69.1588867187, 12.0454589844, -68.7510742187, 12.3802734375),
+     'CW', 'CUW', 28941),
+    ((-9.09887695312, 70.8326660156, -7.97880859375, 71.1776855469),
+     'NO', 'NOR', 27905),
+    ((34.1981445313, 31.2083007812, 34.5255859375, 31.5848632812),
+     'PS', 'PSE', 26072),
+    ((124.036328125, -9.4279296875, 124.444433594, -9.19033203125),
+     'TL', 'TLS', 25997),
+    ((50.4524414063, 25.8067871094, 50.6174804688, 26.2464355469),
+     'BH', 'BHR', 25796),
+    ((-61.4811523437, 15.2272949219, -61.2510742187, 15.6331054688),
+     'DM', 'DMA', 25711),
+    ((144.649316406, 13.2575195312, 144.940820313, 13.6223632813),
+     'GU', 'GUM', 25689),
+    ((6.4681640625, 0.04736328125, 6.75, 0.40439453125),
+     'ST', 'STP', 25289),
+    ((-45.9562988281, -60.7330078125, -45.1728515625, -60.5208984375),
+     'AQ', 'ATA', 24403),
+    ((-4.7853515625, 54.0586914062, -4.33798828125, 54.4071777344),
+     'IM', 'IMN', 24222),
+    ((-62.8404785156, 17.1005859375, -62.5322265625, 17.4025878906),
+     'KN', 'KNA', 23447),
+    ((-61.0731445312, 13.717578125, -60.8867675781, 14.093359375),
+     'LC', 'LCA', 23187),
+    ((73.251171875, -53.1845703125, 73.8377929688, -52.9663085938),
+     'HM', 'HMD', 23046),
+    ((14.1803710938, 35.8202148437, 14.5662109375, 36.07578125),
+     'MT', 'MLT', 22438),
+    ((103.650195312, 1.26538085938, 103.996386719, 1.4470703125),
+     'SG', 'SGP', 21732),
+    ((14.6841796875, 55.0049316406, 15.137109375, 55.2967285156),
+     'DK', 'DNK', 21684),
+    ((-56.3869140625, 46.7528320312, -56.1373535156, 47.0989746094),
+     'PM', 'SPM', 21451),
+    ((45.042578125, -12.9849609375, 45.2231445312, -12.6530273438),
+     'YT', 'MYT', 20890),
+    ((-59.6466796875, 13.0622070312, -59.4276367187, 13.3176757813),
+     'BB', 'BRB', 18502),
+    ((-60.8106445312, 11.1686035156, -60.5254882812, 11.325390625),
+     'TT', 'TTO', 17826),
+    ((1.41484375, 42.4344726562, 1.740234375, 42.6427246094),
+     'AD', 'AND', 17656),
+    ((-68.37109375, 12.0320800781, -68.2058105469, 12.301953125),
+     'BQ', 'BES', 17487),
+    ((158.8359375, -54.74921875, 158.958886719, -54.4723632813),
+     'AU', 'AUS', 15893),
+    ((-61.7821777344, 12.0084472656, -61.60703125, 12.2370117187),
+     'GD', 'GRD', 15878),
+    ((55.3833984375, -4.785546875, 55.54296875, -4.5587890625),
+     'SC', 'SYC', 15398),
+    ((-170.820507813, -14.359765625, -170.568115234, -14.257421875),
+     'AS', 'ASM', 14739),
+    ((72.3497070313, -7.4353515625, 72.4985351562, -7.22041015625),
+     'IO', 'IOT', 14496),
+    ((-61.887109375, 16.9971679687, -61.6860351562, 17.1689453125),
+     'AG', 'ATG', 14331),
+    ((-70.0661132812, 12.4229980469, -69.895703125, 12.6141113281),
+     'AW', 'ABW', 14087),
+    ((37.5900390625, -46.962890625, 37.8876953125, -46.8240234375),
+     'ZA', 'ZAF', 13692),
+    ((9.4794921875, 47.0573730469, 9.610546875, 47.2707519531),
+     'LI', 'LIE', 12856),
+    ((-169.948339844, -19.137890625, -169.793408203, -18.966015625),
+     'NU', 'NIU', 12554),
+    ((-109.434130859, -27.1712890625, -109.222851562, -27.068359375),
+     'CL', 'CHL', 11918),
+    ((-64.8628417969, 32.2596191406, -64.6683105469, 32.3869140625),
+     'BM', 'BMU', 11559),
+    ((-78.989453125, -33.6677734375, -78.7689453125, -33.5751953125),
+     'CL', 'CHL', 11432),
+    ((-61.86875, 17.5486816406, -61.7471191406, 17.7140625),
+     'AG', 'ATG', 11228),
+    ((7.3306640625, 1.54155273437, 7.45234375, 1.69912109375),
+     'ST', 'STP', 11066),
+    ((-63.1600097656, 18.1713867188, -62.9795898437, 18.2697265625),
+     'AI', 'AIA', 10985),
+    ((105.584082031, -10.5641601563, 105.725390625, -10.4306640625),
+     'CX', 'CXR', 10712),
+    ((4.2146484375, 50.7760253906, 4.44169921875, 50.900390625),
+     'BE', 'BEL', 10552),
+    ((-2.23583984375, 49.1698242187, -2.00991210937, 49.2663574219),
+     'JE', 'JEY', 9804),
+    ((-5.78251953125, -16.0040039063, -5.65971679687, -15.9061523438),
+     'SH', 'SHN', 8525),
+    ((-26.4510253906, -58.4922851563, -26.2598632812, -58.3822265625),
+     'GS', 'SGS', 8269),
+    ((-62.223046875, 16.6812011719, -62.1484375, 16.8095703125),
+     'MS', 'MSR', 8167),
+    ((-14.4149414062, -7.97578125, -14.3025390625, -7.8826171875),
+     'SH', 'SHN', 8070),
+    ((130.810253906, 37.4487304688, 130.934277344, 37.5537109375),
+     'KR', 'KOR', 7999),
+    ((142.107128906, 26.6156738281, 142.202148438, 26.7264648437),
+     'JP', 'JPN', 7760),
+    ((11.9364257813, 36.7459960937, 12.0512695312, 36.8430664062),
+     'IT', 'ITA', 7434),
+    ((12.396875, 43.8940917969, 12.5146484375, 43.9897460938),
+     'SM', 'SMR', 7107),
+    ((96.8258789063, -12.1998046875, 96.9252929687, -12.126171875),
+     'CC', 'CCK', 6778),
+    ((139.768945313, 33.0454589844, 139.873632813, 33.1292480469),
+     'JP', 'JPN', 6744),
+    ((-63.1247070312, 18.0191894531, -63.0111816406, 18.0689453125),
+     'SX', 'SXM', 6608),
+    ((-63.123046875, 18.0689453125, -63.0094238281, 18.1153320312),
+     'MF', 'MAF', 6535),
+    ((-159.842480469, -21.2495117188, -159.736865234, -21.1864257813),
+     'CK', 'COK', 6501),
+    ((-2.64614257812, 49.4287109375, -2.5123046875, 49.5065917969),
+     'GG', 'GGY', 6491),
+    ((167.906152344, -29.0962890625, 167.990429688, -29.0139648438),
+     'NF', 'NFK', 6142),
+    ((-128.350195313, -24.4125976562, -128.290087891, -24.3232421875),
+     'PN', 'PCN', 5826),
+    ((-90.6520507812, -68.8032226562, -90.5146972656, -68.712109375),
+     'AQ', 'ATA', 5772),
+    ((-62.8754394531, 17.8751953125, -62.7997070312, 17.922265625),
+     'BL', 'BLM', 4785),
+    ((113.47890625, 22.1955566406, 113.548144531, 22.2459472656),
+     'MO', 'MAC', 4532),
+    ((166.90703125, -0.55078125, 166.958398438, -0.48935546875),
+     'NR', 'NRU', 4451),
+    ((7.377734375, 43.7317382812, 7.438671875, 43.7708984375),
+     'MC', 'MCO', 3275),
+    ((-5.368, 36.108618, -5.336, 36.155),
+     'GI', 'GIB', 2952),
+    ((123.572460938, -12.4359375, 123.595214844, -12.4239257813),
+     'AU', 'AUS', 1404),
+    ((12.4275390625, 41.8975585937, 12.4391601563, 41.9062011719),
+     'VA', 'VAT', 679),
+]
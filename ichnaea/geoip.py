@@ -13,7 +13,12 @@ from geoip2.errors import (
     GeoIP2Error,
 )
 from maxminddb import InvalidDatabaseError
-from maxminddb.const import MODE_AUTO
+from maxminddb.const import (
+    MODE_AUTO,
+    MODE_MMAP,
+    MODE_MMAP_EXT,
+)
+from repoze.lru import LRUCache
 from six import PY2
 
 from ichnaea.constants import (
@@ -23,11 +28,25 @@ from ichnaea.constants import (
 )
 from ichnaea.geocalc import country_max_radius
 
+if PY2:  # pragma: no cover
+    from ipaddr import IPAddress as ip_address  # NOQA
+else:  # pragma: no cover
+    from ipaddress import ip_address
+
+try:
+    from maxminddb import extension as maxminddb_extension
+except ImportError:  # pragma: no cover
+    maxminddb_extension = None
+
 VALID_COUNTRIES = frozenset(iso3166.countries_by_alpha2.keys())
+_MISSING = object()
+_PRELOADED = {}  #: GeoIP databases opened in the parent process.
 
 
 def configure_geoip(filename, mode=MODE_AUTO,
-                    raven_client=None, _client=None):
+                    raven_client=None, stats_client=None,
+                    cache_size=0, cache_ipv4_prefix=32, cache_ipv6_prefix=128,
+                    lazy=False, _client=None):
     """
     Configure and return a :class:`~ichnaea.geoip.GeoIPWrapper` instance.
 
@@ -37,12 +56,34 @@ def configure_geoip(filename, mode=MODE_AUTO,
     :param raven_client: A configured raven/sentry client.
     :type raven_client: :class:`raven.base.Client`
 
+    :param stats_client: A configured stats client.
+    :type stats_client: :class:`~ichnaea.log.StatsClient`
+
+    :param cache_size: The maximum number of lookup results to cache,
+                       zero disables the cache.
+    :param cache_ipv4_prefix: Cache results per IPv4 network of this
+                              prefix length.
+    :param cache_ipv6_prefix: Cache results per IPv6 network of this
+                              prefix length.
+
+    :param lazy: Return a :class:`~ichnaea.geoip.GeoIPLazy` instance,
+                 which only opens the database file on first use.
+    :type lazy: bool
+
     :param _client: Test-only hook to provide a pre-configured client.
     """
 
     if _client is not None:
         return _client
 
+    if lazy:
+        return GeoIPLazy(filename, mode=mode,
+                         raven_client=raven_client,
+                         stats_client=stats_client,
+                         cache_size=cache_size,
+                         cache_ipv4_prefix=cache_ipv4_prefix,
+                         cache_ipv6_prefix=cache_ipv6_prefix)
+
     if not filename:
         # No DB file specified in the config
         if raven_client is not None:
@@ -53,7 +94,18 @@ def configure_geoip(filename, mode=MODE_AUTO,
         return GeoIPNull()
 
     try:
-        db = GeoIPWrapper(filename, mode=mode)
+        db = _PRELOADED.pop((filename, mode), None)
+        if db is not None:
+            db._setup(stats_client=stats_client,
+                      cache_size=cache_size,
+                      cache_ipv4_prefix=cache_ipv4_prefix,
+                      cache_ipv6_prefix=cache_ipv6_prefix)
+        else:
+            db = GeoIPWrapper(filename, mode=mode,
+                              stats_client=stats_client,
+                              cache_size=cache_size,
+                              cache_ipv4_prefix=cache_ipv4_prefix,
+                              cache_ipv6_prefix=cache_ipv6_prefix)
         if not db.check_extension() and raven_client is not None:
             try:
                 raise RuntimeError('Maxmind C extension not installed.')
@@ -70,6 +122,23 @@ def configure_geoip(filename, mode=MODE_AUTO,
     return db
 
 
+def preload_geoip(filename, mode=MODE_AUTO):
+    """
+    Open the GeoIP database in the parent process, before forking the
+    worker processes. The next :func:`~ichnaea.geoip.configure_geoip`
+    call for the same file in each worker process uses this database,
+    so its memory mapped pages are shared between the workers.
+
+    Errors are left to be reported by the later configure call.
+    """
+    if not filename or (filename, mode) in _PRELOADED:
+        return
+    try:
+        _PRELOADED[(filename, mode)] = GeoIPWrapper(filename, mode=mode)
+    except (InvalidDatabaseError, IOError, OSError, ValueError):
+        pass
+
+
 def geoip_accuracy(country_code, city=False):
     """
     Return the best accuracy guess for the given GeoIP record.
@@ -108,20 +177,49 @@ class GeoIPWrapper(Reader):
         AddressNotFoundError, GeoIP2Error, InvalidDatabaseError, ValueError)
     valid_countries = VALID_COUNTRIES  #: A set of valid country codes.
 
-    def __init__(self, filename, mode=MODE_AUTO):
+    def __init__(self, filename, mode=MODE_AUTO, stats_client=None,
+                 cache_size=0, cache_ipv4_prefix=32, cache_ipv6_prefix=128):
         """
         Takes the absolute path to a geoip database on the local filesystem
         and an additional mode, which defaults to
         :data:`maxminddb.const.MODE_AUTO`.
 
+        The automatic mode is resolved to one of the explicit memory
+        mapped modes, using the C extension if it is installed. Memory
+        mapped database pages are shared between all processes.
+
+        If a `cache_size` is given, lookup results are kept in a LRU
+        cache, keyed by the network of the given prefix length the
+        IP address belongs to. The cache belongs to this instance, so
+        re-opening the database file starts with an empty cache.
+
         :raises: :exc:`maxminddb.InvalidDatabaseError`
         """
+        if mode == MODE_AUTO:
+            mode = MODE_MMAP
+            if getattr(maxminddb_extension, 'Reader', None) is not None:
+                mode = MODE_MMAP_EXT
         super(GeoIPWrapper, self).__init__(filename, mode=mode)
 
         if self.metadata().database_type != 'GeoIP2-City':
             message = 'Invalid database type, expected City'
             raise InvalidDatabaseError(message)
 
+        self._setup(stats_client=stats_client,
+                    cache_size=cache_size,
+                    cache_ipv4_prefix=cache_ipv4_prefix,
+                    cache_ipv6_prefix=cache_ipv6_prefix)
+
+    def _setup(self, stats_client=None,
+               cache_size=0, cache_ipv4_prefix=32, cache_ipv6_prefix=128):
+        # Set up the per-process stats client and lookup cache.
+        self.stats_client = stats_client
+        self.cache = None
+        if cache_size:
+            self.cache = LRUCache(int(cache_size))
+        self.cache_prefixes = {4: int(cache_ipv4_prefix),
+                               6: int(cache_ipv6_prefix)}
+
     @property
     def age(self):
         """
@@ -151,6 +249,25 @@ class GeoIPWrapper(Reader):
                 return False
         return True
 
+    def close(self):
+        """Close the database file and clear the lookup cache."""
+        if self.cache is not None:
+            self.cache.clear()
+        super(GeoIPWrapper, self).close()
+
+    def _cache_key(self, addr):
+        try:
+            address = ip_address(addr)
+        except ValueError:
+            return None
+        bits = 32 if address.version == 4 else 128
+        prefix = self.cache_prefixes[address.version]
+        return (address.version, int(address) >> (bits - prefix))
+
+    def _stat_count(self, status):
+        if self.stats_client is not None:
+            self.stats_client.incr('geoip.cache', tags=['status:' + status])
+
     def geoip_lookup(self, addr):
         """
         Look up information for the given IP address.
@@ -161,6 +278,27 @@ class GeoIPWrapper(Reader):
         :returns: A dictionary with city, country data and location data.
         :rtype: dict
         """
+        if self.cache is None:
+            return self._geoip_lookup(addr)
+
+        key = self._cache_key(addr)
+        if key is None:
+            return self._geoip_lookup(addr)
+
+        result = self.cache.get(key, _MISSING)
+        if result is _MISSING:
+            self._stat_count('miss')
+            result = self._geoip_lookup(addr)
+            self.cache.put(key, result)
+        else:
+            self._stat_count('hit')
+
+        if result is not None:
+            # protect the cached entry against changes by the caller
+            result = dict(result)
+        return result
+
+    def _geoip_lookup(self, addr):
         try:
             record = self.city(addr)
         except self.lookup_exceptions:
@@ -214,3 +352,42 @@ class GeoIPNull(object):
         :returns: False
         """
         return False
+
+
+class GeoIPLazy(object):
+    """
+    A proxy for the :class:`~ichnaea.geoip.GeoIPWrapper` API, which
+    delays opening the database file until it is used for the first time.
+
+    This is used in processes which rarely or never do GeoIP lookups,
+    to avoid paying the startup cost for opening the database file.
+    """
+
+    valid_countries = VALID_COUNTRIES  #: A set of valid country codes.
+
+    def __init__(self, filename, **kw):
+        self._filename = filename
+        self._kw = kw
+        self._db = None
+
+    @property
+    def opened(self):
+        """
+        :returns: True if the database has been opened.
+        :rtype: bool
+        """
+        return self._db is not None
+
+    def _open(self):
+        if self._db is None:
+            self._db = configure_geoip(self._filename, **self._kw)
+        return self._db
+
+    def __getattr__(self, name):
+        return getattr(self._open(), name)
+
+    def close(self):
+        """Close the database, if it has been opened."""
+        if self._db is not None and hasattr(self._db, 'close'):
+            self._db.close()
+        self._db = None
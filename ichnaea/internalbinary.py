@@ -0,0 +1,253 @@
+"""
+Functionality around a compact internal binary format.
+
+This format is used for the high volume Redis based data queues
+and only supports the few item types stored in them. Each item is
+encoded as a version byte, a type tag byte, a bitmask of the fields
+which aren't None and the packed values of those fields.
+
+Any other item is encoded in the internal JSON format, which can
+still be decoded, as can all items queued before the binary format
+was introduced.
+"""
+
+from binascii import (
+    hexlify,
+    unhexlify,
+)
+from datetime import date
+import struct
+
+import six
+
+from ichnaea.internaljson import (
+    internal_dumps,
+    internal_loads,
+)
+from ichnaea.models.cell import Radio
+from ichnaea.models.content import (
+    ScoreHashKey,
+    ScoreKey,
+)
+from ichnaea.models.observation import (
+    CellObservation,
+    WifiObservation,
+)
+
+BINARY_VERSION = 1  #: Version of the binary format.
+_VERSION_BYTE = struct.pack('>B', BINARY_VERSION)
+_HEADER = struct.Struct('>BBH')
+
+
+def _encode_int(value):
+    if isinstance(value, bool) or not isinstance(value, six.integer_types):
+        raise TypeError('Integer expected.')
+    return value
+
+
+def _encode_mac(value):
+    data = unhexlify(value)
+    if len(data) != 6 or hexlify(data).decode('ascii') != value:
+        # Only lowercase keys survive the roundtrip.
+        raise ValueError('Invalid mac.')
+    return data
+
+
+def _decode_mac(value):
+    return hexlify(value).decode('ascii')
+
+
+def _encode_date(value):
+    if type(value) is not date:
+        raise TypeError('Date expected.')
+    return value.toordinal()
+
+
+def _encode_enum(value):
+    return int(value)
+
+
+_FLOAT = ('d', float, None)
+_REPORT_FIELDS = (
+    ('lat', ) + _FLOAT,
+    ('lon', ) + _FLOAT,
+    ('accuracy', ) + _FLOAT,
+    ('altitude', ) + _FLOAT,
+    ('altitude_accuracy', ) + _FLOAT,
+    ('heading', ) + _FLOAT,
+    ('speed', ) + _FLOAT,
+)
+
+
+class _ItemType(object):
+    """
+    Describes how to encode and decode one type of queue item.
+
+    Each field is a tuple of its name, its struct format character,
+    a function to encode the value and one to decode it, if needed.
+    """
+
+    fields = ()
+
+    def __init__(self, tag):
+        self.tag = tag
+        self._structs = {}
+
+    def matches(self, item):
+        raise NotImplementedError()
+
+    def values(self, item):
+        raise NotImplementedError()
+
+    def build(self, values):
+        raise NotImplementedError()
+
+    def _struct(self, mask):
+        packer = self._structs.get(mask)
+        if packer is None:
+            fmt = '>'
+            for i, field in enumerate(self.fields):
+                if mask & (1 << i):
+                    fmt += field[1]
+            packer = self._structs[mask] = struct.Struct(fmt)
+        return packer
+
+    def encode(self, item):
+        values = self.values(item)
+        mask = 0
+        packed = []
+        for i, (name, fmt, encode, decode) in enumerate(self.fields):
+            value = values.get(name)
+            if value is not None:
+                mask |= (1 << i)
+                packed.append(encode(value) if encode else value)
+        return (_HEADER.pack(BINARY_VERSION, self.tag, mask) +
+                self._struct(mask).pack(*packed))
+
+    def decode(self, mask, data):
+        packed = iter(self._struct(mask).unpack(data))
+        values = {}
+        for i, (name, fmt, encode, decode) in enumerate(self.fields):
+            if mask & (1 << i):
+                value = next(packed)
+                values[name] = decode(value) if decode else value
+            else:
+                values[name] = None
+        return self.build(values)
+
+
+class _ObservationType(_ItemType):
+
+    def __init__(self, tag, obs_cls, fields):
+        super(_ObservationType, self).__init__(tag)
+        self.obs_cls = obs_cls
+        self.fields = fields + _REPORT_FIELDS
+        self.names = set([field[0] for field in self.fields])
+
+    def matches(self, item):
+        return type(item) is self.obs_cls
+
+    def values(self, item):
+        values = item.__dict__
+        if not self.names.issuperset(values.keys()):
+            raise ValueError('Unknown fields.')
+        return values
+
+    def build(self, values):
+        return self.obs_cls(**values)
+
+
+class _DictType(_ItemType):
+
+    def __init__(self, tag, fields):
+        super(_DictType, self).__init__(tag)
+        self.fields = fields
+        self.keys = set([field[0] for field in fields])
+
+    def matches(self, item):
+        return type(item) is dict and set(item.keys()) == self.keys
+
+    def values(self, item):
+        return item
+
+    def build(self, values):
+        return values
+
+
+class _ScoreType(_ItemType):
+
+    fields = (
+        ('userid', 'I', _encode_int, None),
+        ('key', 'B', _encode_enum, ScoreKey),
+        ('time', 'I', _encode_date, date.fromordinal),
+        ('value', 'I', _encode_int, None),
+    )
+
+    def matches(self, item):
+        return (type(item) is dict and
+                set(item.keys()) == set(['hashkey', 'value']) and
+                type(item['hashkey']) is ScoreHashKey)
+
+    def values(self, item):
+        values = item['hashkey'].__dict__.copy()
+        values['value'] = item['value']
+        return values
+
+    def build(self, values):
+        value = values.pop('value')
+        return {'hashkey': ScoreHashKey(**values), 'value': value}
+
+
+_ITEM_TYPES = (
+    _ObservationType(1, CellObservation, (
+        ('radio', 'B', _encode_enum, Radio),
+        ('mcc', 'H', _encode_int, None),
+        ('mnc', 'H', _encode_int, None),
+        ('lac', 'H', _encode_int, None),
+        ('cid', 'I', _encode_int, None),
+        ('psc', 'H', _encode_int, None),
+        ('asu', 'B', _encode_int, None),
+        ('signal', 'h', _encode_int, None),
+        ('ta', 'B', _encode_int, None),
+    )),
+    _ObservationType(2, WifiObservation, (
+        ('key', '6s', _encode_mac, _decode_mac),
+        ('channel', 'B', _encode_int, None),
+        ('signal', 'h', _encode_int, None),
+        ('snr', 'B', _encode_int, None),
+    )),
+    _DictType(3, (
+        ('lat', ) + _FLOAT,
+        ('lon', ) + _FLOAT,
+    )),
+    _ScoreType(4),
+)
+_TAGS = dict([(item_type.tag, item_type) for item_type in _ITEM_TYPES])
+
+
+def internal_binary_dumps(value):
+    """
+    Dump a queue item into the internal binary format, falling back
+    to :func:`ichnaea.internaljson.internal_dumps` for other items or
+    values which can't be represented in the binary format.
+    """
+    for item_type in _ITEM_TYPES:
+        if item_type.matches(value):
+            try:
+                return item_type.encode(value)
+            except (struct.error, TypeError, ValueError):
+                break
+    return internal_dumps(value).encode('utf-8')
+
+
+def internal_binary_loads(value):
+    """
+    Load a bytes object in either the internal binary or the
+    internal JSON format.
+    """
+    if value[:1] != _VERSION_BYTE:
+        return internal_loads(value)
+    version, tag, mask = _HEADER.unpack_from(value)
+    if version != BINARY_VERSION or tag not in _TAGS:  # pragma: no cover
+        raise ValueError('Unsupported binary format.')
+    return _TAGS[tag].decode(mask, value[_HEADER.size:])
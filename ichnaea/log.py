@@ -1,7 +1,9 @@
 """Functionality related to statsd, sentry and freeform logging."""
 from collections import deque
 import logging
+import math
 from random import random
+import threading
 import time
 
 from pyramid.httpexceptions import (
@@ -24,6 +26,10 @@ from ichnaea.exceptions import BaseClientError
 RAVEN_CLIENT = None  #: The globally configured raven client.
 STATS_CLIENT = None  #: The globally configured statsd client.
 
+#: Maximum size in bytes of aggregated statsd packets, small enough
+#: to avoid IP fragmentation on common networks.
+STATS_PACKET_SIZE = 1400
+
 RAVEN_TRANSPORTS = {
     'gevent': GeventedHTTPTransport,
     'sync': HTTPTransport,
@@ -74,6 +80,19 @@ def set_stats_client(client):
     return STATS_CLIENT
 
 
+def parse_sample_rates(section):
+    """
+    Return a mapping of metric names to sample rates, based on all
+    `sample_rate.<metric name>` settings in the statsd section.
+    """
+    prefix = 'sample_rate.'
+    rates = {}
+    for key, value in section.items():
+        if key.startswith(prefix):
+            rates[key[len(prefix):]] = float(value)
+    return rates
+
+
 def configure_stats(app_config, _client=None):  # pragma: no cover
     """
     Configure, globally set and return a
@@ -89,16 +108,22 @@ def configure_stats(app_config, _client=None):  # pragma: no cover
         port = 8125
         metric_prefix = 'location'
         tag_support = False
+        aggregate_interval = 0
+        sample_rates = {}
     else:
         section = app_config.get_map('statsd', {})
         host = section.get('host', 'localhost').strip()
         port = int(section.get('port', 8125))
         metric_prefix = section.get('metric_prefix', 'location').strip()
         tag_support = asbool(section.get('tag_support', 'false').strip())
+        aggregate_interval = int(section.get('aggregate_interval', 0))
+        sample_rates = parse_sample_rates(section)
 
     client = StatsClient(
         host=host, port=port, metric_prefix=metric_prefix,
-        tag_support=tag_support)
+        tag_support=tag_support, aggregate_interval=aggregate_interval,
+        sample_rates=sample_rates)
+    client.start()
 
     return set_stats_client(client)
 
@@ -187,12 +212,36 @@ class DebugRavenClient(RavenClient):
         self.msgs.append(data)
 
 
+def _histogram_bucket(value):
+    """Round a timing or histogram value to two significant digits."""
+    if value <= 0:
+        return value
+    digits = int(math.floor(math.log10(value))) - 1
+    return type(value)(round(value, -digits))
+
+
 class StatsClient(DogStatsd):
-    """A statsd client."""
+    """
+    A statsd client.
+
+    If `aggregate_interval` is set, counters, gauges, timers and
+    histograms are aggregated in memory per metric name and tags and
+    sent at most once per interval. Counters are summed and gauges keep
+    their last value. Timer and histogram values are rounded to two
+    significant digits and each distinct value is sent once, with a
+    sample rate standing in for the number of times it was reported.
+
+    `sample_rates` maps metric names to the default sample rate used
+    for these metrics.
+
+    :meth:`start` starts a background thread, which sends aggregated
+    metrics once per interval, even while no new metrics are reported.
+    """
 
     def __init__(self, host='localhost', port=8125, max_buffer_size=50,
                  constant_tags=None, use_ms=False,
-                 metric_prefix=None, tag_support=False):
+                 metric_prefix=None, tag_support=False,
+                 aggregate_interval=0, sample_rates=None):
         super(StatsClient, self).__init__(
             host=host, port=port,
             max_buffer_size=max_buffer_size,
@@ -200,11 +249,14 @@ class StatsClient(DogStatsd):
             use_ms=True)  # always enable this to be standards compliant
         self.metric_prefix = metric_prefix
         self.tag_support = tag_support
-
-    def _report(self, metric, metric_type, value, tags, sample_rate):
-        if sample_rate != 1 and random() > sample_rate:  # pragma: no cover
-            return
-
+        self.aggregate_interval = aggregate_interval
+        self.sample_rates = sample_rates or {}
+        self._aggregates = {}
+        self._aggregates_lock = threading.Lock()
+        self._last_flush = time.time()
+        self._flush_stopped = None
+
+    def _format(self, metric, metric_type, value, tags, sample_rate):
         payload = []
         if self.metric_prefix:
             # add support for custom metric prefix
@@ -228,15 +280,109 @@ class StatsClient(DogStatsd):
 
         payload.extend([metric, ':', value, '|', metric_type])
 
-        if sample_rate != 1:  # pragma: no cover
-            payload.extend(['|@', sample_rate])
+        if sample_rate != 1:
+            payload.extend(['|@', '%.6g' % sample_rate])
 
         if tags and self.tag_support:
             # normal tag support
             payload.extend(['|#', ','.join(tags)])
 
-        encoded = ''.join(imap(str, payload))
-        self._send(encoded)
+        return ''.join(imap(str, payload))
+
+    def _aggregate(self, metric, metric_type, value, tags, sample_rate):
+        key = (metric, metric_type, tuple(tags or ()))
+        if metric_type == 'c':
+            self._aggregates[key] = (
+                self._aggregates.get(key, 0) + value / float(sample_rate))
+        elif metric_type == 'g':
+            self._aggregates[key] = value
+        else:
+            values = self._aggregates.setdefault(key, {})
+            value = _histogram_bucket(value)
+            values[value] = values.get(value, 0) + 1.0 / sample_rate
+
+    def _report(self, metric, metric_type, value, tags, sample_rate):
+        if sample_rate == 1:
+            sample_rate = self.sample_rates.get(metric, 1)
+
+        if sample_rate != 1 and random() > sample_rate:
+            return
+
+        if self.aggregate_interval and metric_type in ('c', 'g', 'ms', 'h'):
+            with self._aggregates_lock:
+                self._aggregate(metric, metric_type, value, tags, sample_rate)
+            if time.time() - self._last_flush >= self.aggregate_interval:
+                self.flush()
+            return
+
+        self._send(self._format(metric, metric_type, value, tags, sample_rate))
+
+    def _flush_loop(self, stopped):
+        while not stopped.is_set():
+            delay = self._last_flush + self.aggregate_interval - time.time()
+            if delay > 0:
+                stopped.wait(delay)
+            else:
+                self.flush()
+
+    def start(self):
+        """
+        Start the background thread sending aggregated metrics, if
+        an `aggregate_interval` is set. This needs to be called in each
+        process, after forking.
+        """
+        if not self.aggregate_interval or self._flush_stopped is not None:
+            return
+        self._flush_stopped = threading.Event()
+        thread = threading.Thread(
+            target=self._flush_loop, args=(self._flush_stopped, ),
+            name='stats-flush')
+        thread.daemon = True
+        thread.start()
+
+    def stop(self):
+        """Stop the background thread started by :meth:`start`."""
+        if self._flush_stopped is not None:
+            self._flush_stopped.set()
+            self._flush_stopped = None
+
+    def flush(self):
+        """Send all aggregated metrics."""
+        with self._aggregates_lock:
+            aggregates, self._aggregates = self._aggregates, {}
+            self._last_flush = time.time()
+
+        lines = []
+        for (metric, metric_type, tags), value in aggregates.items():
+            tags = list(tags)
+            if metric_type == 'c':
+                lines.append(self._format(
+                    metric, metric_type, int(round(value)), tags, 1))
+            elif metric_type == 'g':
+                lines.append(self._format(
+                    metric, metric_type, value, tags, 1))
+            else:
+                for bucket, count in value.items():
+                    lines.append(self._format(
+                        metric, metric_type, bucket, tags,
+                        min(1.0 / count, 1)))
+
+        # Send multiple metrics per packet, limited by both the
+        # number of metrics and the packet size.
+        size = max(self.max_buffer_size, 1)
+        packet = []
+        packet_bytes = 0
+        for line in lines:
+            line_bytes = len(line.encode('utf-8')) + 1
+            if packet and (len(packet) >= size or
+                           packet_bytes + line_bytes > STATS_PACKET_SIZE):
+                self._send('\n'.join(packet))
+                packet = []
+                packet_bytes = 0
+            packet.append(line)
+            packet_bytes += line_bytes
+        if packet:
+            self._send('\n'.join(packet))
 
     def incr(self, *args, **kw):
         return self.increment(*args, **kw)
@@ -246,10 +392,10 @@ class DebugStatsClient(StatsClient):
     """An in-memory statsd client with an inspectable message queue."""
 
     def __init__(self, host='localhost', port=8125, max_buffer_size=50,
-                 metric_prefix=None, tag_support=False):
+                 metric_prefix=None, tag_support=False, **kw):
         super(DebugStatsClient, self).__init__(
             host=host, port=port, max_buffer_size=max_buffer_size,
-            metric_prefix=metric_prefix, tag_support=tag_support)
+            metric_prefix=metric_prefix, tag_support=tag_support, **kw)
         self.msgs = deque(maxlen=100)
 
     def _clear(self):
@@ -0,0 +1,238 @@
+"""
+Hand-specialized validators for the report, cell report and wifi report
+data, used while processing large numbers of submitted reports.
+
+Each function accepts the same input as the ``validate`` method of the
+corresponding model class and returns the same validated dictionary or
+None, without the overhead of the colander schemas:
+
+* :func:`validate_report` matches
+  :class:`~ichnaea.models.observation.ValidReportSchema`
+* :func:`validate_cell_report` matches
+  :class:`~ichnaea.models.observation.ValidCellReportSchema`
+* :func:`validate_wifi_report` matches
+  :class:`~ichnaea.models.observation.ValidWifiReportSchema`
+"""
+
+from six import (
+    string_types,
+    text_type,
+)
+
+from ichnaea.models.cell import Radio
+from ichnaea.models import constants
+
+
+class _Invalid(Exception):
+    """Raised for an invalid value, like :exc:`colander.Invalid`."""
+
+
+def _number(num, value, minimum, maximum):
+    # Like a colander.Integer or colander.Float node with a
+    # colander.Range validator, returning None for missing values.
+    if value != 0 and not value:
+        return None
+    try:
+        value = num(value)
+    except Exception:
+        raise _Invalid()
+    if value < minimum or value > maximum:
+        raise _Invalid()
+    return value
+
+
+def _required(num, value, minimum, maximum):
+    # Like a node without a missing value.
+    value = _number(num, value, minimum, maximum)
+    if value is None:
+        raise _Invalid()
+    return value
+
+
+def _default(num, value, minimum, maximum):
+    # Like a :class:`ichnaea.models.schema.DefaultNode` with a
+    # missing value of None.
+    try:
+        return _number(num, value, minimum, maximum)
+    except _Invalid:
+        return None
+
+
+def _radio(value):
+    # Like a :class:`ichnaea.models.cell.RadioNode`.
+    if isinstance(value, Radio):
+        return value
+    try:
+        if isinstance(value, string_types):
+            value = Radio[value]
+        else:
+            value = Radio(value)
+        if value == Radio.cdma:
+            raise ValueError('Skip CDMA networks.')
+    except (KeyError, ValueError):
+        raise _Invalid()
+    return value
+
+
+def _wifi_mac(value):
+    # Like a :class:`ichnaea.models.wifi.WifiMacNode`.
+    if not value:
+        raise _Invalid()
+    if not isinstance(value, (text_type, bytes)):
+        raise _Invalid()
+    try:
+        value = text_type(value)
+    except Exception:
+        raise _Invalid()
+
+    if ':' in value or '-' in value or '.' in value:
+        value = value.replace(':', '').replace('-', '').replace('.', '')
+    value = value.lower()
+
+    if not (value and len(value) == 12 and
+            constants.INVALID_WIFI_REGEX.match(value) and
+            constants.VALID_WIFI_REGEX.match(value)):
+        raise _Invalid()
+    return value
+
+
+def validate_report(data):
+    """Validate the general position fields of a report."""
+    try:
+        lat = _number(
+            float, data.get('lat'), constants.MIN_LAT, constants.MAX_LAT)
+        lon = _number(
+            float, data.get('lon'), constants.MIN_LON, constants.MAX_LON)
+    except _Invalid:
+        return None
+
+    if lat is None or lon is None:
+        return None
+
+    return {
+        'lat': lat,
+        'lon': lon,
+        'accuracy': _default(
+            float, data.get('accuracy'), 0, constants.MAX_ACCURACY),
+        'altitude': _default(
+            float, data.get('altitude'),
+            constants.MIN_ALTITUDE, constants.MAX_ALTITUDE),
+        'altitude_accuracy': _default(
+            float, data.get('altitude_accuracy'),
+            0, constants.MAX_ALTITUDE_ACCURACY),
+        'heading': _default(
+            float, data.get('heading'), 0, constants.MAX_HEADING),
+        'speed': _default(
+            float, data.get('speed'), 0, constants.MAX_SPEED),
+    }
+
+
+def validate_cell_report(data):
+    """Validate the cell specific fields of a report."""
+    if not data:
+        return None
+
+    try:
+        radio = _radio(data.get('radio'))
+    except _Invalid:
+        return None
+
+    cid = data.get('cid')
+    lac = data.get('lac')
+
+    # If the cell id > 65535 then it must be a WCDMA tower
+    if (radio == Radio.gsm and
+            cid is not None and cid > constants.MAX_CID_GSM):
+        radio = Radio.wcdma
+
+    # Treat cid=65535 without a valid lac as an unspecified value
+    if lac is None and cid == constants.MAX_CID_GSM:
+        cid = None
+
+    # Sometimes the asu and signal fields are swapped
+    asu = data.get('asu')
+    signal = data.get('signal')
+    if asu is not None and asu < -1 and signal == 0:
+        signal = asu
+        asu = None
+
+    try:
+        mcc = _required(
+            int, data.get('mcc'), constants.MIN_MCC, constants.MAX_MCC)
+        mnc = _required(
+            int, data.get('mnc'), constants.MIN_MNC, constants.MAX_MNC)
+    except _Invalid:
+        return None
+
+    if mcc not in constants.ALL_VALID_MCCS:
+        return None
+
+    lac = _default(int, lac, constants.MIN_LAC, constants.MAX_LAC)
+    cid = _default(int, cid, constants.MIN_CID, constants.MAX_CID)
+    psc = _default(
+        int, data.get('psc'), constants.MIN_PSC, constants.MAX_PSC)
+
+    # A cell report needs a full cell id, so it always has a lac and cid.
+    if lac is None or cid is None:
+        return None
+
+    if (radio == Radio.lte and
+            psc is not None and psc > constants.MAX_PSC_LTE):
+        return None
+
+    return {
+        'radio': radio,
+        'mcc': mcc,
+        'mnc': mnc,
+        'lac': lac,
+        'cid': cid,
+        'psc': psc,
+        'asu': _default(int, asu, 0, 97),
+        'signal': _default(int, signal, -150, -1),
+        'ta': _default(int, data.get('ta'), 0, 63),
+    }
+
+
+def validate_wifi_report(data):
+    """Validate the wifi specific fields of a report."""
+    if not data:
+        return None
+
+    channel = data.get('channel')
+    channel = channel is not None and int(channel) or None
+    if (channel is None or not
+            (constants.MIN_WIFI_CHANNEL < channel <
+             constants.MAX_WIFI_CHANNEL)):
+        # if no explicit channel was given, calculate
+        freq = data.get('frequency', None)
+        if freq is None:
+            freq = 0
+
+        if 2411 < freq < 2473:
+            # 2.4 GHz band
+            channel = (freq - 2407) // 5
+
+        elif 5169 < freq < 5826:
+            # 5 GHz band
+            channel = (freq - 5000) // 5
+
+        else:
+            channel = None
+    else:
+        channel = data.get('channel')
+
+    try:
+        key = _wifi_mac(data.get('key'))
+    except _Invalid:
+        return None
+
+    return {
+        'key': key,
+        'channel': _default(
+            int, channel,
+            constants.MIN_WIFI_CHANNEL, constants.MAX_WIFI_CHANNEL),
+        'signal': _default(
+            int, data.get('signal'),
+            constants.MIN_WIFI_SIGNAL, constants.MAX_WIFI_SIGNAL),
+        'snr': _default(int, data.get('snr'), 0, 100),
+    }
@@ -1,3 +1,7 @@
+from collections import namedtuple
+from datetime import date
+import struct
+
 import colander
 from enum import IntEnum
 from six import string_types
@@ -6,12 +10,102 @@ from sqlalchemy.dialects.mysql import (
     DOUBLE as Double,
 )
 
+from ichnaea.constants import (
+    PERMANENT_BLOCKLIST_THRESHOLD,
+    TEMPORARY_BLOCKLIST_DURATION,
+)
 from ichnaea.models import constants
 from ichnaea.models.schema import (
     CopyingSchema,
     DefaultNode,
     FieldSchema,
 )
+from ichnaea import util
+
+POSITION_STRUCT = struct.Struct('!ddiI')
+
+
+class StationPosition(namedtuple('StationPosition',
+                                 'lat lon radius blocked_until')):
+    """
+    The position data of a single station, as used to answer
+    locate queries.
+
+    Stations which aren't known or don't have a position are
+    represented by an entry without a lat/lon position.
+
+    The `blocked_until` date is the last day on which the station is
+    blocked, or None if the station isn't blocked. Permanently blocked
+    stations use :attr:`datetime.date.max`.
+    """
+
+    __slots__ = ()
+
+    def blocked(self, today=None):
+        """Is the station blocked on the given day, by default today?"""
+        if self.blocked_until is None:
+            return False
+        if today is None:
+            today = util.utcnow().date()
+        return today <= self.blocked_until
+
+    def usable(self, today=None):
+        """Can this station be used to answer a locate query?"""
+        return (self.lat is not None and self.lon is not None and
+                not self.blocked(today=today))
+
+
+#: A station which is unknown or doesn't have a position.
+UNKNOWN_STATION = StationPosition(
+    lat=None, lon=None, radius=None, blocked_until=None)
+
+
+def station_position(lat, lon, radius, block_count=None, block_last=None):
+    """
+    Return a :class:`~ichnaea.models.station.StationPosition` for the
+    given station values, deciding until when the station is blocked
+    based on its blocklist values.
+    """
+    blocked_until = None
+    if block_count is not None and \
+       block_count >= PERMANENT_BLOCKLIST_THRESHOLD:
+        blocked_until = date.max
+    elif block_last is not None:
+        blocked_until = block_last + TEMPORARY_BLOCKLIST_DURATION
+    return StationPosition(
+        lat=lat, lon=lon, radius=radius, blocked_until=blocked_until)
+
+
+def encode_station_position(position):
+    """
+    Given a station position, return a compact byte sequence
+    representing it. Stations without a position are represented
+    by an empty byte sequence.
+    """
+    if position.lat is None or position.lon is None:
+        return b''
+    radius = -1 if position.radius is None else int(position.radius)
+    blocked_until = 0
+    if position.blocked_until is not None:
+        blocked_until = position.blocked_until.toordinal()
+    return POSITION_STRUCT.pack(
+        position.lat, position.lon, radius, blocked_until)
+
+
+def decode_station_position(value):
+    """
+    Given a byte sequence as returned by
+    :func:`~ichnaea.models.station.encode_station_position`,
+    return a station position.
+    """
+    if not value:
+        return UNKNOWN_STATION
+    lat, lon, radius, blocked_until = POSITION_STRUCT.unpack(value)
+    return StationPosition(
+        lat=lat, lon=lon,
+        radius=None if radius < 0 else radius,
+        blocked_until=(date.fromordinal(blocked_until)
+                       if blocked_until else None))
 
 
 class StationSource(IntEnum):
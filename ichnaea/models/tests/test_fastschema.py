@@ -0,0 +1,139 @@
+from random import Random
+
+from ichnaea.models import (
+    CellReport,
+    Radio,
+    Report,
+    WifiReport,
+)
+from ichnaea.models.fastschema import (
+    validate_cell_report,
+    validate_report,
+    validate_wifi_report,
+)
+from ichnaea.tests.base import (
+    GB_LAT,
+    GB_LON,
+    GB_MCC,
+    TestCase,
+)
+
+NUMBERS = [
+    None, '', 0, 0.0, 1, -1, 1.5, '2', '2.5', ' 3 ', 'abc', True, False,
+    [], float('nan'), float('inf'), -2 ** 40, 2 ** 40,
+]
+
+
+class EquivalenceTest(object):
+    # Mixin comparing the fast validator to the colander schema of
+    # the model, subclasses define both and a validate method.
+
+    model = None
+    base = None
+    values = None
+
+    def _call(self, func, data):
+        try:
+            return func(dict(data))
+        except Exception as exc:
+            return type(exc)
+
+    def _compare(self, data):
+        expected = self._call(self.model.validate, data)
+        result = self._call(self.validate, data)
+        if expected is None or result is None:
+            self.assertEqual(result, expected, data)
+        elif isinstance(expected, type):
+            self.assertEqual(result, expected, data)
+        else:
+            self.assertEqual(sorted(result.keys()), sorted(expected.keys()))
+            for key, value in expected.items():
+                if value != value:
+                    # NaN isn't equal to itself
+                    self.assertTrue(result[key] != result[key], data)
+                else:
+                    self.assertEqual(result[key], value, data)
+                    self.assertEqual(type(result[key]), type(value), data)
+
+    def test_empty(self):
+        self._compare({})
+
+    def test_valid(self):
+        self._compare(self.base)
+
+    def test_single_fields(self):
+        for field, values in self.values.items():
+            for value in values:
+                data = dict(self.base)
+                data[field] = value
+                self._compare(data)
+                del data[field]
+                self._compare(data)
+
+    def test_random(self):
+        random = Random(42)
+        fields = sorted(self.values.keys())
+        for i in range(2000):
+            data = dict(self.base)
+            for field in random.sample(fields, random.randint(1, 3)):
+                data[field] = random.choice(self.values[field])
+            self._compare(data)
+
+
+class TestReport(EquivalenceTest, TestCase):
+
+    model = Report
+    base = {'lat': GB_LAT, 'lon': GB_LON, 'accuracy': 10.0}
+    values = {
+        'lat': NUMBERS + [-90.0, 90.0, -90.1, 90.1],
+        'lon': NUMBERS + [-180.0, 180.0, -180.1, 180.1],
+        'accuracy': NUMBERS + [1000000, 1000001],
+        'altitude': NUMBERS + [-10911, -10912, 100000, 100001],
+        'altitude_accuracy': NUMBERS + [110911, 110912],
+        'heading': NUMBERS + [360.0, 360.1],
+        'speed': NUMBERS + [300.0, 300.1],
+    }
+
+    def validate(self, data):
+        return validate_report(data)
+
+
+class TestCellReport(EquivalenceTest, TestCase):
+
+    model = CellReport
+    base = {'radio': 'gsm', 'mcc': GB_MCC, 'mnc': 5, 'lac': 12345,
+            'cid': 23456, 'psc': 1, 'asu': 26, 'signal': -61, 'ta': 10}
+    values = {
+        'radio': [None, '', 'gsm', 'cdma', 'wcdma', 'umts', 'lte', 'foo',
+                  0, 1, 2, 3, 4, -1, Radio.gsm, Radio.cdma, Radio.lte],
+        'mcc': NUMBERS + [GB_MCC, str(GB_MCC), 999, 1000, 310, 311],
+        'mnc': NUMBERS + [999, 1000],
+        'lac': NUMBERS + [65533, 65534, 65535],
+        'cid': [None, 0, 1, 65535, 65536, 2 ** 28 - 1, 2 ** 28, -1],
+        'psc': NUMBERS + [503, 504, 511, 512],
+        'asu': [None, -1, -2, -61, 0, 97, 98],
+        'signal': [None, 0, -1, -150, -151, -61],
+        'ta': NUMBERS + [63, 64],
+    }
+
+    def validate(self, data):
+        return validate_cell_report(data)
+
+
+class TestWifiReport(EquivalenceTest, TestCase):
+
+    model = WifiReport
+    base = {'key': '3680873e9b83', 'channel': 11, 'signal': -85, 'snr': 13}
+    values = {
+        'key': [None, '', '3680873e9b83', '36:80:87:3e:9b:83',
+                '36-80-87-3E-9B-83', '3680.873e.9b83', '000000000000',
+                'ffffffffffff', '01005e901000', '3680873e9b8', 'xyz',
+                '3680873e9b83aa', b'3680873e9b83', 1234, ':::'],
+        'channel': [None, 0, 1, 11, '11', 165, 166, 167, -1, 1.5],
+        'frequency': [None, 0, 2412, 2437, 2472, 2473, 5170, 5825, 5826],
+        'signal': NUMBERS + [-200, -201],
+        'snr': NUMBERS + [100, 101],
+    }
+
+    def validate(self, data):
+        return validate_wifi_report(data)
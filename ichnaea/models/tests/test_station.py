@@ -0,0 +1,66 @@
+from datetime import (
+    date,
+    timedelta,
+)
+
+from ichnaea.constants import (
+    PERMANENT_BLOCKLIST_THRESHOLD,
+    TEMPORARY_BLOCKLIST_DURATION,
+)
+from ichnaea.models.station import (
+    decode_station_position,
+    encode_station_position,
+    station_position,
+    StationPosition,
+    UNKNOWN_STATION,
+)
+from ichnaea.tests.base import TestCase
+from ichnaea import util
+
+
+class TestStationPosition(TestCase):
+
+    def test_usable(self):
+        self.assertTrue(StationPosition(1.0, 2.0, 10, None).usable())
+        self.assertFalse(StationPosition(1.0, 2.0, 10, date.max).usable())
+        self.assertFalse(UNKNOWN_STATION.usable())
+
+    def test_blocked(self):
+        today = util.utcnow().date()
+        position = station_position(1.0, 2.0, 10)
+        self.assertFalse(position.blocked(today=today))
+        position = station_position(
+            1.0, 2.0, 10, block_count=PERMANENT_BLOCKLIST_THRESHOLD)
+        self.assertTrue(position.blocked(today=today))
+        self.assertTrue(position.blocked(today=date.max))
+        position = station_position(
+            1.0, 2.0, 10, block_count=1,
+            block_last=today - timedelta(days=1))
+        self.assertTrue(position.blocked(today=today))
+        self.assertTrue(position.blocked())
+        self.assertFalse(position.blocked(
+            today=today + TEMPORARY_BLOCKLIST_DURATION))
+        position = station_position(
+            1.0, 2.0, 10, block_count=1,
+            block_last=today - TEMPORARY_BLOCKLIST_DURATION -
+            timedelta(days=1))
+        self.assertFalse(position.blocked(today=today))
+
+
+class TestStationPositionCodec(TestCase):
+
+    def test_roundtrip(self):
+        position = StationPosition(51.5, -0.1, 250, None)
+        value = encode_station_position(position)
+        self.assertEqual(len(value), 24)
+        self.assertEqual(decode_station_position(value), position)
+
+    def test_blocked(self):
+        for blocked_until in (date(2015, 10, 12), date.max):
+            position = StationPosition(51.5, -0.1, None, blocked_until)
+            value = encode_station_position(position)
+            self.assertEqual(decode_station_position(value), position)
+
+    def test_unknown(self):
+        self.assertEqual(encode_station_position(UNKNOWN_STATION), b'')
+        self.assertEqual(decode_station_position(b''), UNKNOWN_STATION)
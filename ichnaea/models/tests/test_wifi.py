@@ -67,6 +67,41 @@ class TestWifiShard(DBTestCase):
         self.assertIs(WifiShard.shard_model(''), None)
         self.assertIs(WifiShard.shard_model(None), None)
 
+    def test_querymacs(self):
+        self.session.add(WifiShard0(mac='111101123456', lat=1.0, lon=2.0))
+        self.session.add(WifiShard0(mac='111101abcdef', lat=3.0, lon=4.0))
+        self.session.add(WifiShardF(mac='0000f0123456', lat=5.0, lon=6.0))
+        self.session.flush()
+
+        with self.db_call_checker() as check_db_calls:
+            wifis = WifiShard.querymacs(self.session, [
+                '111101123456', '0000f0123456', '0000f0abcdef', ''])
+            check_db_calls(rw=1)
+
+        wifis = dict([(wifi.mac, wifi) for wifi in wifis])
+        self.assertEqual(set(wifis.keys()),
+                         set(['111101123456', '0000f0123456']))
+        self.assertIs(type(wifis['111101123456']), WifiShard0)
+        self.assertEqual(wifis['111101123456'].lat, 1.0)
+        self.assertIs(type(wifis['0000f0123456']), WifiShardF)
+        self.assertEqual(wifis['0000f0123456'].lon, 6.0)
+
+    def test_querymacs_fields(self):
+        self.session.add(WifiShard0(mac='111101123456', lat=1.0, lon=2.0))
+        self.session.flush()
+
+        wifis = WifiShard.querymacs(
+            self.session, ['111101123456'], fields=('lat', ))
+        self.assertEqual(len(wifis), 1)
+        self.assertEqual(wifis[0].mac, '111101123456')
+        self.assertEqual(wifis[0].lat, 1.0)
+        self.assertEqual(wifis[0].lon, None)
+
+    def test_querymacs_empty(self):
+        with self.db_call_checker() as check_db_calls:
+            self.assertEqual(WifiShard.querymacs(self.session, []), [])
+            check_db_calls(rw=0)
+
     def test_init(self):
         wifi = WifiShard0(mac='111101123456')
         self.session.add(wifi)
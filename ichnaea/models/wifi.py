@@ -1,12 +1,16 @@
 import base64
+from collections import defaultdict
 
 import colander
 from sqlalchemy import (
     Column,
     Date,
     Index,
+    literal,
+    select,
     String,
     PrimaryKeyConstraint,
+    union_all,
 )
 from sqlalchemy.dialects.mysql import (
     INTEGER as Integer,
@@ -240,6 +244,47 @@ class WifiShard(CreationMixin,
             return None
         return WIFI_SHARDS.get(mac.lower()[4], None)
 
+    @classmethod
+    def querymacs(cls, session, macs, fields=None):
+        """
+        Given a database session and a list of BSSIDs/MACs, return
+        a list of all matching stations across all shards.
+
+        The stations are looked up in a single database round-trip,
+        using one ``UNION ALL`` statement combining a query for each
+        of the shard tables involved. Each returned station is a new
+        instance of its shard model class, not attached to the session.
+
+        :param fields: An optional list of column names to load,
+                       defaults to loading all columns.
+        """
+        shard_macs = defaultdict(list)
+        for mac in set(macs):
+            shard_id = cls.shard_id(mac)
+            if shard_id in WIFI_SHARDS:
+                shard_macs[shard_id].append(mac)
+        if not shard_macs:
+            return []
+
+        if fields is None:
+            fields = [column.name for column in WifiShard0.__table__.columns]
+        elif 'mac' not in fields:
+            fields = ['mac'] + list(fields)
+
+        stmts = []
+        for shard_id, values in sorted(shard_macs.items()):
+            table = WIFI_SHARDS[shard_id].__table__
+            columns = [literal(shard_id).label('shard_id')]
+            columns.extend([table.c[field] for field in fields])
+            stmts.append(select(columns).where(table.c.mac.in_(values)))
+        stmt = stmts[0] if len(stmts) == 1 else union_all(*stmts)
+
+        stations = []
+        for row in session.execute(stmt).fetchall():
+            values = dict(zip(fields, row[1:]))
+            stations.append(WIFI_SHARDS[row[0]](**values))
+        return stations
+
     def blocked(self, today=None):
         if (self.block_count and
                 self.block_count >= PERMANENT_BLOCKLIST_THRESHOLD):
@@ -0,0 +1,83 @@
+"""
+Helper functions to load immutable state in a parent process, before
+forking the web app or celery worker processes.
+
+All state loaded in the parent process is shared between the worker
+processes via copy-on-write memory pages and doesn't need to be loaded
+again in each worker process.
+"""
+
+import gc
+
+from sqlalchemy.orm import configure_mappers
+
+from ichnaea.geocalc import country_tables
+from ichnaea.geoip import preload_geoip
+import ichnaea.models  # NOQA
+
+#: Modules holding the colander schemas of the public APIs.
+API_SCHEMA_MODULES = (
+    'ichnaea.api.locate.batch.schema',
+    'ichnaea.api.locate.locate_v1.schema',
+    'ichnaea.api.locate.locate_v2.schema',
+    'ichnaea.api.submit.submit_v1.schema',
+    'ichnaea.api.submit.submit_v2.schema',
+    'ichnaea.api.submit.submit_v3.schema',
+)
+
+_thawed = False
+
+
+def freeze():
+    """
+    Collect garbage and move all remaining objects into the permanent
+    generation of the garbage collector (Python 3.7+).
+
+    Otherwise the garbage collection in the worker processes would
+    touch and copy the shared memory pages. On older Python versions
+    the remaining objects are only moved into the oldest generation,
+    see :func:`~ichnaea.preload.thaw`.
+    """
+    gc.collect()
+    if hasattr(gc, 'freeze'):  # pragma: no cover
+        gc.freeze()
+
+
+def thaw():
+    """
+    Called once in each forked worker process.
+
+    On Python versions without :func:`gc.freeze`, collections of the
+    younger generations only touch objects created after forking, but
+    full collections still touch all shared objects, so they are made
+    ten times less frequent.
+    """
+    global _thawed
+    if _thawed or hasattr(gc, 'freeze'):
+        return
+    _thawed = True
+    threshold0, threshold1, threshold2 = gc.get_threshold()
+    gc.set_threshold(threshold0, threshold1, threshold2 * 10)
+
+
+def preload(modules=(), geoip_filename=None):
+    """
+    Import the given modules, configure all database model mappers,
+    load the country lookup tables, open the GeoIP database and freeze
+    the resulting state.
+
+    :param modules: Names of additional modules to import, for example
+                    :data:`~ichnaea.preload.API_SCHEMA_MODULES`.
+    :type modules: list
+
+    :param geoip_filename: The GeoIP database file, passed to
+                           :func:`ichnaea.geoip.preload_geoip`.
+    :type geoip_filename: str
+    """
+    for name in modules:
+        __import__(name)
+
+    configure_mappers()
+    country_tables()
+    preload_geoip(geoip_filename)
+    freeze()
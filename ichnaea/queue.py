@@ -2,36 +2,115 @@
 Functionality related to custom Redis based queues.
 """
 
+import hashlib
 import re
+import struct
+import time
+import uuid
 
+from redis.exceptions import NoScriptError
 from six.moves.urllib.parse import urlparse
 
 from ichnaea.cache import redis_pipeline
+from ichnaea.internalbinary import (
+    internal_binary_dumps,
+    internal_binary_loads,
+)
 from ichnaea.internaljson import (
     internal_dumps,
     internal_loads,
 )
+from ichnaea.log import get_raven_client
 
 EXPORT_QUEUE_PREFIX = 'queue_export_'
 WHITESPACE = re.compile('\s', flags=re.UNICODE)
 
+# Remove and return up to ARGV[1] items (all items for zero) from the
+# start of the KEYS[1] queue, but only if it holds at least ARGV[2]
+# items. If a KEYS[2] processing list is given, the items are also
+# moved into it and it is added to the KEYS[3] sorted set of
+# processing lists, scored by the ARGV[3] timestamp.
+DEQUEUE_SCRIPT = '''\
+local minimum = tonumber(ARGV[2])
+if minimum > 0 and redis.call('LLEN', KEYS[1]) < minimum then
+    return {}
+end
+local last = tonumber(ARGV[1]) - 1
+local items = redis.call('LRANGE', KEYS[1], 0, last)
+if last >= 0 then
+    redis.call('LTRIM', KEYS[1], last + 1, -1)
+else
+    redis.call('DEL', KEYS[1])
+end
+if #KEYS > 1 and #items > 0 then
+    for i = 1, #items, 1000 do
+        local j = math.min(i + 999, #items)
+        redis.call('RPUSH', KEYS[2], unpack(items, i, j))
+    end
+    redis.call('ZADD', KEYS[3], ARGV[3], KEYS[2])
+end
+return items
+'''
+DEQUEUE_SCRIPT_SHA = hashlib.sha1(DEQUEUE_SCRIPT.encode('ascii')).hexdigest()
+
+# Move all items from the KEYS[2] processing list back to the start of
+# the KEYS[1] queue, in their original order, and remove the processing
+# list from the KEYS[3] sorted set. Returns the number of moved items.
+REQUEUE_SCRIPT = '''\
+local count = 0
+while redis.call('RPOPLPUSH', KEYS[2], KEYS[1]) do
+    count = count + 1
+end
+redis.call('ZREM', KEYS[3], KEYS[2])
+return count
+'''
+REQUEUE_SCRIPT_SHA = hashlib.sha1(REQUEUE_SCRIPT.encode('ascii')).hexdigest()
+
+
+def _run_script(client, script, sha, keys, args):
+    try:
+        return client.evalsha(sha, len(keys), *(keys + args))
+    except NoScriptError:
+        # The script isn't yet loaded into this Redis server.
+        client.script_load(script)
+        return client.evalsha(sha, len(keys), *(keys + args))
+
 
 class BaseQueue(object):
 
+    binary = False  #: Use the internal binary format for new items?
+
     def __init__(self, name, redis_client):
         self.name = name
         self.redis_client = redis_client
 
-    def _dequeue(self, queue_key, batch):
-        with self.redis_client.pipeline() as pipe:
-            pipe.multi()
-            pipe.lrange(queue_key, 0, batch - 1)
-            if batch != 0:
-                pipe.ltrim(queue_key, batch, -1)
-            else:
-                # special case for deleting everything
-                pipe.ltrim(queue_key, 1, 0)
-            result = [internal_loads(item) for item in pipe.execute()[0]]
+    def _dumps(self, item):
+        if self.binary:
+            return internal_binary_dumps(item)
+        return str(internal_dumps(item))
+
+    def _loads(self, item):
+        if self.binary:
+            return internal_binary_loads(item)
+        return internal_loads(item)
+
+    def _dequeue(self, queue_key, batch, minimum=0, processing_key=None):
+        keys = [queue_key]
+        if processing_key:
+            keys.extend([processing_key, queue_key + ':processing'])
+        items = _run_script(
+            self.redis_client, DEQUEUE_SCRIPT, DEQUEUE_SCRIPT_SHA,
+            keys, [batch, minimum, int(time.time())])
+        result = []
+        for item in items:
+            try:
+                result.append(self._loads(item))
+            except (KeyError, TypeError, ValueError, struct.error):
+                # Drop undecodable items, instead of failing and
+                # requeuing the entire batch over and over again.
+                get_raven_client().captureException()
+                if processing_key:
+                    self.redis_client.lrem(processing_key, 1, item)
         return result
 
     def _push(self, pipe, items, queue_key, batch=100, expire=False):
@@ -43,7 +122,7 @@ class BaseQueue(object):
             items = items[batch:]
 
     def _enqueue(self, items, queue_key, batch=100, expire=False, pipe=None):
-        data = [str(internal_dumps(item)) for item in items]
+        data = [self._dumps(item) for item in items]
         if pipe is not None:
             self._push(pipe, data, queue_key, batch=batch, expire=expire)
         else:
@@ -55,10 +134,18 @@ class BaseQueue(object):
 
 
 class DataQueue(BaseQueue):
+    """
+    A Redis list based queue of internal data items.
+
+    With `binary` set, items are stored in the compact format of
+    :mod:`ichnaea.internalbinary`, while items stored in the internal
+    JSON format can still be read.
+    """
 
-    def __init__(self, name, redis_client, queue_key):
+    def __init__(self, name, redis_client, queue_key, binary=False):
         super(DataQueue, self).__init__(name, redis_client)
         self._queue_key = queue_key
+        self.binary = binary
 
     @property
     def monitor_name(self):
@@ -67,8 +154,71 @@ class DataQueue(BaseQueue):
     def queue_key(self):
         return self._queue_key
 
-    def dequeue(self, batch=100):
-        return self._dequeue(self.queue_key(), batch)
+    def dequeue(self, batch=100, pipe=None):
+        """
+        Remove and return up to `batch` items from the queue.
+
+        If a `pipe` is given, the items are kept in a processing list,
+        which is only removed once the pipe is executed. If the pipe
+        is never executed, for example because the worker crashed,
+        :meth:`requeue_expired` eventually puts the items back.
+        """
+        if pipe is None:
+            return self._dequeue(self.queue_key(), batch)
+
+        token, items = self.reserve(batch=batch)
+        if items:
+            self.ack(token, pipe=pipe)
+        return items
+
+    def reserve(self, batch=100):
+        """
+        Move up to `batch` items from the queue into a new processing
+        list, in one atomic step. Items which can't be decoded are
+        reported and removed from the processing list.
+
+        :returns: A tuple of a token identifying the processing list
+                  and the list of items.
+        """
+        token = '%s:processing:%s' % (self.queue_key(), uuid.uuid4().hex)
+        return (token, self._dequeue(
+            self.queue_key(), batch, processing_key=token))
+
+    def ack(self, token, pipe=None):
+        """
+        Remove the processing list of successfully processed items.
+
+        :param pipe: A Redis pipeline, to delay the removal until the
+                     pipeline is executed.
+        """
+        client = self.redis_client if pipe is None else pipe
+        client.delete(token)
+        client.zrem(self.queue_key() + ':processing', token)
+
+    def requeue(self, token):
+        """
+        Put the items of the processing list back into the queue.
+
+        :returns: The number of requeued items.
+        """
+        return _run_script(
+            self.redis_client, REQUEUE_SCRIPT, REQUEUE_SCRIPT_SHA,
+            [self.queue_key(), token, self.queue_key() + ':processing'], [])
+
+    def requeue_expired(self, timeout=600):
+        """
+        Requeue the items of all processing lists, which were created
+        more than `timeout` seconds ago.
+
+        :returns: The number of requeued items.
+        """
+        tokens = self.redis_client.zrangebyscore(
+            self.queue_key() + ':processing',
+            '-inf', int(time.time()) - timeout)
+        count = 0
+        for token in tokens:
+            count += self.requeue(token.decode('utf-8'))
+        return count
 
     def enqueue(self, items, batch=100, expire=86400, pipe=None):
         self._enqueue(items, self.queue_key(),
@@ -116,8 +266,12 @@ class ExportQueue(BaseQueue):
     def export_allowed(self, api_key):
         return (api_key not in self.skip_keys)
 
-    def dequeue(self, queue_key, batch=100):
-        return self._dequeue(queue_key, batch)
+    def dequeue(self, queue_key, batch=100, minimum=0):
+        """
+        Remove and return up to `batch` items from the queue, but only
+        if it holds at least `minimum` items.
+        """
+        return self._dequeue(queue_key, batch, minimum=minimum)
 
     def enqueue(self, items, queue_key, batch=100, expire=False, pipe=None):
         self._enqueue(items, queue_key=queue_key,
@@ -0,0 +1,84 @@
+"""
+Benchmark the import time of the modules loaded by the web app,
+the celery workers and the command line scripts at startup.
+
+Each module is imported in a fresh interpreter, repeated a number
+of times, reporting the fastest import time. The output also lists
+which of the known slow to import dependencies got imported.
+"""
+
+import argparse
+import json
+import subprocess
+import sys
+
+#: Modules loaded on startup by the different processes.
+STARTUP_MODULES = (
+    'ichnaea.geocalc',
+    'ichnaea.geoip',
+    'ichnaea.data.tasks',
+    'ichnaea.async.app',
+    'ichnaea.content.views',
+    'ichnaea.scripts.load',
+    'ichnaea.scripts.map',
+    'ichnaea.webapp.app',
+)
+
+#: Dependencies which should only be imported when needed.
+HEAVY_MODULES = (
+    'boto',
+    'country_bounding_boxes',
+)
+
+_IMPORT_SCRIPT = '''
+import json, sys, time
+start = time.time()
+import %(module)s
+duration = time.time() - start
+print(json.dumps({
+    'duration': duration,
+    'heavy': [name for name in %(heavy)r if name in sys.modules],
+}))
+'''
+
+
+def measure_import(module, repeat=5, python=None):
+    """
+    Import the module in fresh interpreters.
+
+    :returns: A tuple of the fastest import time in milliseconds and
+              a list of the heavy modules imported by the module.
+    """
+    if python is None:
+        python = sys.executable
+    script = _IMPORT_SCRIPT % {'module': module, 'heavy': HEAVY_MODULES}
+    durations = []
+    heavy = []
+    for i in range(repeat):
+        process = subprocess.Popen(
+            [python, '-c', script], stdout=subprocess.PIPE)
+        output = process.communicate()[0]
+        if process.returncode:
+            raise RuntimeError('Importing %s failed.' % module)
+        result = json.loads(output.decode('utf-8').strip().splitlines()[-1])
+        durations.append(result['duration'] * 1000.0)
+        heavy = result['heavy']
+    return (min(durations), heavy)
+
+
+def main(argv):  # pragma: no cover
+    parser = argparse.ArgumentParser(
+        prog=argv[0], description='Benchmark module import times.')
+    parser.add_argument('--repeat', type=int, default=5,
+                        help='Number of imports per module.')
+    parser.add_argument('modules', nargs='*', default=STARTUP_MODULES,
+                        help='Modules to import.')
+
+    args = parser.parse_args(argv[1:])
+    for module in args.modules:
+        duration, heavy = measure_import(module, repeat=args.repeat)
+        print('%-24s %8.1f ms  %s' % (module, duration, ' '.join(heavy)))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main(sys.argv)
@@ -7,7 +7,6 @@ import shutil
 import sys
 import tempfile
 
-import boto
 from simplejson import dumps
 from six.moves import range as xrange
 from sqlalchemy import text
@@ -88,6 +87,9 @@ def export_to_csv(session, filename, multiplier=5):
 
 
 def upload_to_s3(bucketname, tiles):  # pragma: no cover
+    # boto is slow to import and only needed for the upload
+    import boto
+
     tiles = os.path.abspath(tiles)
 
     conn = boto.connect_s3()
@@ -0,0 +1,118 @@
+"""
+Benchmark the validation of submitted reports, comparing the colander
+schemas of the report models with the validators in
+:mod:`ichnaea.models.fastschema`.
+
+The reports are randomly generated, with a mix of valid and invalid
+cell and wifi entries. The output lists the number of validated
+reports and cell or wifi entries per second.
+"""
+
+import argparse
+from random import Random
+import sys
+import time
+
+from ichnaea.models import (
+    CellReport,
+    Report,
+    WifiReport,
+)
+from ichnaea.models.fastschema import (
+    validate_cell_report,
+    validate_report,
+    validate_wifi_report,
+)
+
+
+def make_reports(count, seed=42):
+    """Return a list of randomly generated report dictionaries."""
+    random = Random(seed)
+    reports = []
+    for i in range(count):
+        cells = []
+        for j in range(random.randint(0, 3)):
+            cells.append({
+                'radio': random.choice(['gsm', 'wcdma', 'lte', 'cdma']),
+                'mcc': random.choice([234, 310, 1000]),
+                'mnc': random.randint(0, 999),
+                'lac': random.randint(0, 70000),
+                'cid': random.randint(0, 300000),
+                'psc': random.randint(0, 520),
+                'signal': random.randint(-160, 0),
+            })
+        wifis = []
+        for j in range(random.randint(0, 10)):
+            wifis.append({
+                'key': '%012x' % random.randint(0, 2 ** 48 - 1),
+                'frequency': random.choice([2412, 2437, 5180, 0]),
+                'signal': random.randint(-210, -1),
+            })
+        reports.append({
+            'lat': random.uniform(-91.0, 91.0),
+            'lon': random.uniform(-181.0, 181.0),
+            'accuracy': random.choice([None, 10.0, 2000000.0]),
+            'cell': cells,
+            'wifi': wifis,
+        })
+    return reports
+
+
+def _colander(report, cell, wifi):
+    return (Report.validate(dict(report)),
+            [CellReport.validate(dict(item)) for item in cell],
+            [WifiReport.validate(dict(item)) for item in wifi])
+
+
+def _fast(report, cell, wifi):
+    return (validate_report(report),
+            [validate_cell_report(item) for item in cell],
+            [validate_wifi_report(item) for item in wifi])
+
+
+VALIDATORS = {
+    'colander': _colander,
+    'fast': _fast,
+}
+
+
+def measure_validation(reports, validator='fast', repeat=3):
+    """
+    Validate all reports, including their cell and wifi entries.
+
+    :returns: A tuple of the number of reports and the number of
+              cell and wifi entries validated per second, based on
+              the fastest of the repeated runs.
+    """
+    func = VALIDATORS[validator]
+    items = sum([len(report['cell']) + len(report['wifi'])
+                 for report in reports])
+    durations = []
+    for i in range(repeat):
+        start = time.time()
+        for report in reports:
+            func(report, report['cell'], report['wifi'])
+        durations.append(time.time() - start)
+    duration = max(min(durations), 1e-9)
+    return (len(reports) / duration, items / duration)
+
+
+def main(argv):  # pragma: no cover
+    parser = argparse.ArgumentParser(
+        prog=argv[0], description='Benchmark report validation.')
+    parser.add_argument('--count', type=int, default=10000,
+                        help='Number of generated reports.')
+    parser.add_argument('--repeat', type=int, default=3,
+                        help='Number of runs per validator.')
+
+    args = parser.parse_args(argv[1:])
+    reports = make_reports(args.count)
+    for validator in sorted(VALIDATORS.keys()):
+        per_report, per_item = measure_validation(
+            reports, validator=validator, repeat=args.repeat)
+        print('%-10s %10.0f reports/s %10.0f items/s' % (
+            validator, per_report, per_item))
+
+
+if __name__ == '__main__':  # pragma: no cover
+    main(sys.argv)
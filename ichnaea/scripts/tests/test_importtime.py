@@ -0,0 +1,19 @@
+from ichnaea.scripts.importtime import measure_import
+from ichnaea.tests.base import TestCase
+
+
+class TestImportTime(TestCase):
+
+    def test_geocalc(self):
+        duration, heavy = measure_import('ichnaea.geocalc', repeat=1)
+        self.assertTrue(duration > 0.0)
+        self.assertEqual(heavy, [])
+
+    def test_data_tasks(self):
+        duration, heavy = measure_import('ichnaea.data.tasks', repeat=1)
+        self.assertEqual(heavy, [])
+
+    def test_scripts(self):
+        for module in ('ichnaea.scripts.load', 'ichnaea.scripts.map'):
+            duration, heavy = measure_import(module, repeat=1)
+            self.assertEqual(heavy, [], module)
@@ -0,0 +1,28 @@
+from ichnaea.scripts.reporttime import (
+    make_reports,
+    measure_validation,
+    VALIDATORS,
+)
+from ichnaea.tests.base import TestCase
+
+
+class TestReportTime(TestCase):
+
+    def test_make_reports(self):
+        reports = make_reports(10)
+        self.assertEqual(len(reports), 10)
+        self.assertEqual(reports, make_reports(10))
+
+    def test_validators(self):
+        reports = make_reports(20)
+        for report in reports:
+            args = (report, report['cell'], report['wifi'])
+            self.assertEqual(VALIDATORS['colander'](*args),
+                             VALIDATORS['fast'](*args))
+
+    def test_measure(self):
+        reports = make_reports(5)
+        for validator in VALIDATORS:
+            per_report, per_item = measure_validation(
+                reports, validator=validator, repeat=1)
+            self.assertTrue(per_report > 0.0)
@@ -0,0 +1,44 @@
+from redis.exceptions import ResponseError
+
+from ichnaea.cache import RedisBatch
+from ichnaea.tests.base import RedisTestCase
+
+
+class TestRedisBatch(RedisTestCase):
+
+    def test_empty(self):
+        batch = RedisBatch(self.redis_client)
+        self.assertEqual(batch.execute(), [])
+        self.assertEqual(batch.round_trips, 0)
+
+    def test_deferred(self):
+        batch = RedisBatch(self.redis_client)
+        batch.defer(lambda pipe: pipe.set('foo', b'1'))
+        batch.defer(lambda pipe: pipe.incr('foo'))
+        self.assertEqual(self.redis_client.get('foo'), None)
+
+        result = batch.execute(lambda pipe: pipe.get('foo'))
+        self.assertEqual(result, [b'2'])
+        self.assertEqual(batch.round_trips, 1)
+        self.assertTrue(batch.duration > 0.0)
+
+        self.assertEqual(batch.execute(), [])
+        self.assertEqual(batch.round_trips, 1)
+
+    def test_flush(self):
+        batch = RedisBatch(self.redis_client)
+        batch.defer(lambda pipe: pipe.set('foo', b'1'))
+        self.assertEqual(batch.execute(), [])
+        self.assertEqual(self.redis_client.get('foo'), b'1')
+        self.assertEqual(batch.round_trips, 1)
+
+    def test_errors(self):
+        self.redis_client.set('foo', b'bar')
+        batch = RedisBatch(self.redis_client)
+        batch.defer(lambda pipe: pipe.incr('foo'))
+        self.assertEqual(batch.execute(lambda pipe: pipe.get('foo')),
+                         [b'bar'])
+
+        with self.assertRaises(ResponseError):
+            batch.execute(lambda pipe: pipe.incr('foo'))
+        self.assertEqual(batch.round_trips, 2)
@@ -1,13 +1,21 @@
 import numpy
 
 from ichnaea.geocalc import (
+    _fill_bbox_cache,
     _radius_cache,
     aggregate_position,
+    bbox_diagonals,
+    circle_radius,
+    countries_for_locations,
     country_for_location,
     country_max_radius,
+    country_tables,
     distance,
+    distance_matrix,
+    group_centroids,
     latitude_add,
     longitude_add,
+    point_distances,
 )
 from ichnaea import constants
 from ichnaea.tests.base import TestCase
@@ -26,6 +34,30 @@ class TestAggregatePosition(TestCase):
                          (1.0, 1.0, 333.0))
 
 
+class TestBboxDiagonals(TestCase):
+
+    def test_diagonals(self):
+        boxes = numpy.array([
+            (44.0337065, -79.4908184, 44.0347065, -79.4918184),
+            (1.0, 1.0, 1.0, 1.0),
+        ], dtype=numpy.double)
+        result = bbox_diagonals(boxes)
+        self.assertEqual(len(result), 2)
+        self.assertAlmostEqual(result[0], 136.9483, 4)
+        self.assertEqual(result[1], 0.0)
+
+    def test_empty(self):
+        self.assertEqual(len(bbox_diagonals([])), 0)
+
+
+class TestCircleRadius(TestCase):
+
+    def test_radius(self):
+        self.assertEqual(
+            circle_radius(1.0, 1.0, 1.1, 1.0, 0.9, 1.0),
+            int(round(distance(1.0, 1.0, 1.1, 1.0))))
+
+
 class TestCountryForLocation(TestCase):
 
     def test_no_match(self):
@@ -37,6 +69,46 @@ class TestCountryForLocation(TestCase):
     def test_multiple(self):
         self.assertEqual(country_for_location(31.522, 34.455), None)
 
+    def test_invalid(self):
+        self.assertEqual(country_for_location(None, 0.0), None)
+        self.assertEqual(country_for_location(91.0, 0.0), None)
+        self.assertEqual(country_for_location(0.0, float('nan')), None)
+
+
+class TestCountriesForLocations(TestCase):
+
+    def test_empty(self):
+        self.assertEqual(countries_for_locations([]), [])
+
+    def test_countries(self):
+        self.assertEqual(countries_for_locations([
+            (0.0, 0.0),
+            (51.5142, -0.0931),
+            (31.522, 34.455),
+            (91.0, 0.0),
+        ]), [None, 'GB', None, None])
+
+    def test_matches_single(self):
+        points = [(lat, lon)
+                  for lat in numpy.arange(-85.0, 85.0, 7.3)
+                  for lon in numpy.arange(-175.0, 175.0, 11.7)]
+        self.assertEqual(
+            countries_for_locations(points),
+            [country_for_location(lat, lon) for lat, lon in points])
+
+
+class TestCountrySnapshot(TestCase):
+
+    def test_current(self):
+        # run `make geocalc_snapshot` after updating country_bounding_boxes
+        self.assertEqual(country_tables().subunits, _fill_bbox_cache())
+
+    def test_codes(self):
+        tables = country_tables()
+        self.assertEqual([s.alpha2 for s in tables.by_code['GB']],
+                         ['GB'] * len(tables.by_code['GB']))
+        self.assertEqual(tables.by_code['GB'], tables.by_code['GBR'])
+
 
 class TestCountryMaxRadius(TestCase):
 
@@ -121,6 +193,86 @@ class TestDistance(TestCase):
             distance(None, '0.1', 1, 1.1)
 
 
+class TestPointDistances(TestCase):
+
+    def test_distances(self):
+        points = numpy.array([
+            (44.0347065, -79.4918184),
+            (44.0337065, -79.4908184),
+        ], dtype=numpy.double)
+        result = point_distances(44.0337065, -79.4908184, points)
+        self.assertEqual(len(result), 2)
+        self.assertAlmostEqual(result[0], 136.9483, 4)
+        self.assertEqual(result[1], 0.0)
+
+    def test_matches_distance(self):
+        points = [(51.5, -0.1), (-33.9, 151.2), (0.0, 0.0), (89.9, 179.9)]
+        result = point_distances(40.7, -74.0, points)
+        for value, (lat, lon) in zip(result, points):
+            self.assertAlmostEqual(value, distance(40.7, -74.0, lat, lon), 6)
+
+    def test_empty(self):
+        result = point_distances(1.0, 1.0, numpy.empty((0, 2)))
+        self.assertEqual(len(result), 0)
+
+
+class TestDistanceMatrix(TestCase):
+
+    def test_matches_distance(self):
+        points1 = numpy.array([
+            (44.0337065, -79.4908184),
+            (90.0, 0.0),
+            (1.0, 1.0),
+        ], dtype=numpy.double)
+        points2 = numpy.array([
+            (44.0347065, -79.4918184),
+            (-90.0, 0.0),
+        ], dtype=numpy.double)
+        result = distance_matrix(points1, points2)
+        self.assertEqual(result.shape, (3, 2))
+        for i, (lat1, lon1) in enumerate(points1):
+            for j, (lat2, lon2) in enumerate(points2):
+                self.assertAlmostEqual(
+                    result[i][j], distance(lat1, lon1, lat2, lon2), 4)
+
+    def test_empty(self):
+        points = numpy.array([], dtype=numpy.double)
+        self.assertEqual(distance_matrix(points, points).shape, (0, 0))
+
+
+class TestGroupCentroids(TestCase):
+
+    def test_groups(self):
+        points = numpy.array([
+            (1.0, 2.0), (3.0, 4.0),
+            (5.0, 6.0),
+            (1.0, 1.0), (2.0, 2.0), (3.0, 3.0),
+        ], dtype=numpy.double)
+        result = group_centroids(points, [0, 2, 3, 6])
+        self.assertEqual(result.shape, (3, 2))
+        self.assertEqual(list(result[0]), [2.0, 3.0])
+        self.assertEqual(list(result[1]), [5.0, 6.0])
+        self.assertEqual(list(result[2]), [2.0, 2.0])
+
+    def test_empty_group(self):
+        points = numpy.array([(1.0, 2.0)], dtype=numpy.double)
+        result = group_centroids(points, [0, 0, 1])
+        self.assertTrue(numpy.isnan(result[0]).all())
+        self.assertEqual(list(result[1]), [1.0, 2.0])
+
+    def test_out_of_bounds(self):
+        points = numpy.array([(1.0, 2.0)], dtype=numpy.double)
+        for offsets in ([0, 2], [-1, 1]):
+            with self.assertRaises(ValueError):
+                group_centroids(points, offsets)
+
+    def test_descending(self):
+        points = numpy.array([(1.0, 2.0), (3.0, 4.0)], dtype=numpy.double)
+        for offsets in ([0, 2, 1], [1, 0, 2], [0, -1, 2]):
+            with self.assertRaises(ValueError):
+                group_centroids(points, offsets)
+
+
 class TestLatitudeAdd(TestCase):
 
     def test_returns_min_lat(self):
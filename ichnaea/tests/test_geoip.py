@@ -11,6 +11,7 @@ from ichnaea import geoip
 from ichnaea.geoip import geoip_accuracy
 from ichnaea.tests.base import (
     GEOIP_BAD_FILE,
+    GEOIP_TEST_FILE,
     GeoIPTestCase,
     TestCase,
 )
@@ -96,6 +97,114 @@ class TestGeoIPLookup(GeoIPTestCase):
         self.assertIsNone(geoip.GeoIPNull().geoip_lookup('200'))
 
 
+class TestGeoIPCache(GeoIPTestCase):
+
+    def _open_cached_db(self, **kw):
+        return geoip.configure_geoip(
+            GEOIP_TEST_FILE, raven_client=self.raven_client,
+            stats_client=self.stats_client, cache_size=10, **kw)
+
+    def test_hit(self):
+        db = self._open_cached_db()
+        london = self.geoip_data['London']
+        result = db.geoip_lookup(london['ip'])
+        result['city'] = None
+        result = db.geoip_lookup(london['ip'])
+        self.assertEqual(result['country_code'], london['country_code'])
+        self.assertEqual(result['city'], london['city'])
+        # the first miss is the lookup done while opening the database
+        self.check_stats(counter=[
+            ('geoip.cache', 1, ['status:hit']),
+            ('geoip.cache', 2, ['status:miss']),
+        ])
+
+    def test_not_found(self):
+        db = self._open_cached_db()
+        self.assertIsNone(db.geoip_lookup('127.0.0.1'))
+        self.assertIsNone(db.geoip_lookup('127.0.0.1'))
+        self.assertIsNone(db.geoip_lookup('546.839.319.-1'))
+        self.check_stats(counter=[
+            ('geoip.cache', 2, ['status:hit']),
+        ])
+
+    def test_prefix(self):
+        db = self._open_cached_db(cache_ipv4_prefix=24)
+        london = self.geoip_data['London']
+        network = london['ip'].rsplit('.', 1)[0]
+        ip = network + '.1'
+        if ip == london['ip']:  # pragma: no cover
+            ip = network + '.2'
+        db.geoip_lookup(london['ip'])
+        result = db.geoip_lookup(ip)
+        self.assertEqual(result['country_code'], london['country_code'])
+        self.check_stats(counter=[
+            ('geoip.cache', ['status:hit']),
+        ])
+
+    def test_close(self):
+        db = self._open_cached_db()
+        db.geoip_lookup(self.geoip_data['London']['ip'])
+        db.close()
+        self.assertEqual(db.cache.get(
+            db._cache_key(self.geoip_data['London']['ip'])), None)
+
+
+class TestGeoIPLazy(GeoIPTestCase):
+
+    def _open_lazy_db(self, filename=GEOIP_TEST_FILE):
+        return geoip.configure_geoip(
+            filename, raven_client=self.raven_client, lazy=True)
+
+    def test_lookup(self):
+        db = self._open_lazy_db()
+        self.assertIsInstance(db, geoip.GeoIPLazy)
+        self.assertFalse(db.opened)
+        london = self.geoip_data['London']
+        result = db.geoip_lookup(london['ip'])
+        self.assertEqual(result['country_code'], london['country_code'])
+        self.assertTrue(db.opened)
+        self.assertTrue(db.ping())
+        db.close()
+        self.assertFalse(db.opened)
+
+    def test_missing_file(self):
+        db = self._open_lazy_db('/i/taught/i/taw/a/putty/tat')
+        self.assertEqual(len(self.raven_client.msgs), 0)
+        self.assertIsNone(db.geoip_lookup('127.0.0.1'))
+        self.assertFalse(db.ping())
+        error = 'FileNotFoundError'
+        if PY2:
+            error = 'IOError'
+        self.check_raven([error + ': No such file or directory'])
+
+
+class TestGeoIPPreload(GeoIPTestCase):
+
+    def tearDown(self):
+        geoip._PRELOADED.clear()
+        super(TestGeoIPPreload, self).tearDown()
+
+    def test_preload(self):
+        geoip.preload_geoip(GEOIP_TEST_FILE)
+        preloaded = geoip._PRELOADED[(GEOIP_TEST_FILE, geoip.MODE_AUTO)]
+        db = geoip.configure_geoip(
+            GEOIP_TEST_FILE, stats_client=self.stats_client, cache_size=10)
+        self.assertTrue(db is preloaded)
+        self.assertTrue(db.stats_client is self.stats_client)
+        self.assertEqual(db.cache.size, 10)
+        self.assertEqual(geoip._PRELOADED, {})
+
+        # the preloaded database is only used once
+        other = geoip.configure_geoip(GEOIP_TEST_FILE)
+        self.assertFalse(other is db)
+
+    def test_preload_missing_file(self):
+        geoip.preload_geoip('/i/taught/i/taw/a/putty/tat')
+        geoip.preload_geoip(None)
+        self.assertEqual(geoip._PRELOADED, {})
+        self.assertEqual(len(self.raven_client.msgs), 0)
+
+
 class TestGeoIPAccuracy(TestCase):
 
     li_radius = 13000.0
@@ -0,0 +1,96 @@
+from datetime import date
+
+from ichnaea.internalbinary import (
+    internal_binary_dumps,
+    internal_binary_loads,
+)
+from ichnaea.internaljson import internal_dumps
+from ichnaea.models import (
+    CellObservation,
+    Radio,
+    Score,
+    ScoreKey,
+    WifiObservation,
+)
+from ichnaea.tests.base import (
+    GB_LAT,
+    GB_LON,
+    GB_MCC,
+    TestCase,
+)
+
+
+class TestInternalBinary(TestCase):
+
+    def _roundtrip(self, value):
+        data = internal_binary_dumps(value)
+        self.assertTrue(isinstance(data, bytes))
+        return (data, internal_binary_loads(data))
+
+    def _cell(self, **kw):
+        values = dict(radio=Radio.wcdma, mcc=GB_MCC, mnc=5, lac=12345,
+                      cid=234567, psc=12, signal=-80, lat=GB_LAT,
+                      lon=GB_LON, accuracy=10.5)
+        values.update(kw)
+        return CellObservation(**values)
+
+    def _wifi(self, **kw):
+        values = dict(key='3680873e9b83', channel=11, signal=-85,
+                      lat=GB_LAT, lon=GB_LON, altitude=110.0)
+        values.update(kw)
+        return WifiObservation(**values)
+
+    def test_cell(self):
+        obs = self._cell()
+        data, result = self._roundtrip(obs)
+        self.assertTrue(type(result) is CellObservation)
+        self.assertEqual(result.__dict__, obs.__dict__)
+        self.assertTrue(result.radio is Radio.wcdma)
+        self.assertEqual(result.asu, None)
+        self.assertTrue(len(data) * 4 < len(internal_dumps(obs)))
+
+    def test_wifi(self):
+        obs = self._wifi()
+        data, result = self._roundtrip(obs)
+        self.assertTrue(type(result) is WifiObservation)
+        self.assertEqual(result.__dict__, obs.__dict__)
+        self.assertEqual(result.key, '3680873e9b83')
+        self.assertTrue(len(data) * 4 < len(internal_dumps(obs)))
+
+    def test_mapstat(self):
+        position = {'lat': GB_LAT, 'lon': GB_LON}
+        data, result = self._roundtrip(position)
+        self.assertEqual(result, position)
+        self.assertEqual(len(data), 20)
+
+    def test_score(self):
+        for time in (None, date(2015, 10, 12)):
+            score = {'hashkey': Score.to_hashkey(
+                userid=3, key=ScoreKey.new_wifi, time=time), 'value': 7}
+            data, result = self._roundtrip(score)
+            self.assertEqual(result, score)
+            self.assertTrue(result['hashkey'].key is ScoreKey.new_wifi)
+
+    def test_fallback(self):
+        values = [
+            {'lat': 1.0},
+            {'lat': 1.0, 'lon': 2.0, 'foo': 3},
+            {'lat': 'abc', 'lon': 2.0},
+            {'data': [1, 2, {'d': date(2015, 10, 12)}]},
+            self._cell(cid=2 ** 40),
+            self._cell(signal=-80.5),
+            self._wifi(key='3680873E9B83'),
+            self._wifi(key='3680873e9b83aa'),
+        ]
+        for value in values:
+            data, result = self._roundtrip(value)
+            self.assertEqual(data, internal_dumps(value).encode('utf-8'))
+            if hasattr(value, '__dict__'):
+                self.assertEqual(result.__dict__, value.__dict__)
+            else:
+                self.assertEqual(result, value)
+
+    def test_json(self):
+        obs = self._wifi()
+        result = internal_binary_loads(internal_dumps(obs))
+        self.assertEqual(result.__dict__, obs.__dict__)
@@ -1,6 +1,10 @@
 import time
 
-from ichnaea.log import DebugStatsClient
+from ichnaea.log import (
+    DebugStatsClient,
+    parse_sample_rates,
+    STATS_PACKET_SIZE,
+)
 from ichnaea.tests.base import LogTestCase
 
 
@@ -86,3 +90,121 @@ class TestStatsPrefix(LogTestCase):
             counter=['pre.metric.one'],
             gauge=['pre.metric'],
             timer=['pre.metric.two.two'])
+
+
+class TestStatsAggregate(LogTestCase):
+
+    def _make_client(self, **kw):
+        return DebugStatsClient(
+            tag_support=True, aggregate_interval=3600, max_buffer_size=1,
+            **kw)
+
+    def test_counter(self):
+        client = self._make_client()
+        client.incr('metric', 2, tags=['t1:v1'])
+        client.incr('metric', 3, tags=['t1:v1'])
+        client.incr('metric', 1, tags=['t1:v2'])
+        self.check_stats(_client=client, total=0)
+        client.flush()
+        self.check_stats(
+            _client=client, total=2,
+            counter=[('metric', 1, 5, ['t1:v1']),
+                     ('metric', 1, 1, ['t1:v2'])])
+        client.flush()
+        self.check_stats(_client=client, total=2)
+
+    def test_gauge(self):
+        client = self._make_client()
+        client.gauge('metric', 3)
+        client.gauge('metric', 2)
+        client.flush()
+        self.check_stats(_client=client, total=1, gauge=[('metric', 1, 2)])
+
+    def test_timing(self):
+        client = self._make_client()
+        for value in (13, 13, 1234, 1249):
+            client.timing('metric', value)
+        client.flush()
+        self.assertEqual(sorted(client.msgs),
+                         ['metric:1200|ms|@0.5', 'metric:13|ms|@0.5'])
+
+    def test_set(self):
+        client = self._make_client()
+        client.set('metric', 1)
+        self.assertEqual(list(client.msgs), ['metric:1|s'])
+
+    def test_interval(self):
+        client = self._make_client()
+        client.aggregate_interval = 1
+        client.incr('metric', 1)
+        self.check_stats(_client=client, total=0)
+        time.sleep(1)
+        client.incr('metric', 1)
+        self.check_stats(_client=client, total=1, counter=[('metric', 1, 2)])
+
+    def test_start(self):
+        client = self._make_client()
+        client.aggregate_interval = 0.05
+        client.start()
+        client.incr('metric', 1)
+        self.check_stats(_client=client, total=0)
+        time.sleep(0.2)
+        client.stop()
+        self.check_stats(_client=client, total=1, counter=[('metric', 1, 1)])
+
+    def test_start_disabled(self):
+        client = DebugStatsClient()
+        client.start()
+        self.assertTrue(client._flush_stopped is None)
+
+    def test_packets(self):
+        client = DebugStatsClient(aggregate_interval=3600, max_buffer_size=2)
+        for name in ('m1', 'm2', 'm3'):
+            client.incr(name)
+        client.flush()
+        self.assertEqual(len(client.msgs), 2)
+        self.assertEqual(
+            sorted('\n'.join(client.msgs).split('\n')),
+            ['m1:1|c', 'm2:1|c', 'm3:1|c'])
+
+    def test_packet_size(self):
+        client = DebugStatsClient(aggregate_interval=3600, max_buffer_size=50)
+        names = ['metric_%s_%s' % (i, 'x' * 80) for i in range(40)]
+        for name in names:
+            client.incr(name)
+        client.flush()
+        self.assertTrue(len(client.msgs) > 1)
+        for msg in client.msgs:
+            self.assertTrue(len(msg) <= STATS_PACKET_SIZE)
+        self.assertEqual(
+            sorted('\n'.join(client.msgs).split('\n')),
+            sorted([name + ':1|c' for name in names]))
+
+
+class TestStatsSampleRates(LogTestCase):
+
+    def test_parse(self):
+        self.assertEqual(parse_sample_rates({
+            'host': 'localhost',
+            'sample_rate.metric.one': '0.1',
+        }), {'metric.one': 0.1})
+
+    def test_disabled(self):
+        client = DebugStatsClient(sample_rates={'metric': 0.0})
+        client.incr('metric')
+        client.incr('other')
+        self.check_stats(_client=client, total=1, counter=['other'])
+
+    def test_sampled(self):
+        client = DebugStatsClient(sample_rates={'metric': 0.999999})
+        client.timing('metric', 1)
+        self.assertTrue(client.msgs[0].endswith('|@0.999999'))
+
+    def test_aggregated(self):
+        client = DebugStatsClient(
+            aggregate_interval=3600, sample_rates={'metric': 0.5})
+        for i in range(1000):
+            client.incr('metric')
+        client.flush()
+        value = int(client.msgs[0].split('|')[0].split(':')[1])
+        self.assertTrue(800 < value < 1200, value)
@@ -0,0 +1,56 @@
+import gc
+import sys
+
+from sqlalchemy.orm import class_mapper
+
+from ichnaea import geocalc
+from ichnaea import geoip
+from ichnaea.models.wifi import WifiShard0
+from ichnaea import preload as preload_module
+from ichnaea.preload import (
+    API_SCHEMA_MODULES,
+    preload,
+    thaw,
+)
+from ichnaea.tests.base import (
+    GEOIP_TEST_FILE,
+    TestCase,
+)
+
+
+class TestPreload(TestCase):
+
+    def setUp(self):
+        super(TestPreload, self).setUp()
+        self.threshold = gc.get_threshold()
+        preload_module._thawed = False
+
+    def tearDown(self):
+        if hasattr(gc, 'unfreeze'):  # pragma: no cover
+            gc.unfreeze()
+        gc.set_threshold(*self.threshold)
+        preload_module._thawed = False
+        geoip._PRELOADED.clear()
+        super(TestPreload, self).tearDown()
+
+    def test_preload(self):
+        preload(modules=API_SCHEMA_MODULES, geoip_filename=GEOIP_TEST_FILE)
+        self.assertTrue(class_mapper(WifiShard0).configured)
+        for name in API_SCHEMA_MODULES:
+            self.assertTrue(name in sys.modules)
+        self.assertFalse(geocalc._country_tables is None)
+        self.assertEqual(list(geoip._PRELOADED.keys()),
+                         [(GEOIP_TEST_FILE, geoip.MODE_AUTO)])
+        self.assertTrue(gc.isenabled())
+        if hasattr(gc, 'get_freeze_count'):  # pragma: no cover
+            self.assertTrue(gc.get_freeze_count() > 0)
+
+    def test_thaw(self):
+        thaw()
+        thaw()
+        self.assertTrue(gc.isenabled())
+        if hasattr(gc, 'freeze'):  # pragma: no cover
+            self.assertEqual(gc.get_threshold(), self.threshold)
+        else:  # pragma: no cover
+            self.assertEqual(gc.get_threshold(),
+                             self.threshold[:2] + (self.threshold[2] * 10, ))
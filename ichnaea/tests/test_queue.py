@@ -0,0 +1,101 @@
+from ichnaea.queue import (
+    DataQueue,
+    ExportQueue,
+)
+from ichnaea.tests.base import RedisTestCase
+
+
+class TestDataQueue(RedisTestCase):
+
+    def setUp(self):
+        super(TestDataQueue, self).setUp()
+        self.queue = DataQueue('test', self.redis_client, queue_key='test')
+
+    def _processing(self):
+        return self.redis_client.zrange('test:processing', 0, -1)
+
+    def test_dequeue(self):
+        self.queue.enqueue([1, 2, 3])
+        self.assertEqual(self.queue.dequeue(batch=2), [3, 2])
+        self.assertEqual(self.queue.dequeue(batch=2), [1])
+        self.assertEqual(self.queue.dequeue(batch=2), [])
+        self.assertEqual(self._processing(), [])
+
+    def test_dequeue_all(self):
+        self.queue.enqueue(list(range(2500)))
+        self.assertEqual(len(self.queue.dequeue(batch=0)), 2500)
+        self.assertEqual(self.queue.size(), 0)
+
+    def test_dequeue_pipe(self):
+        self.queue.enqueue([1, 2, 3])
+        with self.redis_client.pipeline() as pipe:
+            self.assertEqual(self.queue.dequeue(batch=2, pipe=pipe), [3, 2])
+            token = self._processing()[0]
+            self.assertEqual(self.redis_client.llen(token), 2)
+            pipe.execute()
+        self.assertEqual(self._processing(), [])
+        self.assertFalse(self.redis_client.exists(token))
+        self.assertEqual(self.queue.size(), 1)
+
+    def test_reserve_ack(self):
+        self.queue.enqueue([1, 2, 3])
+        token, items = self.queue.reserve(batch=2)
+        self.assertEqual(items, [3, 2])
+        self.assertEqual(self.queue.size(), 1)
+        self.assertEqual(self.redis_client.llen(token), 2)
+
+        self.queue.ack(token)
+        self.assertEqual(self._processing(), [])
+        self.assertFalse(self.redis_client.exists(token))
+
+    def test_reserve_large(self):
+        self.queue.enqueue(list(range(2500)))
+        token, items = self.queue.reserve(batch=0)
+        self.assertEqual(len(items), 2500)
+        self.assertEqual(self.redis_client.llen(token), 2500)
+
+    def test_reserve_invalid(self):
+        self.queue.binary = True
+        self.queue.enqueue([1, 2])
+        # A truncated binary header
+        self.redis_client.lpush('test', b'\x01\x00')
+        token, items = self.queue.reserve(batch=3)
+        self.assertEqual(items, [2, 1])
+        self.assertEqual(self.redis_client.llen(token), 2)
+        self.check_raven([('error', 1)])
+
+        self.assertEqual(self.queue.requeue(token), 2)
+        self.assertEqual(self.queue.dequeue(batch=3), [2, 1])
+
+    def test_requeue(self):
+        self.queue.enqueue([1, 2, 3])
+        token, items = self.queue.reserve(batch=2)
+        self.assertEqual(self.queue.requeue(token), 2)
+        self.assertEqual(self._processing(), [])
+        self.assertEqual(self.queue.dequeue(batch=3), [3, 2, 1])
+
+    def test_requeue_expired(self):
+        self.queue.enqueue([1, 2, 3])
+        self.queue.reserve(batch=1)
+        self.queue.reserve(batch=1)
+        self.assertEqual(self.queue.requeue_expired(timeout=60), 0)
+        self.assertEqual(self.queue.size(), 1)
+
+        self.assertEqual(self.queue.requeue_expired(timeout=-1), 2)
+        self.assertEqual(self.queue.size(), 3)
+        self.assertEqual(self._processing(), [])
+
+
+class TestExportQueue(RedisTestCase):
+
+    def test_minimum(self):
+        queue = ExportQueue('test', self.redis_client, {'batch': 3})
+        queue_key = queue.queue_key()
+        queue.enqueue([1, 2], queue_key)
+        self.assertEqual(queue.dequeue(queue_key, batch=3, minimum=3), [])
+        self.assertEqual(queue.size(queue_key), 2)
+
+        queue.enqueue([3], queue_key)
+        self.assertEqual(
+            queue.dequeue(queue_key, batch=3, minimum=3), [3, 2, 1])
+        self.assertEqual(queue.size(queue_key), 0)
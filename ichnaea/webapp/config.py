@@ -3,9 +3,13 @@ Contains web app specific one time configuration code.
 """
 
 from pyramid.config import Configurator
+from pyramid.settings import asbool
 from pyramid.tweens import EXCVIEW
 
 from ichnaea.api.config import configure_api
+from ichnaea.api.key import configure_api_key_cache
+from ichnaea.api.rate_limit import configure_rate_limiter
+from ichnaea.api.unique_ip import configure_unique_ip_buffer
 from ichnaea.api.locate.searcher import (
     configure_country_searcher,
     configure_position_searcher,
@@ -25,6 +29,7 @@ from ichnaea.log import (
     configure_raven,
     configure_stats,
 )
+from ichnaea.queue import DataQueue
 from ichnaea.webapp.monitor import configure_monitor
 
 
@@ -90,8 +95,27 @@ def main(app_config, ping_connections=False,
 
     registry.http_session = configure_http_session(_session=_http_session)
 
+    registry.api_key_cache = configure_api_key_cache(
+        app_config.get_map('api', {}), stats_client)
+    registry.rate_limiter = configure_rate_limiter(
+        app_config.get_map('api', {}), redis_client)
+    registry.unique_ip_buffer = configure_unique_ip_buffer(
+        app_config.get_map('api', {}), redis_client)
+
+    # optionally queue submitted reports in Redis instead of celery tasks
+    registry.incoming_queue = None
+    if asbool(app_config.get_map('api', {}).get('incoming_queue', False)):
+        registry.incoming_queue = DataQueue(
+            'update_incoming', redis_client, queue_key='update_incoming')
+
     registry.geoip_db = geoip_db = configure_geoip(
         app_config.get('geoip', 'db_path'), raven_client=raven_client,
+        stats_client=stats_client,
+        cache_size=int(app_config.get('geoip', 'cache_size', 0)),
+        cache_ipv4_prefix=int(app_config.get(
+            'geoip', 'cache_ipv4_prefix', 32)),
+        cache_ipv6_prefix=int(app_config.get(
+            'geoip', 'cache_ipv6_prefix', 128)),
         _client=_geoip_db)
 
     for name, func, default in (('country_searcher',
@@ -61,6 +61,30 @@ statsd_host, statsd_prefix = _statsd_config()
 del _statsd_config
 
 
+def when_ready(server):
+    # Load immutable state once before forking the workers, if the
+    # web app modules are loaded in the master via `--preload`.
+    if server.cfg.preload_app:
+        from ichnaea.config import read_config
+        from ichnaea.preload import API_SCHEMA_MODULES, preload
+        preload(modules=API_SCHEMA_MODULES,
+                geoip_filename=read_config().get('geoip', 'db_path'))
+
+
 def post_worker_init(worker):
+    # Adjust the garbage collection to the state shared with the master.
+    from ichnaea.preload import thaw
+    thaw()
+
     # Actually initialize the application
     worker.wsgi(None, None)
+
+
+def worker_exit(server, worker):
+    # Send any buffered unique IP addresses and aggregated metrics
+    # before the worker exits.
+    from ichnaea.webapp.app import _APP
+    if _APP is not None:
+        _APP.registry.unique_ip_buffer.flush()
+        _APP.registry.stats_client.stop()
+        _APP.registry.stats_client.flush()